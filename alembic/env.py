@@ -21,6 +21,12 @@ from src.models import (
     Demografia,
     Tendencia,
     ValidacionTendencia,
+    ContenidoLineamiento,
+    CollectionSchedule,
+    StreamCheckpoint,
+    EngagementSnapshot,
+    TrendBaseline,
+    Coocurrencia,
 )
 
 # this is the Alembic Config object, which provides
@@ -0,0 +1,68 @@
+"""Create contenido_lineamientos table
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de asociación contenido <-> lineamientos
+    op.create_table(
+        'contenido_lineamientos',
+        sa.Column('contenido_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('lineamiento_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('keywords_coincidentes', sa.ARRAY(sa.TEXT), nullable=True),
+        sa.Column('asociado_at', TIMESTAMPTZ, nullable=False, server_default=sa.text('NOW()')),
+        sa.PrimaryKeyConstraint('contenido_id', 'lineamiento_id'),
+    )
+
+    # Agregar foreign keys
+    op.create_foreign_key(
+        'fk_contenido_lineamientos_contenido',
+        'contenido_lineamientos',
+        'contenido_recolectado',
+        ['contenido_id'],
+        ['id'],
+        ondelete='CASCADE'
+    )
+    op.create_foreign_key(
+        'fk_contenido_lineamientos_lineamiento',
+        'contenido_lineamientos',
+        'lineamientos',
+        ['lineamiento_id'],
+        ['id'],
+        ondelete='CASCADE'
+    )
+
+    # Crear índices (la PK cubre búsquedas por contenido)
+    op.create_index(
+        'idx_contenido_lineamientos_lineamiento',
+        'contenido_lineamientos',
+        ['lineamiento_id', sa.text('asociado_at DESC')]
+    )
+
+    # Poblar con la asociación original de cada contenido
+    op.execute("""
+        INSERT INTO contenido_lineamientos (contenido_id, lineamiento_id)
+        SELECT id, lineamiento_id FROM contenido_recolectado
+        ON CONFLICT DO NOTHING;
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_contenido_lineamientos_lineamiento', table_name='contenido_lineamientos')
+    op.drop_constraint('fk_contenido_lineamientos_lineamiento', 'contenido_lineamientos', type_='foreignkey')
+    op.drop_constraint('fk_contenido_lineamientos_contenido', 'contenido_lineamientos', type_='foreignkey')
+    op.drop_table('contenido_lineamientos')
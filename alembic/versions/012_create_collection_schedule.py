@@ -0,0 +1,55 @@
+"""Create collection_schedule table
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de programación adaptativa
+    op.create_table(
+        'collection_schedule',
+        sa.Column('lineamiento_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('plataforma', sa.String(50), nullable=False),
+        sa.Column('interval_minutes', sa.Integer, nullable=False),
+        sa.Column('next_run_at', TIMESTAMPTZ, nullable=False, server_default=sa.text('NOW()')),
+        sa.Column('last_run_at', TIMESTAMPTZ, nullable=True),
+        sa.Column('last_yield', sa.Integer, nullable=False, server_default='0'),
+        sa.Column('ewma_yield', sa.Float, nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('lineamiento_id', 'plataforma'),
+    )
+
+    # Agregar foreign key
+    op.create_foreign_key(
+        'fk_collection_schedule_lineamiento',
+        'collection_schedule',
+        'lineamientos',
+        ['lineamiento_id'],
+        ['id'],
+        ondelete='CASCADE'
+    )
+
+    # Crear índice para buscar pares pendientes
+    op.create_index(
+        'idx_collection_schedule_next_run',
+        'collection_schedule',
+        ['next_run_at']
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_collection_schedule_next_run', table_name='collection_schedule')
+    op.drop_constraint('fk_collection_schedule_lineamiento', 'collection_schedule', type_='foreignkey')
+    op.drop_table('collection_schedule')
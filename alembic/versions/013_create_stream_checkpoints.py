@@ -0,0 +1,32 @@
+"""Create stream_checkpoints table
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de checkpoints de consumidores de streaming
+    op.create_table(
+        'stream_checkpoints',
+        sa.Column('stream_key', sa.String(255), nullable=False),
+        sa.Column('last_id', sa.String(255), nullable=False),
+        sa.Column('updated_at', TIMESTAMPTZ, nullable=False, server_default=sa.text('NOW()')),
+        sa.PrimaryKeyConstraint('stream_key'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('stream_checkpoints')
@@ -0,0 +1,62 @@
+"""Create engagement_snapshots hypertable
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID, TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de mediciones de engagement
+    op.create_table(
+        'engagement_snapshots',
+        sa.Column('contenido_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('tiempo', TIMESTAMPTZ, nullable=False),
+        sa.Column('views', sa.BigInteger, nullable=True),
+        sa.Column('likes', sa.Integer, nullable=True),
+        sa.Column('comments', sa.Integer, nullable=True),
+        sa.Column('shares', sa.Integer, nullable=True),
+        sa.PrimaryKeyConstraint('contenido_id', 'tiempo'),
+        sa.ForeignKeyConstraint(
+            ['contenido_id'],
+            ['contenido_recolectado.id'],
+            ondelete='CASCADE'
+        ),
+    )
+
+    # Convertir a hipertabla (chunks diarios: la ventana de refresco es corta)
+    op.execute("""
+        SELECT create_hypertable(
+            'engagement_snapshots',
+            'tiempo',
+            chunk_time_interval => INTERVAL '1 day',
+            if_not_exists => TRUE
+        );
+    """)
+
+    # Misma retención que el contenido recolectado
+    op.execute("""
+        SELECT add_retention_policy(
+            'engagement_snapshots',
+            INTERVAL '7 days',
+            if_not_exists => TRUE
+        );
+    """)
+
+
+def downgrade() -> None:
+    op.execute("""
+        SELECT remove_retention_policy('engagement_snapshots', if_exists => TRUE);
+    """)
+    op.drop_table('engagement_snapshots')
@@ -0,0 +1,41 @@
+"""Add engagement-weighted score columns to tendencias
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Features y puntuación por segmento
+    op.add_column('tendencias', sa.Column('sentimiento_promedio', sa.FLOAT, nullable=True))
+    op.add_column('tendencias', sa.Column('engagement_total', sa.BigInteger, nullable=True))
+    op.add_column('tendencias', sa.Column('autores_unicos', sa.INTEGER, nullable=True))
+    op.add_column('tendencias', sa.Column('puntuacion', sa.FLOAT, nullable=True))
+    op.add_column('tendencias', sa.Column('puntuacion_z', sa.FLOAT, nullable=True))
+
+    # Ranking de tendencias por puntuación
+    op.create_index(
+        'idx_tendencias_puntuacion',
+        'tendencias',
+        [sa.text('fecha_hora DESC'), sa.text('puntuacion DESC')]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_tendencias_puntuacion', table_name='tendencias')
+    op.drop_column('tendencias', 'puntuacion_z')
+    op.drop_column('tendencias', 'puntuacion')
+    op.drop_column('tendencias', 'autores_unicos')
+    op.drop_column('tendencias', 'engagement_total')
+    op.drop_column('tendencias', 'sentimiento_promedio')
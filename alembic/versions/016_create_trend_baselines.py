@@ -0,0 +1,44 @@
+"""Create trend_baselines table and burst columns in tendencias
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de líneas base por segmento
+    op.create_table(
+        'trend_baselines',
+        sa.Column('tema_nombre', sa.String(255), nullable=False),
+        sa.Column('plataforma', sa.String(50), nullable=False),
+        sa.Column('ubicacion', sa.String(100), nullable=False),
+        sa.Column('edad_rango', sa.String(20), nullable=False),
+        sa.Column('genero', sa.String(20), nullable=False),
+        sa.Column('ewma_mean', sa.FLOAT, nullable=False, server_default=sa.text('0')),
+        sa.Column('ewma_var', sa.FLOAT, nullable=False, server_default=sa.text('0')),
+        sa.Column('runs', sa.INTEGER, nullable=False, server_default=sa.text('0')),
+        sa.Column('updated_at', TIMESTAMPTZ, nullable=False, server_default=sa.text('NOW()')),
+        sa.PrimaryKeyConstraint('tema_nombre', 'plataforma', 'ubicacion', 'edad_rango', 'genero'),
+    )
+
+    # Resultado de la detección de picos por segmento
+    op.add_column('tendencias', sa.Column('pico_z', sa.FLOAT, nullable=True))
+    op.add_column('tendencias', sa.Column('pico_pvalor', sa.FLOAT, nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('tendencias', 'pico_pvalor')
+    op.drop_column('tendencias', 'pico_z')
+    op.drop_table('trend_baselines')
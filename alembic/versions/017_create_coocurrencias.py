@@ -0,0 +1,82 @@
+"""Create coocurrencias hypertable and co-occurrence indexing flag
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-19
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TIMESTAMPTZ
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Crear tabla de co-ocurrencias (solo pares observados)
+    op.create_table(
+        'coocurrencias',
+        sa.Column('bucket', TIMESTAMPTZ, nullable=False),
+        sa.Column('termino_a', sa.TEXT, nullable=False),
+        sa.Column('termino_b', sa.TEXT, nullable=False),
+        sa.Column('conteo', sa.INTEGER, nullable=False, server_default='0'),
+        sa.PrimaryKeyConstraint('bucket', 'termino_a', 'termino_b'),
+        sa.CheckConstraint('termino_a < termino_b', name='coocurrencia_par_ordenado'),
+    )
+
+    # Convertir a hipertabla (chunks diarios, igual que engagement_snapshots)
+    op.execute("""
+        SELECT create_hypertable(
+            'coocurrencias',
+            'bucket',
+            chunk_time_interval => INTERVAL '1 day',
+            if_not_exists => TRUE
+        );
+    """)
+
+    # Misma retención que el contenido recolectado
+    op.execute("""
+        SELECT add_retention_policy(
+            'coocurrencias',
+            INTERVAL '7 days',
+            if_not_exists => TRUE
+        );
+    """)
+
+    # Vecindario de un término cuando aparece como segundo elemento del par
+    op.create_index(
+        'idx_coocurrencias_termino_b',
+        'coocurrencias',
+        ['termino_b', sa.text('bucket DESC')]
+    )
+
+    # Temas pendientes de indexar
+    op.add_column(
+        'temas_identificados',
+        sa.Column(
+            'coocurrencia_indexada',
+            sa.BOOLEAN,
+            nullable=False,
+            server_default=sa.text('false'),
+        )
+    )
+    op.create_index(
+        'idx_temas_coocurrencia_pendiente',
+        'temas_identificados',
+        ['identificado_at'],
+        postgresql_where=sa.text('NOT coocurrencia_indexada')
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_temas_coocurrencia_pendiente', table_name='temas_identificados')
+    op.drop_column('temas_identificados', 'coocurrencia_indexada')
+    op.execute("""
+        SELECT remove_retention_policy('coocurrencias', if_exists => TRUE);
+    """)
+    op.drop_table('coocurrencias')
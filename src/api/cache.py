@@ -0,0 +1,118 @@
+"""
+Respuestas en caché para endpoints de consulta
+"""
+
+from typing import Annotated, Any, Awaitable, Callable, Iterable, get_args, get_origin
+import functools
+import inspect
+import logging
+
+import redis
+from fastapi import Request, Response, status
+from fastapi.params import Depends
+from pydantic import TypeAdapter
+
+from src.models.routing import get_read_db
+from src.services.response_cache import response_cache
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Compara un header If-None-Match con el ETag de la respuesta.
+
+    If-None-Match usa comparación débil: se ignora el prefijo W/.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def reads_replica(parameter: inspect.Parameter) -> bool:
+    """Indica si un parámetro de endpoint depende de `get_read_db`"""
+    markers = [parameter.default]
+    if get_origin(parameter.annotation) is Annotated:
+        markers.extend(get_args(parameter.annotation)[1:])
+    return any(
+        isinstance(marker, Depends) and marker.dependency is get_read_db for marker in markers
+    )
+
+
+def cached_response(endpoint: str, exclude: Iterable[str] = ("db",)):
+    """
+    Decorador que sirve la respuesta de un endpoint desde `response_cache`.
+
+    La clave se arma con los parámetros de la query (sin las dependencias
+    de `exclude`). En un acierto se devuelven los bytes guardados sin
+    tocar la base de datos ni serializar con Pydantic; en un fallo se
+    ejecuta el endpoint y se serializa su resultado según su anotación de
+    retorno (o se usan tal cual los bytes que devuelva). La sesión de base
+    de datos no abre conexión hasta la primera query, así que un acierto no
+    toma conexiones del pool.
+
+    Las respuestas llevan un ETag débil derivado de la generación del
+    último análisis y de los parámetros: si coincide con If-None-Match se
+    responde 304 sin cuerpo, con una sola lectura a Redis.
+
+    Los fallos se calculan en el primario (`get_async_db`): el análisis
+    incrementa la generación justo después de su commit, y una réplica
+    atrasada guardaría filas anteriores bajo la generación nueva durante
+    todo el TTL. Por eso el decorador rechaza endpoints con `get_read_db`.
+
+    Uso (debajo del decorador de ruta):
+        @router.get("/", response_model=Modelo)
+        @cached_response("modelos")
+        async def listar(db: ..., limit: int = 10) -> Modelo:
+            ...
+    """
+    excluded = set(exclude)
+
+    def decorator(func: Callable[..., Awaitable[Any]]):
+        signature = inspect.signature(func)
+        if any(reads_replica(parameter) for parameter in signature.parameters.values()):
+            raise ValueError(
+                f"El endpoint en caché '{endpoint}' debe leer del primario (get_async_db)"
+            )
+        adapter = TypeAdapter(func.__annotations__["return"])
+
+        @functools.wraps(func)
+        async def wrapper(request: Request, **kwargs: Any) -> Response:
+            params = {name: value for name, value in kwargs.items() if name not in excluded}
+
+            async def compute() -> bytes:
+                result = await func(**kwargs)
+                # Los endpoints con serialización propia ya devuelven bytes
+                return result if isinstance(result, bytes) else adapter.dump_json(result)
+
+            try:
+                generation = await response_cache.generation()
+            except redis.RedisError as e:
+                logger.warning(f"Generación de caché no disponible, respuesta sin ETag: {e}")
+                return Response(content=await compute(), media_type="application/json")
+
+            headers = {
+                "ETag": response_cache.etag(endpoint, params, generation),
+                "Cache-Control": f"private, max-age={settings.cache_max_age_seconds}, "
+                "must-revalidate",
+            }
+            if etag_matches(request.headers.get("if-none-match"), headers["ETag"]):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+            body = await response_cache.get_or_compute(endpoint, params, compute, generation)
+            return Response(content=body, media_type="application/json", headers=headers)
+
+        # FastAPI inyecta la request además de los parámetros del endpoint
+        wrapper.__signature__ = signature.replace(
+            parameters=[
+                inspect.Parameter(
+                    "request", inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Request
+                ),
+                *signature.parameters.values(),
+            ]
+        )
+        return wrapper
+
+    return decorator
@@ -4,14 +4,24 @@ Aplicación FastAPI principal
 
 from fastapi import FastAPI, Depends, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
 
+from prometheus_client import make_asgi_app
+
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
+
+from src.models.base import async_engine
+from src.models.routing import replica_router
 from src.utils.config import settings
 from src.utils.logging import setup_logging
 from src.api.auth import get_api_key
-from src.api.routes import lineamientos, collector, tendencias
+from src.api.routes import lineamientos, collector, tendencias, exports, contenido
 
 # Configurar logging al inicio
 setup_logging(
@@ -36,6 +46,9 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Cerrando aplicación TrendsGPX API")
+    await async_engine.dispose()
+    for replica in replica_router.engines:
+        await replica.dispose()
 
 
 # Crear app FastAPI
@@ -56,14 +69,26 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Compresión de respuestas (brotli con fallback a gzip, o solo gzip)
+if BrotliMiddleware is not None:
+    app.add_middleware(BrotliMiddleware, minimum_size=settings.api_compression_min_bytes)
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=settings.api_compression_min_bytes)
+
 # ==================== Routers ====================
 
 # Incluir routers de endpoints
 app.include_router(lineamientos.router)
 app.include_router(collector.router)
 app.include_router(tendencias.router)
+app.include_router(exports.router)
+app.include_router(contenido.router)
+
+# Métricas Prometheus (pool de conexiones a la base de datos)
+app.mount("/metrics", make_asgi_app())
 
 
 # ==================== Endpoints ====================
@@ -0,0 +1,69 @@
+"""
+Respuestas parciales (HTTP Range) para descargas de archivos
+"""
+
+from typing import AsyncIterator, Tuple
+import re
+
+import aiofiles
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+CHUNK_SIZE = 64 * 1024
+
+
+class RangeNotSatisfiable(ValueError):
+    """El rango pedido no está dentro del archivo"""
+
+
+def parse_range(header: str | None, size: int) -> Tuple[int, int] | None:
+    """
+    Interpreta un header Range de un solo rango de bytes.
+
+    Admite `bytes=inicio-fin`, `bytes=inicio-` y `bytes=-sufijo`. Los
+    rangos múltiples o con otra unidad se ignoran (se responde el archivo
+    completo, como permite la RFC 9110).
+
+    Args:
+        header: Valor del header Range
+        size: Tamaño del archivo en bytes
+
+    Returns:
+        Tupla (inicio, fin) inclusiva, o None para responder el archivo completo
+
+    Raises:
+        RangeNotSatisfiable: Si el rango cae fuera del archivo
+    """
+    if not header:
+        return None
+
+    match = _RANGE.match(header.strip())
+    if not match or match.groups() == ("", ""):
+        return None
+
+    first, last = match.groups()
+    if first == "":
+        # Sufijo: los últimos N bytes
+        length = int(last)
+        if length == 0 or size == 0:
+            raise RangeNotSatisfiable(header)
+        return max(0, size - length), size - 1
+
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        raise RangeNotSatisfiable(header)
+    return start, end
+
+
+async def read_range(path: str, start: int, end: int) -> AsyncIterator[bytes]:
+    """Lee [start, end] de un archivo en bloques sin bloquear el event loop"""
+    async with aiofiles.open(path, "rb") as file:
+        await file.seek(start)
+        remaining = end - start + 1
+        while remaining > 0:
+            chunk = await file.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
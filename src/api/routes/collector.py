@@ -3,12 +3,13 @@ Endpoints REST para disparar recolección de contenido
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Annotated
 import logging
 
-from src.models.base import get_db
+from src.models.base import get_async_db
 from src.api.auth import get_api_key
 from src.models.lineamiento import Lineamiento
 from src.tasks.collector_tasks import (
@@ -37,7 +38,7 @@ router = APIRouter(
 )
 async def collect_lineamiento(
     lineamiento_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     hours_back: int = 24,
 ) -> dict:
     """
@@ -50,7 +51,7 @@ async def collect_lineamiento(
         Task ID de Celery y estado
     """
     # Verificar que el lineamiento existe
-    lineamiento = db.query(Lineamiento).filter(Lineamiento.id == lineamiento_id).first()
+    lineamiento = await db.get(Lineamiento, lineamiento_id)
 
     if not lineamiento:
         raise HTTPException(
@@ -94,7 +95,7 @@ async def collect_lineamiento(
 async def collect_lineamiento_platform(
     lineamiento_id: UUID,
     platform: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     hours_back: int = 24,
 ) -> dict:
     """
@@ -116,7 +117,7 @@ async def collect_lineamiento_platform(
         )
 
     # Verificar lineamiento
-    lineamiento = db.query(Lineamiento).filter(Lineamiento.id == lineamiento_id).first()
+    lineamiento = await db.get(Lineamiento, lineamiento_id)
 
     if not lineamiento:
         raise HTTPException(
@@ -175,7 +176,7 @@ async def collect_lineamiento_platform(
     description="Dispara tareas para recolectar contenido de todos los lineamientos activos",
 )
 async def collect_all(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> dict:
     """
     Dispara recolección de contenido para TODOS los lineamientos activos.
@@ -187,12 +188,14 @@ async def collect_all(
         Task ID de Celery y estadísticas
     """
     # Contar lineamientos activos
-    count = db.query(Lineamiento).filter(Lineamiento.activo == True).count()
+    count = await db.scalar(
+        select(func.count()).select_from(Lineamiento).where(Lineamiento.activo == True)
+    )
 
     logger.info(f"Disparando recolección para {count} lineamientos activos")
 
-    # Disparar tarea
-    task = collect_all_lineamientos.delay()
+    # Disparar tarea (ignorando la programación adaptativa)
+    task = collect_all_lineamientos.delay(force=True)
 
     return {
         "task_id": task.id,
@@ -0,0 +1,89 @@
+"""
+Endpoints REST para buscar en el Contenido recolectado
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Annotated
+from datetime import datetime
+from uuid import UUID
+import logging
+
+from src.api.auth import get_api_key
+from src.models.routing import get_read_db
+from src.services.content_search import content_search
+from src.schemas.contenido import ContenidoBusquedaItem, ContenidoBusquedaResponse
+
+logger = logging.getLogger(__name__)
+
+# Crear router
+router = APIRouter(
+    prefix="/contenido",
+    tags=["Contenido"],
+    dependencies=[Depends(get_api_key)],
+)
+
+
+@router.get(
+    "/search",
+    response_model=ContenidoBusquedaResponse,
+    summary="Buscar contenido",
+    description="Búsqueda de texto completo en el contenido recolectado, ordenada por relevancia",
+)
+async def search_contenido(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    q: Annotated[
+        str, Query(min_length=2, max_length=200, description='Búsqueda ("frase", or, -excluir)')
+    ],
+    limit: Annotated[int, Query(ge=1, le=100, description="Resultados por página")] = 20,
+    cursor: Annotated[str | None, Query(description="Cursor de la página anterior")] = None,
+    lineamiento_id: Annotated[UUID | None, Query(description="Filtrar por lineamiento")] = None,
+    plataforma: Annotated[str | None, Query(description="Filtrar por plataforma")] = None,
+    fecha_desde: Annotated[
+        datetime | None, Query(description="Publicado desde (inclusive)")
+    ] = None,
+    fecha_hasta: Annotated[
+        datetime | None, Query(description="Publicado hasta (exclusive)")
+    ] = None,
+) -> ContenidoBusquedaResponse:
+    """
+    Busca contenido recolectado por texto.
+
+    - **q**: Búsqueda en sintaxis web de PostgreSQL (`websearch_to_tsquery`)
+    - **limit**: Resultados por página (max 100)
+    - **cursor**: `next_cursor` de la respuesta anterior
+    - **lineamiento_id**: Contenido recolectado por el lineamiento o asociado a él
+    - **plataforma**: reddit, youtube, google_trends, etc.
+    - **fecha_desde** / **fecha_hasta**: Rango de fecha de publicación
+
+    Los resultados se ordenan por relevancia (`ts_rank`) e incluyen un
+    fragmento con los términos encontrados marcados con `<mark>`. Para la
+    página siguiente se pasa `next_cursor` con los mismos filtros.
+
+    Returns:
+        Página de resultados y cursor de la siguiente
+    """
+    if fecha_desde and fecha_hasta and fecha_desde >= fecha_hasta:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="fecha_desde debe ser anterior a fecha_hasta",
+        )
+
+    try:
+        items, next_cursor = await content_search.search(
+            db,
+            q,
+            limit=limit,
+            cursor=cursor,
+            lineamiento_id=lineamiento_id,
+            plataforma=plataforma,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    return ContenidoBusquedaResponse(
+        items=[ContenidoBusquedaItem(**item) for item in items],
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,177 @@
+"""
+Endpoints REST para exportaciones en segundo plano
+"""
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import FileResponse, StreamingResponse
+from typing import Annotated
+from uuid import UUID
+import logging
+
+from src.api.auth import get_api_key
+from src.api.ranges import RangeNotSatisfiable, parse_range, read_range
+from src.services.export_writers import WRITERS
+from src.services.tendencia_export import export_spool
+from src.tasks.export_tasks import export_tendencias
+
+logger = logging.getLogger(__name__)
+
+# Crear router
+router = APIRouter(
+    prefix="/export",
+    tags=["Exportación"],
+    dependencies=[Depends(get_api_key)],
+)
+
+
+@router.post(
+    "/tendencias",
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Iniciar exportación de tendencias",
+    description="Dispara una tarea que exporta las tendencias filtradas a un archivo descargable",
+)
+async def start_export(
+    formato: Annotated[
+        str, Query(description="csv, ndjson, xlsx o parquet", pattern="^(csv|ndjson|xlsx|parquet)$")
+    ] = "csv",
+    plataforma: Annotated[str | None, Query(description="Filtrar por plataforma")] = None,
+    ubicacion: Annotated[str | None, Query(description="Filtrar por ubicación")] = None,
+    solo_activas: Annotated[bool, Query(description="Solo tendencias activas")] = True,
+    hours_back: Annotated[int, Query(ge=1, le=168, description="Horas hacia atrás (max 7 días)")] = 24,
+) -> dict:
+    """
+    Inicia una exportación en la cola `exports`.
+
+    Para exportaciones demasiado grandes para una sola request
+    (`GET /tendencias/export`). El estado se consulta en
+    `/export/{task_id}` y el archivo se descarga de `/export/{task_id}/file`.
+
+    Returns:
+        Task ID de Celery y estado
+    """
+    task = export_tendencias.delay(
+        formato=formato,
+        hours_back=hours_back,
+        plataforma=plataforma,
+        ubicacion=ubicacion,
+        solo_activas=solo_activas,
+    )
+
+    logger.info(f"Exportación {formato} iniciada: {task.id}")
+
+    return {
+        "task_id": task.id,
+        "formato": formato,
+        "status": "accepted",
+        "message": "Exportación iniciada en segundo plano",
+    }
+
+
+@router.get(
+    "/{task_id}",
+    summary="Consultar estado de exportación",
+    description="Obtiene el estado y progreso de una exportación",
+)
+async def get_export_status(task_id: UUID) -> dict:
+    """
+    Consulta el estado de una exportación.
+
+    - **task_id**: ID de la tarea de exportación
+
+    Returns:
+        Estado de la tarea, filas escritas mientras corre y el archivo al terminar
+    """
+    from celery.result import AsyncResult
+
+    task = AsyncResult(str(task_id))
+
+    response = {
+        "task_id": str(task_id),
+        "status": task.status,
+        "ready": task.ready(),
+    }
+
+    if task.status == "PROGRESS" and isinstance(task.info, dict):
+        response["progress"] = task.info
+
+    if task.ready():
+        if task.successful():
+            response["result"] = task.result
+            if export_spool.find(str(task_id)):
+                response["download_url"] = f"{router.prefix}/{task_id}/file"
+        else:
+            response["error"] = str(task.info)
+
+    return response
+
+
+@router.get(
+    "/{task_id}/file",
+    summary="Descargar archivo exportado",
+    description="Descarga el archivo de una exportación terminada (admite Range para reanudar)",
+    responses={206: {"description": "Contenido parcial"}, 416: {"description": "Rango inválido"}},
+)
+async def download_export(task_id: UUID, request: Request):
+    """
+    Descarga el archivo de una exportación.
+
+    Admite un header `Range: bytes=...` para reanudar descargas
+    interrumpidas; `If-Range` con el ETag del archivo evita mezclar partes
+    de archivos distintos.
+
+    - **task_id**: ID de la tarea de exportación
+
+    Returns:
+        Archivo completo (200) o el rango pedido (206)
+    """
+    path = export_spool.find(str(task_id))
+
+    if not path:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Exportación {task_id} no encontrada o en curso",
+        )
+
+    stat = path.stat()
+    media_type = next(
+        (w.media_type for w in WRITERS.values() if path.suffix == f".{w.extension}"),
+        "application/octet-stream",
+    )
+    etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+    headers = {
+        "Accept-Ranges": "bytes",
+        "ETag": etag,
+        "Content-Disposition": f'attachment; filename="tendencias_{path.name}"',
+        # Sin compresión: Content-Range y el ETag se refieren a los bytes del
+        # archivo (el middleware de compresión omite respuestas con encoding)
+        "Content-Encoding": "identity",
+    }
+
+    range_header = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    if if_range and if_range != etag:
+        # El archivo cambió desde la descarga parcial: enviar completo
+        range_header = None
+
+    try:
+        byte_range = parse_range(range_header, stat.st_size)
+    except RangeNotSatisfiable:
+        raise HTTPException(
+            status_code=status.HTTP_416_REQUESTED_RANGE_NOT_SATISFIABLE,
+            detail="Rango fuera del archivo",
+            headers={"Content-Range": f"bytes */{stat.st_size}"},
+        )
+
+    if byte_range is None:
+        return FileResponse(path, media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{stat.st_size}"
+    headers["Content-Length"] = str(end - start + 1)
+
+    return StreamingResponse(
+        read_range(str(path), start, end),
+        status_code=status.HTTP_206_PARTIAL_CONTENT,
+        media_type=media_type,
+        headers=headers,
+    )
@@ -3,12 +3,12 @@ Endpoints REST para Lineamientos
 """
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from uuid import UUID
 from typing import Annotated
 import logging
 
-from src.models.base import get_db
+from src.models.base import get_async_db
 from src.api.auth import get_api_key
 from src.schemas.lineamiento import (
     LineamientoCreate,
@@ -37,7 +37,7 @@ router = APIRouter(
 )
 async def create_lineamiento(
     lineamiento_data: LineamientoCreate,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> LineamientoResponse:
     """
     Crea un nuevo lineamiento.
@@ -50,7 +50,7 @@ async def create_lineamiento(
         Lineamiento creado con su ID y metadatos
     """
     try:
-        lineamiento = LineamientoService.create(db, lineamiento_data)
+        lineamiento = await LineamientoService.create(db, lineamiento_data)
         logger.info(f"Lineamiento creado exitosamente: {lineamiento.id}")
         return LineamientoResponse.model_validate(lineamiento)
 
@@ -69,7 +69,7 @@ async def create_lineamiento(
     description="Obtiene lista paginada de lineamientos",
 )
 async def list_lineamientos(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     skip: Annotated[int, Query(ge=0, description="Número de registros a saltar")] = 0,
     limit: Annotated[int, Query(ge=1, le=100, description="Número máximo de registros")] = 100,
     activo_only: Annotated[bool, Query(description="Solo lineamientos activos")] = False,
@@ -84,8 +84,10 @@ async def list_lineamientos(
     Returns:
         Lista de lineamientos con total
     """
-    lineamientos = LineamientoService.get_all(db, skip=skip, limit=limit, activo_only=activo_only)
-    total = LineamientoService.count(db, activo_only=activo_only)
+    lineamientos = await LineamientoService.get_all(
+        db, skip=skip, limit=limit, activo_only=activo_only
+    )
+    total = await LineamientoService.count(db, activo_only=activo_only)
 
     logger.info(f"Listados {len(lineamientos)} lineamientos (total: {total})")
 
@@ -103,7 +105,7 @@ async def list_lineamientos(
 )
 async def get_lineamiento(
     lineamiento_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> LineamientoResponse:
     """
     Obtiene un lineamiento por ID.
@@ -113,7 +115,7 @@ async def get_lineamiento(
     Returns:
         Lineamiento con todos sus datos
     """
-    lineamiento = LineamientoService.get_by_id(db, lineamiento_id)
+    lineamiento = await LineamientoService.get_by_id(db, lineamiento_id)
 
     if not lineamiento:
         logger.warning(f"Lineamiento no encontrado: {lineamiento_id}")
@@ -135,7 +137,7 @@ async def get_lineamiento(
 async def update_lineamiento(
     lineamiento_id: UUID,
     lineamiento_data: LineamientoUpdate,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> LineamientoResponse:
     """
     Actualiza un lineamiento existente.
@@ -151,7 +153,7 @@ async def update_lineamiento(
         Lineamiento actualizado
     """
     try:
-        lineamiento = LineamientoService.update(db, lineamiento_id, lineamiento_data)
+        lineamiento = await LineamientoService.update(db, lineamiento_id, lineamiento_data)
 
         if not lineamiento:
             logger.warning(f"Lineamiento no encontrado para actualizar: {lineamiento_id}")
@@ -179,7 +181,7 @@ async def update_lineamiento(
 )
 async def delete_lineamiento(
     lineamiento_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> None:
     """
     Elimina un lineamiento (soft delete).
@@ -192,7 +194,7 @@ async def delete_lineamiento(
     Returns:
         204 No Content si se eliminó correctamente
     """
-    deleted = LineamientoService.delete(db, lineamiento_id)
+    deleted = await LineamientoService.delete(db, lineamiento_id)
 
     if not deleted:
         logger.warning(f"Lineamiento no encontrado para eliminar: {lineamiento_id}")
@@ -213,7 +215,7 @@ async def delete_lineamiento(
 )
 async def activate_lineamiento(
     lineamiento_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> LineamientoResponse:
     """
     Reactiva un lineamiento inactivo.
@@ -223,7 +225,7 @@ async def activate_lineamiento(
     Returns:
         Lineamiento reactivado
     """
-    lineamiento = LineamientoService.activate(db, lineamiento_id)
+    lineamiento = await LineamientoService.activate(db, lineamiento_id)
 
     if not lineamiento:
         logger.warning(f"Lineamiento no encontrado para reactivar: {lineamiento_id}")
@@ -244,7 +246,7 @@ async def activate_lineamiento(
 )
 async def hard_delete_lineamiento(
     lineamiento_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ) -> None:
     """
     Elimina PERMANENTEMENTE un lineamiento de la base de datos.
@@ -257,7 +259,7 @@ async def hard_delete_lineamiento(
     Returns:
         204 No Content si se eliminó correctamente
     """
-    deleted = LineamientoService.hard_delete(db, lineamiento_id)
+    deleted = await LineamientoService.hard_delete(db, lineamiento_id)
 
     if not deleted:
         logger.warning(f"Lineamiento no encontrado para hard delete: {lineamiento_id}")
@@ -2,24 +2,40 @@
 Endpoints REST para consultar Tendencias
 """
 
-from fastapi import APIRouter, Depends, Query, status
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, desc
-from typing import Annotated, List
-from datetime import datetime, timedelta
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import Row, and_, desc, func, select
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from typing import Annotated, AsyncIterator, Dict, Iterable, List
+from datetime import datetime, timedelta, timezone
 import logging
+import uuid
 
-from src.models.base import get_db
+import redis
+
+from src.models.base import get_async_db
+from src.models.routing import get_read_db, read_session
 from src.api.auth import get_api_key
+from src.api.cache import cached_response
+from src.api.serialization import dump_json, tendencia_item
 from src.models.tendencia import Tendencia
 from src.models.tema import TemaIdentificado
 from src.models.validacion import ValidacionTendencia
+from src.services.author_sketches import author_sketches
+from src.services.cooccurrence_index import cooccurrence_index
+from src.services.export_writers import WRITERS, export_writer
+from src.services.tendencia_export import export_query, filter_tendencias
+from src.services.streaming_trends import streaming_trends
+from src.utils.config import settings
 from src.schemas.tendencia import (
-    TendenciaResponse,
     TendenciaListResponse,
     TendenciaAgregada,
-    TendenciaJerarquica,
     TendenciaJerarquicaResponse,
+    TerminoTendencia,
+    TrendingNowResponse,
+    TerminoEmergente,
+    TerminosEmergentesResponse,
 )
 
 logger = logging.getLogger(__name__)
@@ -32,21 +48,35 @@ router = APIRouter(
 )
 
 
+async def _load_temas(db: AsyncSession, tema_ids: Iterable[uuid.UUID]) -> Dict[uuid.UUID, Row]:
+    """Nombre y keywords de los temas de un conjunto de tendencias en una sola query"""
+    ids = set(tema_ids)
+    if not ids:
+        return {}
+    temas = await db.execute(
+        select(
+            TemaIdentificado.id, TemaIdentificado.tema_nombre, TemaIdentificado.keywords
+        ).where(TemaIdentificado.id.in_(ids))
+    )
+    return {tema.id: tema for tema in temas}
+
+
 @router.get(
     "/",
     response_model=TendenciaListResponse,
     summary="Listar tendencias",
     description="Obtiene lista de tendencias activas con filtros",
 )
+@cached_response("tendencias")
 async def list_tendencias(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     plataforma: Annotated[str | None, Query(description="Filtrar por plataforma")] = None,
     ubicacion: Annotated[str | None, Query(description="Filtrar por ubicación")] = None,
     solo_activas: Annotated[bool, Query(description="Solo tendencias activas")] = True,
     hours_back: Annotated[int, Query(ge=1, le=168, description="Horas hacia atrás (max 7 días)")] = 24,
     skip: Annotated[int, Query(ge=0)] = 0,
     limit: Annotated[int, Query(ge=1, le=100)] = 50,
-) -> TendenciaListResponse:
+) -> bytes:
     """
     Lista tendencias con filtros opcionales.
 
@@ -62,62 +92,231 @@ async def list_tendencias(
     """
     cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
 
-    # Construir query
-    query = db.query(Tendencia).filter(Tendencia.fecha_hora >= cutoff_time)
+    # Construir query (solo las columnas de la respuesta, sin instanciar entidades)
+    query = select(
+        Tendencia.id,
+        Tendencia.tema_id,
+        Tendencia.plataforma,
+        Tendencia.ubicacion,
+        Tendencia.edad_rango,
+        Tendencia.genero,
+        Tendencia.volumen_menciones,
+        Tendencia.tasa_crecimiento,
+        Tendencia.sentimiento_promedio,
+        Tendencia.es_tendencia,
+        Tendencia.fecha_hora,
+        Tendencia.engagement_total,
+        Tendencia.autores_unicos,
+        Tendencia.puntuacion,
+        Tendencia.puntuacion_z,
+    )
+    query = filter_tendencias(query, cutoff_time, plataforma, ubicacion, solo_activas)
 
-    if solo_activas:
-        query = query.filter(Tendencia.es_tendencia == True)
+    # Obtener total
+    total = await db.scalar(select(func.count()).select_from(query.subquery()))
 
-    if plataforma:
-        query = query.filter(Tendencia.plataforma == plataforma.lower())
+    # Ordenar por fecha descendente y, dentro de cada análisis, por puntuación
+    query = query.order_by(
+        desc(Tendencia.fecha_hora), desc(Tendencia.puntuacion).nulls_last()
+    )
 
-    if ubicacion:
-        query = query.filter(Tendencia.ubicacion.ilike(f"%{ubicacion}%"))
+    # Aplicar paginación
+    tendencias = (await db.execute(query.offset(skip).limit(limit))).all()
+
+    # Enriquecer con datos de tema y validación (una query por tabla para toda la página)
+    temas = await _load_temas(db, (tendencia.tema_id for tendencia in tendencias))
+    validaciones = {}
+    if tendencias:
+        rows = await db.execute(
+            select(ValidacionTendencia.tendencia_id, ValidacionTendencia.validada).where(
+                ValidacionTendencia.tendencia_id.in_([tendencia.id for tendencia in tendencias])
+            )
+        )
+        for tendencia_id, validada in rows:
+            validaciones.setdefault(tendencia_id, validada)
 
-    # Ordenar por fecha descendente
-    query = query.order_by(desc(Tendencia.fecha_hora))
+    # Filas a dicts serializados directamente con orjson (TendenciaResponse
+    # documenta el formato pero no se instancia por fila)
+    items = [
+        tendencia_item(tendencia, temas.get(tendencia.tema_id), validaciones.get(tendencia.id))
+        for tendencia in tendencias
+    ]
 
-    # Obtener total
-    total = query.count()
+    logger.info(f"Tendencias listadas: {len(items)} de {total}")
 
-    # Aplicar paginación
-    tendencias = query.offset(skip).limit(limit).all()
+    return dump_json({"total": total, "items": items})
 
-    # Enriquecer con datos de tema y validación
-    items = []
-    for tendencia in tendencias:
-        # Obtener tema
-        tema = db.query(TemaIdentificado).filter(
-            TemaIdentificado.id == tendencia.tema_id
-        ).first()
-
-        # Obtener validación
-        validacion = db.query(ValidacionTendencia).filter(
-            ValidacionTendencia.tendencia_id == tendencia.id
-        ).first()
-
-        item_data = {
-            "id": tendencia.id,
-            "tema_id": tendencia.tema_id,
-            "tema_nombre": tema.tema_nombre if tema else "Desconocido",
-            "plataforma": tendencia.plataforma,
-            "ubicacion": tendencia.ubicacion,
-            "edad_rango": tendencia.edad_rango,
-            "genero": tendencia.genero,
-            "volumen_menciones": tendencia.volumen_menciones,
-            "tasa_crecimiento": tendencia.tasa_crecimiento,
-            "sentimiento_promedio": tendencia.sentimiento_promedio,
-            "es_tendencia": tendencia.es_tendencia,
-            "fecha_hora": tendencia.fecha_hora,
-            "keywords": tema.keywords if tema else [],
-            "validada": validacion.validada if validacion else None,
-        }
 
-        items.append(TendenciaResponse(**item_data))
+@router.get(
+    "/export",
+    summary="Exportar tendencias",
+    description="Descarga las tendencias filtradas en CSV, JSON Lines, Excel o Parquet",
+    responses={200: {"content": {writer.media_type: {} for writer in WRITERS.values()}}},
+)
+async def export_tendencias(
+    formato: Annotated[
+        str, Query(description="csv, ndjson, xlsx o parquet", pattern="^(csv|ndjson|xlsx|parquet)$")
+    ] = "csv",
+    plataforma: Annotated[str | None, Query(description="Filtrar por plataforma")] = None,
+    ubicacion: Annotated[str | None, Query(description="Filtrar por ubicación")] = None,
+    solo_activas: Annotated[bool, Query(description="Solo tendencias activas")] = True,
+    hours_back: Annotated[int, Query(ge=1, le=168, description="Horas hacia atrás (max 7 días)")] = 24,
+) -> StreamingResponse:
+    """
+    Exporta tendencias con los mismos filtros que el listado.
+
+    Las filas se leen con un cursor del lado del servidor en lotes de
+    `export_chunk_rows` y se envían a medida que se convierten, así que la
+    memoria no depende del número de filas. Excel se arma al final (el
+    .xlsx es un zip) con openpyxl en modo write-only y admite hasta
+    1.048.575 filas: si la exportación tiene más se rechaza con 400 en
+    lugar de recortarla sin avisar (usar otro formato o
+    `POST /export/tendencias`, que indica el recorte). Parquet requiere
+    pyarrow.
 
-    logger.info(f"Tendencias listadas: {len(items)} de {total}")
+    - **formato**: csv, ndjson, xlsx o parquet
+    - **plataforma**, **ubicacion**, **solo_activas**, **hours_back**: como en el listado
+
+    Returns:
+        Archivo descargable en el formato pedido
+    """
+    try:
+        writer = export_writer(formato)
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    query = export_query(hours_back, plataforma, ubicacion, solo_activas)
+
+    if writer.max_rows is not None:
+        async with read_session() as db:
+            total = await db.scalar(
+                select(func.count()).select_from(query.order_by(None).subquery())
+            )
+        if total > writer.max_rows:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{formato} admite hasta {writer.max_rows} filas y la exportación "
+                f"tiene {total}: usar csv, ndjson o parquet, o acotar los filtros",
+            )
+
+    async def chunks() -> AsyncIterator[bytes]:
+        # Sesión propia: el cursor vive mientras se envía la respuesta
+        async with read_session() as db:
+            yield writer.open()
+            result = await db.stream(
+                writer.limit_rows(query).execution_options(
+                    yield_per=settings.export_chunk_rows
+                )
+            )
+            exported = 0
+            async for partition in result.partitions():
+                exported += len(partition)
+                # Convertir un lote (openpyxl, pyarrow) es CPU: fuera del event loop
+                chunk = await run_in_threadpool(writer.write, partition)
+                if chunk:
+                    yield chunk
+            async for chunk in iterate_in_threadpool(writer.close()):
+                yield chunk
+
+        if writer.truncated:
+            # Solo si entraron filas entre el conteo y la lectura
+            logger.warning(f"Exportación {formato} recortada a {writer.max_rows} filas")
+        logger.info(f"Tendencias exportadas ({formato}): {exported}")
+
+    filename = f"tendencias_{datetime.utcnow():%Y%m%d_%H%M%S}.{writer.extension}"
+    return StreamingResponse(
+        chunks(),
+        media_type=writer.media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get(
+    "/trending-now",
+    response_model=TrendingNowResponse,
+    summary="Términos en tendencia en tiempo real",
+    description="Keywords con mayor aumento de menciones en la ventana deslizante actual",
+)
+def trending_now(
+    plataforma: Annotated[str | None, Query(description="Filtrar por plataforma")] = None,
+    ubicacion: Annotated[str | None, Query(description="Ubicación (requiere plataforma)")] = None,
+    top_n: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> TrendingNowResponse:
+    """
+    Lista los términos que más crecen en la ventana actual.
+
+    Los conteos son aproximados (Count-Min Sketch en Redis) y se
+    actualizan al procesar cada contenido, sin esperar al análisis
+    periódico de tendencias.
+
+    - **plataforma**: youtube, reddit, mastodon (opcional)
+    - **ubicacion**: Ubicación exacta (opcional, junto con plataforma)
+    - **top_n**: Número de términos a retornar
+
+    Returns:
+        Términos ordenados por aumento de menciones
+    """
+    plataforma = plataforma.lower() if plataforma else None
+
+    try:
+        items = streaming_trends.trending_now(
+            plataforma=plataforma, ubicacion=ubicacion, top_n=top_n
+        )
+    except redis.RedisError as e:
+        logger.error(f"Error consultando tendencias en tiempo real: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Tendencias en tiempo real no disponibles",
+        )
+
+    return TrendingNowResponse(
+        ventana_minutos=settings.streaming_trends_bucket_seconds
+        * settings.streaming_trends_window_buckets
+        // 60,
+        plataforma=plataforma,
+        ubicacion=ubicacion if plataforma else None,
+        items=[TerminoTendencia(**item) for item in items],
+    )
+
+
+@router.get(
+    "/emergentes",
+    response_model=TerminosEmergentesResponse,
+    summary="Términos emergentes por co-ocurrencia",
+    description="Términos cuyo vecindario de co-ocurrencia crece más rápido",
+)
+async def terminos_emergentes(
+    db: Annotated[AsyncSession, Depends(get_read_db)],
+    ventana_horas: Annotated[int, Query(ge=1, le=72, description="Duración de cada ventana")] = 6,
+    min_vecinos: Annotated[int, Query(ge=1, le=100)] = 3,
+    top_n: Annotated[int, Query(ge=1, le=100)] = 20,
+) -> TerminosEmergentesResponse:
+    """
+    Lista los términos que empiezan a co-ocurrir con términos nuevos.
+
+    Compara el vecindario de cada keyword o entidad en la ventana actual
+    con el de la ventana anterior. Es una señal temprana de temas nuevos
+    que no espera al topic modeling.
+
+    - **ventana_horas**: Duración de cada ventana comparada
+    - **min_vecinos**: Vecinos mínimos en la ventana actual
+    - **top_n**: Número de términos a retornar
+
+    Returns:
+        Términos ordenados por número de vecinos nuevos
+    """
+    items = await db.run_sync(
+        lambda session: cooccurrence_index.emerging(
+            session, window_hours=ventana_horas, top_n=top_n, min_neighbors=min_vecinos
+        )
+    )
+
+    logger.info(f"Términos emergentes: {len(items)}")
 
-    return TendenciaListResponse(total=total, items=items)
+    return TerminosEmergentesResponse(
+        ventana_horas=ventana_horas,
+        items=[TerminoEmergente(**item) for item in items],
+    )
 
 
 @router.get(
@@ -126,8 +325,9 @@ async def list_tendencias(
     summary="Tendencias agregadas por tema",
     description="Obtiene tendencias agregando por tema across plataformas",
 )
+@cached_response("tendencias:agregadas")
 async def tendencias_agregadas(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     hours_back: Annotated[int, Query(ge=1, le=168)] = 24,
     top_n: Annotated[int, Query(ge=1, le=50)] = 10,
 ) -> List[TendenciaAgregada]:
@@ -143,25 +343,23 @@ async def tendencias_agregadas(
     cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
 
     # Obtener todas las tendencias activas
-    tendencias = (
-        db.query(Tendencia)
-        .filter(
-            and_(
-                Tendencia.fecha_hora >= cutoff_time,
-                Tendencia.es_tendencia == True,
+    tendencias = list(
+        await db.scalars(
+            select(Tendencia).where(
+                and_(
+                    Tendencia.fecha_hora >= cutoff_time,
+                    Tendencia.es_tendencia == True,
+                )
             )
         )
-        .all()
     )
+    temas = await _load_temas(db, (tendencia.tema_id for tendencia in tendencias))
 
     # Agrupar por tema
     temas_dict = {}
 
     for tendencia in tendencias:
-        # Obtener tema
-        tema = db.query(TemaIdentificado).filter(
-            TemaIdentificado.id == tendencia.tema_id
-        ).first()
+        tema = temas.get(tendencia.tema_id)
 
         if not tema:
             continue
@@ -177,6 +375,7 @@ async def tendencias_agregadas(
                 "sentimientos": [],
                 "keywords": tema.keywords or [],
                 "ubicaciones": set(),
+                "segmentos": set(),
             }
 
         temas_dict[tema_nombre]["plataformas"].add(tendencia.plataforma)
@@ -188,6 +387,15 @@ async def tendencias_agregadas(
             tendencia.sentimiento_promedio
         )
         temas_dict[tema_nombre]["ubicaciones"].add(tendencia.ubicacion)
+        temas_dict[tema_nombre]["segmentos"].add(
+            (
+                tema_nombre,
+                tendencia.plataforma,
+                tendencia.ubicacion,
+                tendencia.edad_rango,
+                tendencia.genero,
+            )
+        )
 
     # Convertir a lista y calcular promedios
     result = []
@@ -219,10 +427,23 @@ async def tendencias_agregadas(
 
     # Ordenar por volumen y tomar top N
     result.sort(key=lambda x: x.volumen_total, reverse=True)
+    result = result[:top_n]
+
+    # Autores únicos: unión de los HyperLogLog de todos los segmentos del tema
+    try:
+        for item in result:
+            item.autores_unicos = await run_in_threadpool(
+                author_sketches.count_union,
+                temas_dict[item.tema_nombre]["segmentos"],
+                cutoff_time.replace(tzinfo=timezone.utc),
+                datetime.now(timezone.utc),
+            )
+    except redis.RedisError as e:
+        logger.warning(f"Sketches de autores no disponibles: {e}")
 
-    logger.info(f"Tendencias agregadas: {len(result[:top_n])}")
+    logger.info(f"Tendencias agregadas: {len(result)}")
 
-    return result[:top_n]
+    return result
 
 
 @router.get(
@@ -231,10 +452,11 @@ async def tendencias_agregadas(
     summary="Tendencias en estructura jerárquica",
     description="Retorna tendencias en estructura jerárquica (Plataforma → Ubicación → Edad → Género)",
 )
+@cached_response("tendencias:jerarquicas")
 async def tendencias_jerarquicas(
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[AsyncSession, Depends(get_async_db)],
     hours_back: Annotated[int, Query(ge=1, le=168)] = 24,
-) -> TendenciaJerarquicaResponse:
+) -> bytes:
     """
     Retorna tendencias organizadas jerárquicamente.
 
@@ -248,44 +470,38 @@ async def tendencias_jerarquicas(
     cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
 
     tendencias = (
-        db.query(Tendencia)
-        .filter(
-            and_(
-                Tendencia.fecha_hora >= cutoff_time,
-                Tendencia.es_tendencia == True,
+        await db.execute(
+            select(
+                Tendencia.tema_id,
+                Tendencia.plataforma,
+                Tendencia.ubicacion,
+                Tendencia.edad_rango,
+                Tendencia.genero,
+                Tendencia.volumen_menciones,
+                Tendencia.tasa_crecimiento,
+                Tendencia.sentimiento_promedio,
+            ).where(
+                and_(
+                    Tendencia.fecha_hora >= cutoff_time,
+                    Tendencia.es_tendencia == True,
+                )
             )
         )
-        .all()
-    )
+    ).all()
+    temas = await _load_temas(db, (tendencia.tema_id for tendencia in tendencias))
 
     # Organizar jerárquicamente
     jerarquia = {}
 
     for tendencia in tendencias:
-        plataforma = tendencia.plataforma
-        ubicacion = tendencia.ubicacion
-        edad = tendencia.edad_rango
-        genero = tendencia.genero
-
-        # Inicializar niveles
-        if plataforma not in jerarquia:
-            jerarquia[plataforma] = {}
-
-        if ubicacion not in jerarquia[plataforma]:
-            jerarquia[plataforma][ubicacion] = {}
-
-        if edad not in jerarquia[plataforma][ubicacion]:
-            jerarquia[plataforma][ubicacion][edad] = {}
-
-        if genero not in jerarquia[plataforma][ubicacion][edad]:
-            jerarquia[plataforma][ubicacion][edad][genero] = []
-
-        # Obtener tema
-        tema = db.query(TemaIdentificado).filter(
-            TemaIdentificado.id == tendencia.tema_id
-        ).first()
+        generos = (
+            jerarquia.setdefault(tendencia.plataforma, {})
+            .setdefault(tendencia.ubicacion, {})
+            .setdefault(tendencia.edad_rango, {})
+        )
+        tema = temas.get(tendencia.tema_id)
 
-        jerarquia[plataforma][ubicacion][edad][genero].append(
+        generos.setdefault(tendencia.genero, []).append(
             {
                 "tema_nombre": tema.tema_nombre if tema else "Desconocido",
                 "volumen": tendencia.volumen_menciones,
@@ -295,52 +511,32 @@ async def tendencias_jerarquicas(
             }
         )
 
-    # Convertir a formato de respuesta
-    plataformas = []
-
-    for plat_nombre, ubicaciones_data in jerarquia.items():
-        ubicaciones = []
-
-        for ubic_nombre, edades_data in ubicaciones_data.items():
-            edades = []
-
-            for edad_nombre, generos_data in edades_data.items():
-                generos = []
-
-                for gen_nombre, temas_list in generos_data.items():
-                    generos.append(
-                        {
-                            "genero": gen_nombre,
-                            "temas": temas_list,
-                        }
-                    )
-
-                edades.append(
-                    {
-                        "edad_rango": edad_nombre,
-                        "generos": generos,
-                    }
-                )
-
-            ubicaciones.append(
+    # Convertir a formato de respuesta (dicts con la forma de TendenciaJerarquicaResponse)
+    plataformas = [
+        {
+            "plataforma": plat_nombre,
+            "ubicaciones": [
                 {
                     "ubicacion": ubic_nombre,
-                    "edades": edades,
+                    "edades": [
+                        {
+                            "edad_rango": edad_nombre,
+                            "generos": [
+                                {"genero": gen_nombre, "temas": temas_list}
+                                for gen_nombre, temas_list in generos_data.items()
+                            ],
+                        }
+                        for edad_nombre, generos_data in edades_data.items()
+                    ],
                 }
-            )
-
-        plataformas.append(
-            TendenciaJerarquica(
-                plataforma=plat_nombre,
-                ubicaciones=ubicaciones,
-            )
-        )
+                for ubic_nombre, edades_data in ubicaciones_data.items()
+            ],
+        }
+        for plat_nombre, ubicaciones_data in jerarquia.items()
+    ]
 
     total = len(tendencias)
 
     logger.info(f"Tendencias jerárquicas: {total} tendencias, {len(plataformas)} plataformas")
 
-    return TendenciaJerarquicaResponse(
-        total_tendencias=total,
-        plataformas=plataformas,
-    )
+    return dump_json({"total_tendencias": total, "plataformas": plataformas})
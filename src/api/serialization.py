@@ -0,0 +1,66 @@
+"""
+Serialización JSON rápida de respuestas grandes
+"""
+
+from decimal import Decimal
+from typing import Any, Dict
+
+import orjson
+
+
+def _default(value: Any) -> Any:
+    """Tipos que orjson no serializa de forma nativa"""
+    if isinstance(value, Decimal):
+        return float(value)
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def dump_json(payload: Any) -> bytes:
+    """
+    Serializa dicts y listas armados desde filas de la base de datos.
+
+    Los endpoints con muchas filas arman la respuesta con tipos nativos
+    (UUID, datetime) y la serializan en un solo paso, sin instanciar un
+    modelo Pydantic por fila; el `response_model` de la ruta sigue
+    documentando el formato. Los datetime con zona se escriben con sufijo
+    Z, igual que Pydantic.
+
+    Returns:
+        JSON en bytes
+    """
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_UTC_Z)
+
+
+def tendencia_item(tendencia: Any, tema: Any | None, validada: bool | None) -> Dict[str, Any]:
+    """
+    Item del listado de tendencias, con las claves en el orden de los campos
+    de `TendenciaResponse` (el JSON es idéntico al de `model_dump_json`).
+
+    Args:
+        tendencia: Fila con las columnas de Tendencia del listado
+        tema: Fila (id, tema_nombre, keywords) del tema, o None
+        validada: Resultado de la validación con Google Trends, o None
+
+    Returns:
+        Dict listo para `dump_json`
+    """
+    return {
+        "tema_nombre": tema.tema_nombre if tema else "Desconocido",
+        "plataforma": tendencia.plataforma,
+        "ubicacion": tendencia.ubicacion,
+        "edad_rango": tendencia.edad_rango,
+        "genero": tendencia.genero,
+        "volumen_menciones": tendencia.volumen_menciones,
+        "tasa_crecimiento": tendencia.tasa_crecimiento,
+        "sentimiento_promedio": tendencia.sentimiento_promedio,
+        "es_tendencia": tendencia.es_tendencia,
+        "id": tendencia.id,
+        "tema_id": tendencia.tema_id,
+        "fecha_hora": tendencia.fecha_hora,
+        "keywords": tema.keywords if tema else [],
+        "validada": validada,
+        "engagement_total": tendencia.engagement_total,
+        "autores_unicos": tendencia.autores_unicos,
+        "puntuacion": tendencia.puntuacion,
+        "puntuacion_z": tendencia.puntuacion_z,
+    }
@@ -4,7 +4,9 @@ Configuración de Celery para tareas asíncronas
 
 from celery import Celery
 from celery.schedules import crontab
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
 import logging
+import os
 
 from src.utils.config import settings
 from src.utils.logging import setup_logging
@@ -49,21 +51,38 @@ celery_app.conf.update(
         "src.tasks.collector_tasks.collect_reddit": {"queue": "collectors"},
         "src.tasks.collector_tasks.collect_mastodon": {"queue": "collectors"},
         "src.tasks.collector_tasks.collect_all_platforms": {"queue": "collectors"},
+        "src.tasks.collector_tasks.collect_planned_query": {"queue": "collectors"},
+        "src.tasks.collector_tasks.record_collection_cycle": {"queue": "collectors"},
+        "src.tasks.collector_tasks.refresh_engagement": {"queue": "collectors"},
         "src.tasks.nlp_tasks.*": {"queue": "nlp"},
         "src.tasks.analytics_tasks.*": {"queue": "analytics"},
+        "src.tasks.export_tasks.*": {"queue": "exports"},
     },
     # Beat schedule (tareas programadas)
     beat_schedule={
-        # Recolectar contenido cada 30 minutos
-        "collect-content-every-30min": {
+        # Revisar pares (lineamiento, plataforma) pendientes; cada par tiene
+        # su propio intervalo adaptativo (ver AdaptiveScheduler)
+        "collect-content-adaptive": {
             "task": "src.tasks.collector_tasks.collect_all_lineamientos",
-            "schedule": crontab(minute="*/30"),
+            "schedule": crontab(minute=f"*/{settings.collection_tick_minutes}"),
+        },
+        # Volver a medir engagement del contenido dentro de la ventana de tendencias
+        "refresh-engagement": {
+            "task": "src.tasks.collector_tasks.refresh_engagement",
+            "schedule": crontab(minute=f"*/{settings.engagement_refresh_minutes}"),
+            # Descartar ejecuciones encoladas que ya alcanzó la siguiente
+            "options": {"expires": settings.engagement_refresh_minutes * 60},
         },
         # Procesar NLP cada hora
         "process-nlp-hourly": {
             "task": "src.tasks.nlp_tasks.process_pending_content",
             "schedule": crontab(minute=0),
         },
+        # Sumar los temas nuevos al índice de co-ocurrencias
+        "index-cooccurrences": {
+            "task": "src.tasks.nlp_tasks.index_cooccurrences",
+            "schedule": crontab(minute=f"*/{settings.cooccurrence_index_minutes}"),
+        },
         # Analizar tendencias cada hora
         "analyze-trends-hourly": {
             "task": "src.tasks.analytics_tasks.analyze_trends",
@@ -74,6 +93,11 @@ celery_app.conf.update(
             "task": "src.tasks.analytics_tasks.validate_trends",
             "schedule": crontab(minute=30, hour="*/6"),
         },
+        # Borrar exportaciones vencidas del spool
+        "cleanup-exports-hourly": {
+            "task": "src.tasks.export_tasks.cleanup_exports",
+            "schedule": crontab(minute=45),
+        },
         # Limpiar datos antiguos diariamente
         "cleanup-old-data-daily": {
             "task": "src.tasks.maintenance_tasks.cleanup_old_data",
@@ -89,12 +113,50 @@ celery_app.autodiscover_tasks(
         "src.tasks.nlp_tasks",
         "src.tasks.analytics_tasks",
         "src.tasks.maintenance_tasks",
+        "src.tasks.export_tasks",
     ]
 )
 
 logger.info("Celery app configurada")
 
 
+@worker_process_init.connect
+def reset_db_pool(**kwargs):
+    """
+    Descarta en cada hijo prefork las conexiones heredadas del proceso padre.
+
+    Los sockets copiados por fork no se pueden compartir entre procesos;
+    cada hijo abre las suyas según el perfil de su rol (DB_ROLE).
+    """
+    from src.models.base import engine
+
+    engine.dispose(close=False)
+
+
+@worker_init.connect
+def start_worker_metrics(**kwargs):
+    """
+    Expone las métricas del worker (pool de conexiones) si METRICS_PORT está definido.
+
+    Corre en el proceso principal antes de crear los hijos; en prefork las
+    métricas de los hijos se agregan con PROMETHEUS_MULTIPROC_DIR.
+    """
+    if settings.metrics_port is None:
+        return
+
+    from src.utils.metrics import start_metrics_server
+
+    start_metrics_server(settings.metrics_port)
+
+
+@worker_process_shutdown.connect
+def discard_worker_metrics(pid=None, **kwargs):
+    """Descarta los gauges de un hijo prefork que termina (ej: autoscale)"""
+    from src.utils.metrics import mark_process_dead
+
+    mark_process_dead(pid or os.getpid())
+
+
 @celery_app.task(bind=True)
 def debug_task(self):
     """Tarea de debug para verificar que Celery funciona"""
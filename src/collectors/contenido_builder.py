@@ -0,0 +1,73 @@
+"""
+Conversión de items de collectors a filas de contenido_recolectado
+"""
+
+from typing import Any, Dict
+from uuid import UUID
+from datetime import datetime
+
+from src.utils.language_detector import language_detector
+
+
+def item_texto(plataforma: str, item: Dict[str, Any]) -> str:
+    """
+    Texto a guardar y analizar de un item de collector.
+
+    Args:
+        plataforma: youtube, reddit o mastodon
+        item: Item normalizado por el collector
+
+    Returns:
+        Texto del contenido
+    """
+    if plataforma == "mastodon":
+        # Mastodon no tiene títulos separados
+        return item["descripcion"]
+    return f"{item['titulo']} {item['descripcion']}"
+
+
+def contenido_values(
+    plataforma: str,
+    item: Dict[str, Any],
+    lineamiento_id: UUID,
+) -> Dict[str, Any]:
+    """
+    Construye los valores de un ContenidoRecolectado a partir de un item.
+
+    Sirve tanto para instanciar el modelo (`ContenidoRecolectado(**values)`)
+    como para inserts masivos sobre la tabla.
+
+    Args:
+        plataforma: youtube, reddit o mastodon
+        item: Item normalizado por el collector
+        lineamiento_id: Lineamiento al que se atribuye el contenido
+
+    Returns:
+        Dict columna -> valor
+    """
+    texto = item_texto(plataforma, item)
+    # Mastodon reporta el idioma declarado por el autor
+    hint = None
+    if plataforma == "mastodon":
+        hint = item["metadata"].get("language") or None
+
+    # Las plataformas reportan fechas ISO 8601, a veces con sufijo Z
+    try:
+        fecha_pub = datetime.fromisoformat(
+            item["fecha_publicacion"].replace("Z", "+00:00")
+        )
+    except Exception:
+        fecha_pub = datetime.utcnow()
+
+    return {
+        "lineamiento_id": lineamiento_id,
+        "plataforma": plataforma,
+        "plataforma_id": item["plataforma_id"],
+        "contenido_texto": texto,
+        "autor": item["autor"],
+        "fecha_publicacion": fecha_pub,
+        "url": item["url"],
+        "metadata": item["metadata"],
+        "idioma": language_detector.detect_language(texto, hint=hint),
+        "nlp_procesado": False,
+    }
@@ -7,7 +7,7 @@ from datetime import datetime, timedelta
 import logging
 
 from mastodon import Mastodon
-from mastodon.errors import MastodonError
+from mastodon.errors import MastodonError, MastodonNotFoundError, MastodonVersionError
 
 from src.utils.config import settings
 from src.utils.rate_limiter import rate_limiter_manager
@@ -24,6 +24,9 @@ class MastodonCollector:
     - Varía por instancia
     """
 
+    # Máximo de IDs por consulta masiva de statuses
+    STATUSES_BATCH_SIZE = 20
+
     def __init__(
         self,
         access_token: str | None = None,
@@ -244,6 +247,90 @@ class MastodonCollector:
             },
         }
 
+    def get_engagement(self, toot_ids: List[str]) -> Dict[str, Dict[str, int | None]]:
+        """
+        Obtiene las métricas actuales de engagement de toots ya recolectados.
+
+        Usa `GET /api/v1/statuses` (Mastodon >= 4.3, Mastodon.py >= 2.0) con
+        hasta 20 IDs por request. Si la librería o la instancia no tienen el
+        endpoint masivo, consulta uno por uno con `status(id)` solo los
+        `mastodon_engagement_fallback_max_items` toots más recientes, para no
+        agotar el rate limit de la recolección.
+
+        Args:
+            toot_ids: IDs de toots en la instancia, más recientes primero
+
+        Returns:
+            Dict toot_id -> {views, likes, comments, shares}
+        """
+        if not self.mastodon:
+            raise ValueError("Mastodon API no inicializada")
+
+        statuses: List[Dict[str, Any]] = []
+        bulk = hasattr(self.mastodon, "statuses")
+        fallback_from = None if bulk else 0
+
+        for i in range(0, len(toot_ids), self.STATUSES_BATCH_SIZE):
+            if fallback_from is not None:
+                break
+            batch = toot_ids[i : i + self.STATUSES_BATCH_SIZE]
+
+            # Adquirir token de rate limiter
+            self.rate_limiter.acquire()
+
+            try:
+                statuses.extend(self.mastodon.statuses(batch))
+            except (MastodonVersionError, MastodonNotFoundError):
+                logger.warning("La instancia no soporta consulta masiva de statuses")
+                fallback_from = i
+            except MastodonError as e:
+                logger.error(f"Error al obtener engagement de toots: {e}")
+
+        if fallback_from is not None:
+            pending = toot_ids[fallback_from:]
+            max_items = settings.mastodon_engagement_fallback_max_items
+            if len(pending) > max_items:
+                logger.info(
+                    f"Sin consulta masiva de statuses: se refrescan los {max_items} "
+                    f"toots más recientes de {len(pending)}"
+                )
+            statuses.extend(self._get_statuses_one_by_one(pending[:max_items]))
+
+        return {
+            str(status["id"]): {
+                "views": None,
+                "likes": status.get("favourites_count", 0),
+                "comments": status.get("replies_count", 0),
+                "shares": status.get("reblogs_count", 0),
+            }
+            for status in statuses
+        }
+
+    def _get_statuses_one_by_one(self, toot_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Consulta toots uno por uno (sin endpoint masivo).
+
+        Args:
+            toot_ids: IDs de toots en la instancia
+
+        Returns:
+            Toots encontrados (se omiten los eliminados)
+        """
+        statuses = []
+
+        for toot_id in toot_ids:
+            # Adquirir token de rate limiter
+            self.rate_limiter.acquire()
+
+            try:
+                statuses.append(self.mastodon.status(toot_id))
+            except MastodonNotFoundError:
+                continue
+            except MastodonError as e:
+                logger.error(f"Error al obtener engagement del toot {toot_id}: {e}")
+
+        return statuses
+
     def get_toot_context(self, toot_id: str) -> Dict[str, Any]:
         """
         Obtiene el contexto de un toot (respuestas y thread).
@@ -0,0 +1,265 @@
+"""
+Consumidor continuo de la API de streaming de Mastodon
+"""
+
+from typing import Any, Dict, List
+import threading
+import time
+import logging
+
+from mastodon import StreamListener
+from mastodon.errors import MastodonError
+
+from src.collectors.mastodon_collector import MastodonCollector
+from src.collectors.stream_store import MicroBatchBuffer, StreamStore
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class _BatchListener(StreamListener):
+    """Listener que envía cada toot al buffer del consumidor"""
+
+    def __init__(self, consumer: "MastodonStreamConsumer", target: str):
+        self.consumer = consumer
+        self.target = target
+
+    def on_update(self, status):
+        self.consumer.enqueue(self.target, status)
+
+    def handle_heartbeat(self):
+        self.consumer.flush_if_due(self.target)
+
+    def on_unknown_event(self, name, unknown_event=None):
+        logger.debug(f"Evento de streaming ignorado: {name}")
+
+
+class MastodonStreamConsumer:
+    """
+    Consume el timeline público o hashtags de Mastodon en tiempo real.
+
+    Cada toot se parsea con `MastodonCollector._parse_toot` y se acumula en
+    un `MicroBatchBuffer` por stream, que se guarda por tamaño
+    (`stream_batch_size`) o por tiempo (`stream_flush_seconds`).
+
+    Ante una desconexión se reconecta con backoff exponencial. Antes de
+    cada conexión recupera por REST (`min_id` = checkpoint) los toots
+    publicados mientras estuvo desconectado.
+    """
+
+    PLATAFORMA = "mastodon"
+    PAGE_SIZE = 40
+
+    def __init__(
+        self,
+        collector: MastodonCollector | None = None,
+        hashtags: List[str] | None = None,
+        store: StreamStore | None = None,
+        batch_size: int | None = None,
+        flush_seconds: float | None = None,
+    ):
+        """
+        Inicializa el consumidor.
+
+        Args:
+            collector: Collector con cliente autenticado. Si None, crea uno
+            hashtags: Hashtags a seguir. Si None, usa settings (vacío = público)
+            store: Persistencia de batches. Si None, usa la base de datos
+            batch_size: Elementos por batch. Si None, usa settings
+            flush_seconds: Espera máxima en buffer. Si None, usa settings
+        """
+        self.collector = collector or MastodonCollector()
+        if not self.collector.mastodon:
+            raise ValueError("Mastodon API no inicializada. Configurar credenciales.")
+
+        if hashtags is None:
+            hashtags = settings.mastodon_stream_hashtags
+        self.targets = [f"hashtag:{tag.lstrip('#').lower()}" for tag in hashtags] or [
+            "public"
+        ]
+
+        self.store = store or StreamStore()
+        self.buffer = MicroBatchBuffer(
+            self.PLATAFORMA,
+            self.store,
+            batch_size=batch_size or settings.stream_batch_size,
+            flush_seconds=flush_seconds or settings.stream_flush_seconds,
+        )
+        self._stop = threading.Event()
+
+    @classmethod
+    def stream_key(cls, target: str) -> str:
+        """Clave del checkpoint de un stream"""
+        return f"{cls.PLATAFORMA}:{target}"
+
+    def enqueue(self, target: str, status: Dict[str, Any]) -> None:
+        """
+        Parsea un toot y lo agrega al buffer de su stream.
+
+        Args:
+            target: Stream de origen
+            status: Status de Mastodon API
+        """
+        toot = self.collector._parse_toot(status)
+        toot["plataforma_id"] = str(toot["plataforma_id"])
+        self.buffer.add(self.stream_key(target), toot, toot["plataforma_id"])
+
+    def flush_if_due(self, target: str) -> None:
+        """Guarda el buffer del stream si venció `stream_flush_seconds`"""
+        self.buffer.flush_if_due(self.stream_key(target))
+
+    def flush(self, target: str) -> Dict[str, int] | None:
+        """Guarda el buffer del stream y avanza su checkpoint"""
+        return self.buffer.flush(self.stream_key(target))
+
+    # ------------------------------------------------------------------
+    # Conexión
+    # ------------------------------------------------------------------
+
+    def backfill(self, target: str) -> int:
+        """
+        Recupera por REST los toots posteriores al checkpoint.
+
+        Args:
+            target: Stream a completar
+
+        Returns:
+            Número de toots recuperados
+        """
+        key = self.stream_key(target)
+        since = self.buffer.newer(self.store.load_checkpoint(key), self.buffer.last_id(key))
+        if since is None or settings.mastodon_stream_backfill_pages == 0:
+            return 0
+
+        client = self.collector.mastodon
+        total = 0
+
+        for _ in range(settings.mastodon_stream_backfill_pages):
+            self.collector.rate_limiter.acquire()
+
+            if target == "public":
+                page = client.timeline_public(
+                    min_id=since,
+                    limit=self.PAGE_SIZE,
+                    local=settings.mastodon_stream_local,
+                )
+            else:
+                page = client.timeline_hashtag(
+                    target.split(":", 1)[1],
+                    min_id=since,
+                    limit=self.PAGE_SIZE,
+                    local=settings.mastodon_stream_local,
+                )
+
+            if not page:
+                break
+
+            for status in page:
+                self.enqueue(target, status)
+                since = self.buffer.newer(since, str(status["id"]))
+            total += len(page)
+
+            if len(page) < self.PAGE_SIZE:
+                break
+
+        if total:
+            logger.info(f"Backfill de {target}: {total} toots desde el checkpoint")
+        return total
+
+    def _open_stream(self, target: str):
+        """Abre la conexión de streaming en un hilo de Mastodon.py"""
+        listener = _BatchListener(self, target)
+        client = self.collector.mastodon
+
+        if target == "public":
+            return client.stream_public(
+                listener, run_async=True, local=settings.mastodon_stream_local
+            )
+        return client.stream_hashtag(
+            target.split(":", 1)[1],
+            listener,
+            run_async=True,
+            local=settings.mastodon_stream_local,
+        )
+
+    def run_once(self, target: str) -> None:
+        """
+        Completa desde el checkpoint y consume el stream hasta que se cierre.
+
+        Args:
+            target: Stream a consumir
+        """
+        self.backfill(target)
+        self.flush(target)
+
+        handle = self._open_stream(target)
+        logger.info(f"Stream de Mastodon conectado: {target}")
+
+        try:
+            while handle.is_alive() and not self._stop.is_set():
+                self._stop.wait(1.0)
+                self.flush_if_due(target)
+        finally:
+            handle.close()
+            self.flush(target)
+
+    def _run_target(self, target: str) -> None:
+        """Consume un stream reconectando con backoff exponencial"""
+        delay = 1
+
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.run_once(target)
+            except MastodonError as e:
+                logger.warning(f"Stream de Mastodon {target} desconectado: {e}")
+            except Exception as e:
+                logger.error(f"Error en stream de Mastodon {target}: {e}", exc_info=True)
+
+            if self._stop.is_set():
+                break
+
+            # Una conexión que duró más que el backoff máximo se considera sana
+            if time.monotonic() - started > settings.stream_reconnect_max_seconds:
+                delay = 1
+
+            logger.info(f"Reconectando stream {target} en {delay}s")
+            self._stop.wait(delay)
+            delay = min(delay * 2, settings.stream_reconnect_max_seconds)
+
+    def run(self) -> None:
+        """Consume todos los streams configurados hasta `stop()`"""
+        threads = [
+            threading.Thread(
+                target=self._run_target, args=(target,), name=f"mastodon-{target}", daemon=True
+            )
+            for target in self.targets
+        ]
+        for thread in threads:
+            thread.start()
+
+        logger.info(f"Consumidor de Mastodon iniciado: {self.targets}")
+
+        try:
+            while any(thread.is_alive() for thread in threads):
+                for thread in threads:
+                    thread.join(timeout=1.0)
+        except KeyboardInterrupt:
+            self.stop()
+            for thread in threads:
+                thread.join()
+
+    def stop(self) -> None:
+        """Solicita detener el consumidor (los buffers se guardan al salir)"""
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    from src.utils.logging import setup_logging
+
+    setup_logging(
+        log_level=settings.log_level,
+        log_format=settings.log_format,
+        log_file=settings.log_file,
+    )
+    MastodonStreamConsumer().run()
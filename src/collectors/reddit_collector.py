@@ -8,6 +8,7 @@ import logging
 
 import praw
 from praw.exceptions import PRAWException
+from prawcore.exceptions import PrawcoreException
 
 from src.utils.config import settings
 from src.utils.rate_limiter import rate_limiter_manager
@@ -211,6 +212,43 @@ class RedditCollector:
             },
         }
 
+    def get_engagement(self, post_ids: List[str]) -> Dict[str, Dict[str, int | None]]:
+        """
+        Obtiene las métricas actuales de engagement de posts ya recolectados.
+
+        Usa `reddit.info()` con hasta 100 fullnames por request.
+
+        Args:
+            post_ids: IDs de posts (sin prefijo t3_)
+
+        Returns:
+            Dict post_id -> {views, likes, comments, shares}. Los posts
+            eliminados no aparecen
+        """
+        if not self.reddit:
+            raise ValueError("Reddit API no inicializada")
+
+        engagement: Dict[str, Dict[str, int | None]] = {}
+
+        for i in range(0, len(post_ids), 100):
+            fullnames = [f"t3_{post_id}" for post_id in post_ids[i : i + 100]]
+
+            # Adquirir token de rate limiter (1 request por 100 fullnames)
+            self.rate_limiter.acquire()
+
+            try:
+                for submission in self.reddit.info(fullnames=fullnames):
+                    engagement[submission.id] = {
+                        "views": None,
+                        "likes": submission.score,
+                        "comments": submission.num_comments,
+                        "shares": None,
+                    }
+            except (PRAWException, PrawcoreException) as e:
+                logger.error(f"Error al obtener engagement de posts: {e}")
+
+        return engagement
+
     def get_post_comments(
         self,
         post_id: str,
@@ -298,14 +336,7 @@ class RedditCollector:
 
         # Subreddits recomendados en español si no se especifican
         if not subreddits:
-            subreddits = [
-                "es",  # r/es - España
-                "mexico",  # r/mexico
-                "argentina",  # r/argentina
-                "chile",  # r/chile
-                "colombia",  # r/colombia
-                "AskReddit",  # General (multiidioma)
-            ]
+            subreddits = settings.reddit_subreddits
 
         try:
             posts = self.search_posts(
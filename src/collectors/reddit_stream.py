@@ -0,0 +1,169 @@
+"""
+Consumidor continuo de submissions de Reddit
+"""
+
+from typing import List
+import threading
+import time
+import logging
+
+from prawcore.exceptions import PrawcoreException
+from praw.exceptions import PRAWException
+
+from src.collectors.reddit_collector import RedditCollector
+from src.collectors.stream_store import MicroBatchBuffer, StreamStore
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def fullname_order(fullname: str) -> int:
+    """Valor ordenable de un fullname de Reddit (t3_<id en base 36>)"""
+    return int(fullname.split("_", 1)[-1], 36)
+
+
+class RedditStreamConsumer:
+    """
+    Consume las submissions nuevas de los subreddits configurados.
+
+    Usa `subreddit.stream.submissions` sobre el multireddit de
+    `reddit_subreddits` (una sola request por ciclo de polling para todos
+    los subreddits). Cada post se parsea con `RedditCollector._parse_post`
+    y se guarda en micro-batches; `StreamStore` lo asocia localmente con
+    los lineamientos cuyas keywords coinciden.
+
+    El fullname del último post guardado se registra como checkpoint y se
+    usa como `continue_after_id` al reanudar, de modo que tras un reinicio
+    no se pierden posts que ya salieron de los primeros resultados.
+    """
+
+    PLATAFORMA = "reddit"
+    STREAM_KEY = "reddit:submissions"
+
+    def __init__(
+        self,
+        collector: RedditCollector | None = None,
+        subreddits: List[str] | None = None,
+        store: StreamStore | None = None,
+        batch_size: int | None = None,
+        flush_seconds: float | None = None,
+    ):
+        """
+        Inicializa el consumidor.
+
+        Args:
+            collector: Collector con cliente autenticado. Si None, crea uno
+            subreddits: Subreddits a seguir. Si None, usa settings
+            store: Persistencia de batches. Si None, usa la base de datos
+            batch_size: Elementos por batch. Si None, usa settings
+            flush_seconds: Espera máxima en buffer. Si None, usa settings
+        """
+        self.collector = collector or RedditCollector()
+        if not self.collector.reddit:
+            raise ValueError("Reddit API no inicializada. Configurar credenciales.")
+
+        self.subreddits = subreddits or settings.reddit_subreddits
+        self.store = store or StreamStore()
+        self.buffer = MicroBatchBuffer(
+            self.PLATAFORMA,
+            self.store,
+            batch_size=batch_size or settings.stream_batch_size,
+            flush_seconds=flush_seconds or settings.stream_flush_seconds,
+            id_order=fullname_order,
+        )
+        self._stop = threading.Event()
+
+    def _checkpoint(self) -> str | None:
+        """Último fullname guardado o recibido"""
+        return self.buffer.newer(
+            self.store.load_checkpoint(self.STREAM_KEY),
+            self.buffer.last_id(self.STREAM_KEY),
+        )
+
+    def run_once(self) -> int:
+        """
+        Consume el stream hasta `stop()` o hasta un error de la API.
+
+        Returns:
+            Número de posts recibidos
+        """
+        subreddit = self.collector.reddit.subreddit("+".join(self.subreddits))
+        checkpoint = self._checkpoint()
+
+        stream_options = {"pause_after": settings.reddit_stream_pause_after}
+        if checkpoint:
+            stream_options["continue_after_id"] = checkpoint
+
+        logger.info(
+            f"Stream de Reddit iniciado: subreddits={self.subreddits}, "
+            f"checkpoint={checkpoint}"
+        )
+
+        received = 0
+        try:
+            for submission in subreddit.stream.submissions(**stream_options):
+                if self._stop.is_set():
+                    break
+
+                if submission is None:
+                    # Respuesta sin posts nuevos: una request consumida
+                    self.collector.rate_limiter.acquire()
+                    self.buffer.flush_if_due(self.STREAM_KEY)
+                    continue
+
+                # Sin checkpoint, el primer ciclo trae los últimos 100 posts;
+                # con checkpoint, descartar los ya guardados
+                if checkpoint and fullname_order(submission.fullname) <= fullname_order(
+                    checkpoint
+                ):
+                    continue
+
+                post = self.collector._parse_post(submission)
+                self.buffer.add(self.STREAM_KEY, post, submission.fullname)
+                received += 1
+        finally:
+            self.buffer.flush(self.STREAM_KEY)
+
+        return received
+
+    def run(self) -> None:
+        """Consume el stream reconectando con backoff exponencial hasta `stop()`"""
+        delay = 1
+
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self.run_once()
+            except (PrawcoreException, PRAWException) as e:
+                logger.warning(f"Stream de Reddit interrumpido: {e}")
+            except KeyboardInterrupt:
+                self.stop()
+                break
+            except Exception as e:
+                logger.error(f"Error en stream de Reddit: {e}", exc_info=True)
+
+            if self._stop.is_set():
+                break
+
+            # Una conexión que duró más que el backoff máximo se considera sana
+            if time.monotonic() - started > settings.stream_reconnect_max_seconds:
+                delay = 1
+
+            logger.info(f"Reiniciando stream de Reddit en {delay}s")
+            self._stop.wait(delay)
+            delay = min(delay * 2, settings.stream_reconnect_max_seconds)
+
+    def stop(self) -> None:
+        """Solicita detener el consumidor (el buffer se guarda al salir)"""
+        self._stop.set()
+
+
+if __name__ == "__main__":
+    from src.utils.logging import setup_logging
+
+    setup_logging(
+        log_level=settings.log_level,
+        log_format=settings.log_format,
+        log_file=settings.log_file,
+    )
+    RedditStreamConsumer().run()
@@ -0,0 +1,297 @@
+"""
+Persistencia de micro-batches de consumidores de streaming
+"""
+
+from typing import Any, Callable, Dict, List
+from uuid import UUID
+import threading
+import time
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.base import SessionLocal
+from src.models.lineamiento import Lineamiento
+from src.models.contenido import ContenidoRecolectado
+from src.models.stream_checkpoint import StreamCheckpoint
+from src.collectors.contenido_builder import item_texto, contenido_values
+from src.services.lineamiento_matcher import lineamiento_matcher
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class StreamStore:
+    """
+    Guarda micro-batches de streams en `contenido_recolectado`.
+
+    Los streams no están asociados a un lineamiento: cada item se atribuye
+    al primer lineamiento activo de la plataforma cuyas keywords coinciden
+    localmente, y se descarta si no coincide con ninguno. El insert es
+    masivo (`ON CONFLICT DO NOTHING` sobre plataforma + plataforma_id) y el
+    checkpoint se actualiza en la misma transacción, de modo que al
+    reanudar no se pierden ni se duplican elementos.
+    """
+
+    def __init__(self, session_factory: Callable[[], Session] = SessionLocal):
+        """
+        Args:
+            session_factory: Fábrica de sesiones de SQLAlchemy
+        """
+        self.session_factory = session_factory
+
+    def load_checkpoint(self, stream_key: str) -> str | None:
+        """
+        Obtiene el último ID guardado para un stream.
+
+        Args:
+            stream_key: Identificador del stream
+
+        Returns:
+            ID en la plataforma o None si el stream no tiene historial
+        """
+        db = self.session_factory()
+        try:
+            checkpoint = db.get(StreamCheckpoint, stream_key)
+            return checkpoint.last_id if checkpoint else None
+        finally:
+            db.close()
+
+    def save_batch(
+        self,
+        plataforma: str,
+        stream_key: str,
+        items: List[Dict[str, Any]],
+        last_id: str | None,
+    ) -> Dict[str, int]:
+        """
+        Guarda un micro-batch y avanza el checkpoint del stream.
+
+        Args:
+            plataforma: youtube, reddit o mastodon
+            stream_key: Identificador del stream
+            items: Items normalizados por el collector
+            last_id: ID del último elemento recibido (nuevo checkpoint)
+
+        Returns:
+            Dict con received, new_saved, lineamientos_tagged y discarded
+        """
+        db = self.session_factory()
+
+        try:
+            rows = self._build_rows(db, plataforma, items)
+
+            inserted = []
+            if rows:
+                table = ContenidoRecolectado.__table__
+                stmt = (
+                    insert(table)
+                    .values(rows)
+                    .on_conflict_do_nothing()
+                    .returning(table.c.id, table.c.contenido_texto)
+                )
+                inserted = [(row.id, row.contenido_texto) for row in db.execute(stmt)]
+
+            tagged_count = lineamiento_matcher.tag_contenidos(db, inserted)
+
+            if last_id is not None:
+                stmt = insert(StreamCheckpoint).values(stream_key=stream_key, last_id=last_id)
+                db.execute(
+                    stmt.on_conflict_do_update(
+                        index_elements=[StreamCheckpoint.stream_key],
+                        set_={"last_id": stmt.excluded.last_id, "updated_at": func.now()},
+                    )
+                )
+
+            db.commit()
+
+            stats = {
+                "received": len(items),
+                "new_saved": len(inserted),
+                "lineamientos_tagged": tagged_count,
+                "discarded": len(items) - len(rows),
+            }
+            logger.info(f"Batch de stream {stream_key} guardado: {stats}")
+            return stats
+
+        except Exception:
+            db.rollback()
+            raise
+
+        finally:
+            db.close()
+
+    def _build_rows(
+        self,
+        db: Session,
+        plataforma: str,
+        items: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Construye filas para los items que coinciden con algún lineamiento"""
+        if not items:
+            return []
+
+        # Lineamientos activos que monitorean la plataforma, en orden estable
+        lineamiento_ids = [
+            lineamiento_id
+            for (lineamiento_id,) in db.query(Lineamiento.id)
+            .filter(
+                Lineamiento.activo == True,
+                Lineamiento.plataformas.contains([plataforma]),
+            )
+            .order_by(Lineamiento.id)
+        ]
+        if not lineamiento_ids:
+            return []
+
+        matcher = lineamiento_matcher.get_matcher(db)
+        rows = []
+        vistos = set()
+
+        for item in items:
+            if item["plataforma_id"] in vistos:
+                continue
+            matches = matcher.match(item_texto(plataforma, item))
+            owner: UUID | None = next(
+                (lid for lid in lineamiento_ids if lid in matches), None
+            )
+            if owner is None:
+                continue
+            vistos.add(item["plataforma_id"])
+            rows.append(contenido_values(plataforma, item, owner))
+
+        return rows
+
+
+class MicroBatchBuffer:
+    """
+    Buffer por stream que se guarda en micro-batches por tamaño o por tiempo.
+
+    Lleva el ID más reciente recibido en cada stream, que se guarda como
+    checkpoint junto con el batch. Si el guardado falla, los elementos
+    vuelven al buffer para reintentarse en el próximo flush.
+
+    Los flushes de un mismo stream se serializan, de modo que los
+    checkpoints se confirman en el orden en que se tomaron. El buffer de
+    cada stream tiene un máximo de elementos: si la base de datos no
+    responde, se descartan los más antiguos en lugar de crecer sin límite.
+    """
+
+    def __init__(
+        self,
+        plataforma: str,
+        store: StreamStore,
+        batch_size: int,
+        flush_seconds: float,
+        id_order: Callable[[str], int] = int,
+        max_items: int | None = None,
+    ):
+        """
+        Args:
+            plataforma: youtube, reddit o mastodon
+            store: Persistencia de batches
+            batch_size: Elementos por batch
+            flush_seconds: Espera máxima de un elemento en el buffer
+            id_order: Convierte un ID de la plataforma en un valor ordenable
+                (los IDs de cada plataforma crecen con el tiempo)
+            max_items: Máximo de elementos en el buffer de un stream.
+                Si None, usa settings
+        """
+        self.plataforma = plataforma
+        self.store = store
+        self.batch_size = batch_size
+        self.flush_seconds = flush_seconds
+        self.id_order = id_order
+        self.max_items = max(max_items or settings.stream_buffer_max_items, batch_size)
+
+        self._lock = threading.Lock()
+        self._flush_locks: Dict[str, threading.Lock] = {}
+        self._items: Dict[str, List[Dict[str, Any]]] = {}
+        self._last_ids: Dict[str, str] = {}
+        self._first_buffered_at: Dict[str, float] = {}
+
+    def newer(self, a: str | None, b: str | None) -> str | None:
+        """Retorna el más reciente de dos IDs (None se ignora)"""
+        if a is None:
+            return b
+        if b is None:
+            return a
+        return a if self.id_order(a) >= self.id_order(b) else b
+
+    def last_id(self, stream_key: str) -> str | None:
+        """ID más reciente recibido en el stream (guardado o en buffer)"""
+        with self._lock:
+            return self._last_ids.get(stream_key)
+
+    def add(self, stream_key: str, item: Dict[str, Any], item_id: str) -> None:
+        """
+        Agrega un elemento y guarda el batch si está lleno.
+
+        Args:
+            stream_key: Identificador del stream
+            item: Item normalizado por el collector
+            item_id: ID usado como checkpoint
+        """
+        with self._lock:
+            items = self._items.setdefault(stream_key, [])
+            items.append(item)
+            self._trim(stream_key)
+            self._last_ids[stream_key] = self.newer(
+                self._last_ids.get(stream_key), item_id
+            )
+            self._first_buffered_at.setdefault(stream_key, time.monotonic())
+            full = len(self._items[stream_key]) >= self.batch_size
+
+        if full:
+            self.flush(stream_key)
+
+    def flush_if_due(self, stream_key: str) -> None:
+        """Guarda el buffer si su elemento más antiguo superó `flush_seconds`"""
+        with self._lock:
+            started = self._first_buffered_at.get(stream_key)
+        if started is not None and time.monotonic() - started >= self.flush_seconds:
+            self.flush(stream_key)
+
+    def flush(self, stream_key: str) -> Dict[str, int] | None:
+        """
+        Guarda el buffer de un stream y avanza su checkpoint.
+
+        Returns:
+            Estadísticas del batch o None si el buffer estaba vacío o falló
+        """
+        with self._lock:
+            flush_lock = self._flush_locks.setdefault(stream_key, threading.Lock())
+
+        # Un flush posterior no puede confirmar su checkpoint antes que uno
+        # anterior: si el anterior falla, sus elementos quedarían detrás de
+        # un checkpoint ya avanzado y se perderían al reanudar
+        with flush_lock:
+            with self._lock:
+                batch = self._items.pop(stream_key, [])
+                if not batch:
+                    return None
+                last_id = self._last_ids.get(stream_key)
+                self._first_buffered_at.pop(stream_key, None)
+
+            try:
+                return self.store.save_batch(self.plataforma, stream_key, batch, last_id)
+            except Exception as e:
+                logger.error(f"Error al guardar batch de {stream_key}: {e}", exc_info=True)
+                with self._lock:
+                    self._items[stream_key] = batch + self._items.get(stream_key, [])
+                    self._first_buffered_at[stream_key] = time.monotonic()
+                    self._trim(stream_key)
+                return None
+
+    def _trim(self, stream_key: str) -> None:
+        """Descarta los elementos más antiguos que exceden `max_items` (requiere `_lock`)"""
+        items = self._items[stream_key]
+        overflow = len(items) - self.max_items
+        if overflow > 0:
+            del items[:overflow]
+            logger.warning(
+                f"Buffer de {stream_key} lleno ({self.max_items} elementos): "
+                f"{overflow} elementos antiguos descartados"
+            )
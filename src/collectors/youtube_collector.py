@@ -2,7 +2,7 @@
 Collector para YouTube usando YouTube Data API v3
 """
 
-from typing import List, Dict, Any
+from typing import Any, Callable, Dict, List
 from datetime import datetime, timedelta
 import logging
 
@@ -21,10 +21,21 @@ class YouTubeCollector:
 
     Límites de API:
     - 10,000 unidades por día (configurable)
-    - Búsqueda: 100 unidades por query
-    - Video details: 1 unidad por video
+    - Búsqueda: 100 unidades por página (máx 50 resultados)
+    - Video details: 1 unidad por request (máx 50 IDs)
+
+    Las requests independientes (detalles de videos, comentarios de varios
+    videos) se combinan en requests batch HTTP: cada sub-request consume
+    su cuota normal, pero todas viajan en un solo round trip.
     """
 
+    PAGE_SIZE = 50
+    SEARCH_UNITS = 100
+    VIDEOS_UNITS = 1
+    COMMENTS_PAGE_SIZE = 100
+    # Límite de sub-requests por request batch de Google APIs
+    BATCH_LIMIT = 50
+
     def __init__(self, api_key: str | None = None):
         """
         Inicializa el collector de YouTube.
@@ -46,6 +57,9 @@ class YouTubeCollector:
             except Exception as e:
                 logger.error(f"Error al inicializar YouTube API: {e}")
 
+        # Unidades de cuota consumidas por la última búsqueda
+        self.last_units_used = 0
+
         # Obtener rate limiter
         self.rate_limiter = rate_limiter_manager.get_limiter(
             name="youtube",
@@ -60,19 +74,29 @@ class YouTubeCollector:
         published_after: datetime | None = None,
         region_code: str = "MX",
         language: str = "es",
+        max_units: int | None = None,
     ) -> List[Dict[str, Any]]:
         """
-        Busca videos en YouTube por keywords.
+        Busca videos en YouTube por keywords, siguiendo `nextPageToken`.
+
+        La paginación se detiene al alcanzar `max_results`, cuando los
+        resultados (ordenados por fecha) pasan de `published_after`, cuando
+        no hay más páginas o cuando la siguiente página excedería el
+        presupuesto de unidades. Los detalles de todos los videos se piden
+        al final en una sola request batch (lotes de 50 IDs).
 
         Args:
             keywords: Lista de keywords a buscar
-            max_results: Máximo de resultados (máx 50 por request)
-            published_after: Fecha mínima de publicación
+            max_results: Máximo de resultados en total (50 por página)
+            published_after: Fecha mínima de publicación (cursor incremental)
             region_code: Código de región (ej: MX, ES, AR)
             language: Código de idioma (ej: es, en)
+            max_units: Presupuesto de unidades de cuota. Si None, usa
+                settings.youtube_units_budget_per_query
 
         Returns:
-            Lista de videos con metadata
+            Lista de videos con metadata. Las unidades consumidas quedan
+            en `self.last_units_used`
 
         Raises:
             ValueError: Si no hay API key configurada
@@ -81,6 +105,9 @@ class YouTubeCollector:
         if not self.youtube:
             raise ValueError("YouTube API no inicializada. Configurar API key.")
 
+        if max_units is None:
+            max_units = settings.youtube_units_budget_per_query
+
         # Construir query de búsqueda
         query = " OR ".join(keywords)
 
@@ -89,50 +116,117 @@ class YouTubeCollector:
             "q": query,
             "part": "snippet",
             "type": "video",
-            "maxResults": min(max_results, 50),  # Máximo 50 por request
             "regionCode": region_code,
             "relevanceLanguage": language,
             "order": "date",  # Ordenar por fecha para obtener lo más reciente
         }
 
         # Agregar filtro de fecha si se especifica
+        cursor = None
         if published_after:
             # Formato RFC 3339
-            search_params["publishedAfter"] = published_after.strftime(
-                "%Y-%m-%dT%H:%M:%SZ"
-            )
+            cursor = published_after.strftime("%Y-%m-%dT%H:%M:%SZ")
+            search_params["publishedAfter"] = cursor
 
         logger.info(
             f"Buscando videos en YouTube: query='{query}', "
-            f"max_results={max_results}, region={region_code}"
+            f"max_results={max_results}, region={region_code}, max_units={max_units}"
         )
 
-        # Adquirir token de rate limiter (esto consume ~100 unidades)
-        self.rate_limiter.acquire()
+        self.last_units_used = 0
+        videos: List[Dict[str, Any]] = []
+        video_ids: List[str] = []
+        found = 0
+        pages = 0
+        page_token = None
 
         try:
-            # Ejecutar búsqueda
-            search_response = self.youtube.search().list(**search_params).execute()
-
-            videos = []
-            video_ids = []
-
-            # Extraer IDs de videos
-            for item in search_response.get("items", []):
-                if item["id"]["kind"] == "youtube#video":
+            while found < max_results:
+                # Página de búsqueda + lote de detalles que generará
+                if self.last_units_used + self.SEARCH_UNITS + self.VIDEOS_UNITS > max_units:
+                    logger.info(
+                        f"Presupuesto de unidades agotado: {self.last_units_used}/{max_units}"
+                    )
+                    break
+
+                search_params["maxResults"] = min(max_results - found, self.PAGE_SIZE)
+                if page_token:
+                    search_params["pageToken"] = page_token
+
+                # Adquirir token de rate limiter (esto consume ~100 unidades)
+                self.rate_limiter.acquire()
+                search_response = self.youtube.search().list(**search_params).execute()
+                self.last_units_used += self.SEARCH_UNITS
+                pages += 1
+
+                passed_cursor = False
+                for item in search_response.get("items", []):
+                    if item["id"]["kind"] != "youtube#video":
+                        continue
+                    # Resultados ordenados por fecha: al pasar el cursor no hay más
+                    if cursor and item["snippet"].get("publishedAt", cursor) < cursor:
+                        passed_cursor = True
+                        break
                     video_ids.append(item["id"]["videoId"])
+                    found += 1
+
+                page_token = search_response.get("nextPageToken")
+                if passed_cursor or not page_token:
+                    break
 
             # Obtener detalles de videos (estadísticas, duración, etc.)
             if video_ids:
                 videos = self._get_video_details(video_ids)
 
-            logger.info(f"Videos encontrados: {len(videos)}")
+            logger.info(
+                f"Videos encontrados: {len(videos)} en {pages} páginas, "
+                f"unidades={self.last_units_used}"
+            )
             return videos
 
         except HttpError as e:
             logger.error(f"Error en YouTube API: {e}")
             raise
 
+    def _execute_batch(
+        self,
+        requests: List[Any],
+        on_response: Callable[[int, Dict[str, Any]], None],
+        on_error: Callable[[int, HttpError], None],
+    ) -> None:
+        """
+        Ejecuta requests independientes en requests batch HTTP.
+
+        Cada sub-request adquiere su token del rate limiter (la cuota se
+        cobra por sub-request), pero cada grupo de `BATCH_LIMIT` requests
+        viaja en un solo round trip.
+
+        Args:
+            requests: Requests de googleapiclient sin ejecutar
+            on_response: Callback (índice, respuesta) por request exitosa
+            on_error: Callback (índice, error) por request fallida
+        """
+
+        def callback(request_id: str, response: Dict[str, Any], exception: HttpError | None):
+            if exception is not None:
+                on_error(int(request_id), exception)
+            else:
+                on_response(int(request_id), response)
+
+        for start in range(0, len(requests), self.BATCH_LIMIT):
+            indexes = range(start, min(start + self.BATCH_LIMIT, len(requests)))
+            batch = self.youtube.new_batch_http_request(callback=callback)
+            for index in indexes:
+                self.rate_limiter.acquire()
+                batch.add(requests[index], request_id=str(index))
+
+            try:
+                batch.execute()
+            except HttpError as e:
+                # Falló la request batch completa
+                for index in indexes:
+                    on_error(index, e)
+
     def _get_video_details(self, video_ids: List[str]) -> List[Dict[str, Any]]:
         """
         Obtiene detalles completos de videos por sus IDs.
@@ -141,39 +235,33 @@ class YouTubeCollector:
             video_ids: Lista de IDs de videos
 
         Returns:
-            Lista de videos con detalles completos
+            Lista de videos con detalles completos, en el orden de los IDs
         """
         if not video_ids:
             return []
 
-        # YouTube API permite hasta 50 IDs por request
-        videos = []
-
-        for i in range(0, len(video_ids), 50):
-            batch_ids = video_ids[i : i + 50]
-
-            # Adquirir token de rate limiter (1 unidad por request)
-            self.rate_limiter.acquire()
+        # YouTube API permite hasta 50 IDs por request; los lotes viajan
+        # juntos en una request batch
+        requests = [
+            self.youtube.videos().list(
+                part="snippet,statistics,contentDetails",
+                id=",".join(video_ids[i : i + 50]),
+            )
+            for i in range(0, len(video_ids), 50)
+        ]
+        results: Dict[int, List[Dict[str, Any]]] = {}
 
-            try:
-                video_response = (
-                    self.youtube.videos()
-                    .list(
-                        part="snippet,statistics,contentDetails",
-                        id=",".join(batch_ids),
-                    )
-                    .execute()
-                )
+        def on_response(index: int, response: Dict[str, Any]) -> None:
+            results[index] = [self._parse_video(item) for item in response.get("items", [])]
 
-                for item in video_response.get("items", []):
-                    video = self._parse_video(item)
-                    videos.append(video)
+        def on_error(index: int, error: HttpError) -> None:
+            # Continuar con el resto de lotes
+            logger.error(f"Error al obtener detalles de videos: {error}")
 
-            except HttpError as e:
-                logger.error(f"Error al obtener detalles de videos: {e}")
-                # Continuar con el siguiente batch
+        self._execute_batch(requests, on_response, on_error)
+        self.last_units_used += self.VIDEOS_UNITS * len(requests)
 
-        return videos
+        return [video for index in sorted(results) for video in results[index]]
 
     def _parse_video(self, item: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -208,6 +296,45 @@ class YouTubeCollector:
             },
         }
 
+    def get_engagement(self, video_ids: List[str]) -> Dict[str, Dict[str, int | None]]:
+        """
+        Obtiene las métricas actuales de engagement de videos ya recolectados.
+
+        Usa `videos.list(part=statistics)` con 50 IDs por request (1 unidad
+        cada una), todas en requests batch.
+
+        Args:
+            video_ids: IDs de videos de YouTube
+
+        Returns:
+            Dict video_id -> {views, likes, comments, shares}. Los videos
+            eliminados o privados no aparecen
+        """
+        if not self.youtube:
+            raise ValueError("YouTube API no inicializada")
+
+        requests = [
+            self.youtube.videos().list(part="statistics", id=",".join(video_ids[i : i + 50]))
+            for i in range(0, len(video_ids), 50)
+        ]
+        engagement: Dict[str, Dict[str, int | None]] = {}
+
+        def on_response(index: int, response: Dict[str, Any]) -> None:
+            for item in response.get("items", []):
+                statistics = item.get("statistics", {})
+                engagement[item["id"]] = {
+                    "views": int(statistics.get("viewCount", 0)),
+                    "likes": int(statistics.get("likeCount", 0)),
+                    "comments": int(statistics.get("commentCount", 0)),
+                    "shares": None,
+                }
+
+        def on_error(index: int, error: HttpError) -> None:
+            logger.error(f"Error al obtener engagement de videos: {error}")
+
+        self._execute_batch(requests, on_response, on_error)
+        return engagement
+
     def get_video_comments(
         self,
         video_id: str,
@@ -226,61 +353,93 @@ class YouTubeCollector:
         Note:
             Los comentarios pueden estar deshabilitados en algunos videos.
         """
-        if not self.youtube:
-            raise ValueError("YouTube API no inicializada")
+        return self.get_comments_for_videos([video_id], max_results)[video_id]
+
+    def get_comments_for_videos(
+        self,
+        video_ids: List[str],
+        max_results: int = 100,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Obtiene comentarios de varios videos.
 
-        logger.info(f"Obteniendo comentarios del video: {video_id}")
+        Las páginas de un mismo video son secuenciales (dependen del
+        `nextPageToken` anterior), pero la página N de todos los videos se
+        pide en una misma request batch.
 
-        comments = []
+        Args:
+            video_ids: IDs de videos de YouTube
+            max_results: Máximo de comentarios por video
 
-        try:
-            # Adquirir token de rate limiter
-            self.rate_limiter.acquire()
+        Returns:
+            Dict video_id -> lista de comentarios
+        """
+        if not self.youtube:
+            raise ValueError("YouTube API no inicializada")
+
+        logger.info(f"Obteniendo comentarios de {len(video_ids)} videos")
 
-            request = self.youtube.commentThreads().list(
+        comments: Dict[str, List[Dict[str, Any]]] = {video_id: [] for video_id in video_ids}
+        pending = {
+            video_id: self.youtube.commentThreads().list(
                 part="snippet",
                 videoId=video_id,
-                maxResults=min(max_results, 100),
+                maxResults=min(max_results, self.COMMENTS_PAGE_SIZE),
                 order="relevance",
                 textFormat="plainText",
             )
+            for video_id in comments
+        }
 
-            while request and len(comments) < max_results:
-                response = request.execute()
+        while pending:
+            order = list(pending)
+            requests = [pending[video_id] for video_id in order]
+            next_pending: Dict[str, Any] = {}
 
+            def on_response(index: int, response: Dict[str, Any]) -> None:
+                video_comments = comments[order[index]]
                 for item in response.get("items", []):
-                    comment = item["snippet"]["topLevelComment"]["snippet"]
-                    comments.append(
-                        {
-                            "comment_id": item["snippet"]["topLevelComment"]["id"],
-                            "texto": comment.get("textDisplay", ""),
-                            "autor": comment.get("authorDisplayName", ""),
-                            "fecha_publicacion": comment.get("publishedAt", ""),
-                            "like_count": comment.get("likeCount", 0),
-                        }
-                    )
+                    if len(video_comments) >= max_results:
+                        break
+                    video_comments.append(self._parse_comment(item))
 
                 # Obtener siguiente página si existe
-                request = self.youtube.commentThreads().list_next(request, response)
+                if len(video_comments) < max_results:
+                    request = self.youtube.commentThreads().list_next(
+                        requests[index], response
+                    )
+                    if request:
+                        next_pending[order[index]] = request
 
-                if request:
-                    # Adquirir token para siguiente página
-                    self.rate_limiter.acquire()
+            def on_error(index: int, error: HttpError) -> None:
+                if error.resp.status == 403:
+                    logger.warning(f"Comentarios deshabilitados para video {order[index]}")
+                else:
+                    logger.error(f"Error al obtener comentarios: {error}")
 
-        except HttpError as e:
-            if e.resp.status == 403:
-                logger.warning(f"Comentarios deshabilitados para video {video_id}")
-            else:
-                logger.error(f"Error al obtener comentarios: {e}")
+            self._execute_batch(requests, on_response, on_error)
+            pending = next_pending
 
-        logger.info(f"Comentarios obtenidos: {len(comments)}")
+        logger.info(f"Comentarios obtenidos: {sum(len(c) for c in comments.values())}")
         return comments
 
+    def _parse_comment(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Parsea un comment thread de la respuesta de YouTube API"""
+        comment = item["snippet"]["topLevelComment"]["snippet"]
+        return {
+            "comment_id": item["snippet"]["topLevelComment"]["id"],
+            "texto": comment.get("textDisplay", ""),
+            "autor": comment.get("authorDisplayName", ""),
+            "fecha_publicacion": comment.get("publishedAt", ""),
+            "like_count": comment.get("likeCount", 0),
+        }
+
     def collect_for_lineamiento(
         self,
         keywords: List[str],
         hours_back: int = 24,
         max_results: int = 50,
+        since: datetime | None = None,
     ) -> List[Dict[str, Any]]:
         """
         Recolecta videos para un lineamiento.
@@ -289,12 +448,16 @@ class YouTubeCollector:
             keywords: Keywords del lineamiento
             hours_back: Horas hacia atrás para buscar
             max_results: Máximo de resultados
+            since: Cursor incremental (UTC): publicación más reciente ya
+                guardada. La paginación se detiene al alcanzarlo
 
         Returns:
             Lista de videos recolectados
         """
         # Calcular fecha de inicio
         published_after = datetime.utcnow() - timedelta(hours=hours_back)
+        if since is not None and since > published_after:
+            published_after = since
 
         logger.info(
             f"Recolectando contenido YouTube: keywords={keywords}, "
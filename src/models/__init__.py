@@ -8,6 +8,12 @@ from src.models.tema import TemaIdentificado
 from src.models.demografia import Demografia
 from src.models.tendencia import Tendencia
 from src.models.validacion import ValidacionTendencia
+from src.models.contenido_lineamiento import ContenidoLineamiento
+from src.models.collection_schedule import CollectionSchedule
+from src.models.stream_checkpoint import StreamCheckpoint
+from src.models.engagement_snapshot import EngagementSnapshot
+from src.models.trend_baseline import TrendBaseline
+from src.models.coocurrencia import Coocurrencia
 
 __all__ = [
     "Lineamiento",
@@ -16,4 +22,10 @@ __all__ = [
     "Demografia",
     "Tendencia",
     "ValidacionTendencia",
+    "ContenidoLineamiento",
+    "CollectionSchedule",
+    "StreamCheckpoint",
+    "EngagementSnapshot",
+    "TrendBaseline",
+    "Coocurrencia",
 ]
@@ -0,0 +1,71 @@
+"""
+Modelo CollectionSchedule - Programación adaptativa de recolección
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, Float, ForeignKey, func
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.models.base import Base
+
+
+class CollectionSchedule(Base):
+    """
+    Modelo para la programación adaptativa por (lineamiento, plataforma).
+
+    Guarda el rendimiento reciente de cada par (contenido nuevo por
+    ejecución) y el intervalo de polling resultante. Los pares sin
+    actividad se consultan cada vez menos y los activos más seguido.
+    """
+    __tablename__ = "collection_schedule"
+    __table_args__ = (
+        {"comment": "Intervalo adaptativo de recolección por lineamiento y plataforma"}
+    )
+
+    lineamiento_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("lineamientos.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Referencia al lineamiento"
+    )
+    plataforma = Column(
+        String(50),
+        primary_key=True,
+        comment="Plataforma: youtube, reddit, mastodon"
+    )
+
+    # Programación
+    interval_minutes = Column(
+        Integer,
+        nullable=False,
+        comment="Intervalo actual de polling en minutos"
+    )
+    next_run_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Próxima ejecución programada"
+    )
+    last_run_at = Column(
+        DateTime(timezone=True),
+        comment="Última ejecución con resultados registrados"
+    )
+
+    # Rendimiento
+    last_yield = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Contenido nuevo obtenido en la última ejecución"
+    )
+    ewma_yield = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="Promedio móvil exponencial de contenido nuevo por ejecución"
+    )
+
+    def __repr__(self):
+        return (
+            f"<CollectionSchedule(lineamiento_id={self.lineamiento_id}, "
+            f"plataforma='{self.plataforma}', interval={self.interval_minutes}min)>"
+        )
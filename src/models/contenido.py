@@ -115,6 +115,12 @@ class ContenidoRecolectado(Base):
         cascade="all, delete-orphan",
         passive_deletes=True
     )
+    lineamientos_coincidentes = relationship(
+        "ContenidoLineamiento",
+        back_populates="contenido",
+        cascade="all, delete-orphan",
+        passive_deletes=True
+    )
 
     def __repr__(self):
         return (
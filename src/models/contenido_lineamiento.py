@@ -0,0 +1,59 @@
+"""
+Modelo ContenidoLineamiento - Asociación N:M entre contenido y lineamientos
+"""
+
+from sqlalchemy import Column, DateTime, Text, ForeignKey, ARRAY, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import relationship
+
+from src.models.base import Base
+
+
+class ContenidoLineamiento(Base):
+    """
+    Modelo para asociar contenido recolectado con todos los lineamientos
+    cuyas keywords coinciden con su texto.
+
+    `ContenidoRecolectado.lineamiento_id` conserva el lineamiento que
+    originó la búsqueda; esta tabla permite que un mismo contenido cuente
+    para varios lineamientos con keywords compartidas.
+    """
+    __tablename__ = "contenido_lineamientos"
+    __table_args__ = (
+        {"comment": "Asociación entre contenido y lineamientos coincidentes"}
+    )
+
+    contenido_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("contenido_recolectado.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Referencia al contenido recolectado"
+    )
+    lineamiento_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("lineamientos.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Referencia al lineamiento coincidente"
+    )
+    keywords_coincidentes = Column(
+        ARRAY(Text),
+        comment="Keywords normalizadas del lineamiento encontradas en el texto"
+    )
+    asociado_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        comment="Fecha en que se asoció el contenido al lineamiento"
+    )
+
+    # Relaciones
+    contenido = relationship(
+        "ContenidoRecolectado",
+        back_populates="lineamientos_coincidentes"
+    )
+
+    def __repr__(self):
+        return (
+            f"<ContenidoLineamiento(contenido_id={self.contenido_id}, "
+            f"lineamiento_id={self.lineamiento_id})>"
+        )
@@ -0,0 +1,51 @@
+"""
+Modelo Coocurrencia - Índice de co-ocurrencia de términos por bucket de tiempo
+"""
+
+from sqlalchemy import Column, DateTime, Integer, Text
+
+from src.models.base import Base
+
+
+class Coocurrencia(Base):
+    """
+    Modelo para conteos de co-ocurrencia de pares de términos.
+
+    Cada fila cuenta cuántos temas mencionaron juntos dos términos
+    (keywords o entidades normalizadas) dentro de un bucket de tiempo.
+    Solo se guardan pares observados (matriz dispersa) y cada par se
+    guarda una vez, con `termino_a < termino_b`. Los conteos se
+    incrementan por lotes desde el pipeline NLP (ver `CooccurrenceIndex`).
+    """
+    __tablename__ = "coocurrencias"
+    __table_args__ = (
+        {"comment": "Conteos dispersos de co-ocurrencia de términos (hipertabla TimescaleDB)"}
+    )
+
+    bucket = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        comment="Inicio del bucket de tiempo (columna de tiempo de la hipertabla)"
+    )
+    termino_a = Column(
+        Text,
+        primary_key=True,
+        comment="Primer término del par (orden lexicográfico)"
+    )
+    termino_b = Column(
+        Text,
+        primary_key=True,
+        comment="Segundo término del par (orden lexicográfico)"
+    )
+    conteo = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Temas del bucket que mencionan ambos términos"
+    )
+
+    def __repr__(self):
+        return (
+            f"<Coocurrencia(bucket={self.bucket}, par=('{self.termino_a}', "
+            f"'{self.termino_b}'), conteo={self.conteo})>"
+        )
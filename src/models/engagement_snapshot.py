@@ -0,0 +1,63 @@
+"""
+Modelo EngagementSnapshot - Serie temporal de métricas de engagement
+"""
+
+from sqlalchemy import Column, DateTime, Integer, BigInteger, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+
+from src.models.base import Base
+
+
+class EngagementSnapshot(Base):
+    """
+    Modelo para mediciones periódicas de engagement de contenido.
+
+    `ContenidoRecolectado.metadata` guarda las métricas del momento de la
+    recolección; esta hipertabla guarda cada nueva medición del contenido
+    que sigue dentro de la ventana de tendencias, para calcular velocidad
+    de engagement. Las métricas se normalizan entre plataformas:
+
+    - views: reproducciones (solo YouTube)
+    - likes: likes (YouTube), score (Reddit), favourites (Mastodon)
+    - comments: comentarios / respuestas
+    - shares: reblogs (solo Mastodon)
+    """
+    __tablename__ = "engagement_snapshots"
+    __table_args__ = (
+        {"comment": "Mediciones periódicas de engagement (hipertabla TimescaleDB)"}
+    )
+
+    contenido_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("contenido_recolectado.id", ondelete="CASCADE"),
+        primary_key=True,
+        comment="Referencia al contenido medido"
+    )
+    tiempo = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        comment="Momento de la medición (columna de tiempo de la hipertabla)"
+    )
+
+    views = Column(
+        BigInteger,
+        comment="Reproducciones"
+    )
+    likes = Column(
+        Integer,
+        comment="Likes, score o favourites según plataforma"
+    )
+    comments = Column(
+        Integer,
+        comment="Comentarios o respuestas"
+    )
+    shares = Column(
+        Integer,
+        comment="Reblogs o compartidos"
+    )
+
+    def __repr__(self):
+        return (
+            f"<EngagementSnapshot(contenido_id={self.contenido_id}, tiempo={self.tiempo}, "
+            f"likes={self.likes})>"
+        )
@@ -0,0 +1,140 @@
+"""
+Ruteo de lecturas de la API a réplicas de PostgreSQL
+"""
+
+from typing import AsyncIterator, Dict, List, Sequence, Tuple
+from contextlib import asynccontextmanager
+import logging
+import time
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+
+from src.models.base import AsyncSessionLocal, async_database_url
+from src.utils.config import settings
+from src.utils.db_pool import engine_options, instrument_pool
+
+logger = logging.getLogger(__name__)
+
+# Segundos de retraso de la réplica (0 si ya aplicó todo lo recibido)
+LAG_QUERY = text(
+    """
+    SELECT CASE
+        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() THEN 0
+        ELSE COALESCE(EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()), 0)
+    END
+    """
+)
+
+
+class ReplicaRouter:
+    """
+    Elige la réplica de lectura para una sesión de la API.
+
+    Las réplicas se usan en round robin entre las que están al día: el
+    retraso de replicación de cada una se consulta como mucho cada
+    `check_seconds` y una réplica con más de `max_lag_seconds` de retraso,
+    o que no responde, queda fuera hasta la siguiente consulta. Sin
+    réplicas disponibles las lecturas van al primario.
+
+    Solo los endpoints de consulta usan el router; las escrituras
+    (LineamientoService, tareas Celery) y los endpoints en caché
+    (`cached_response`) siempre van al primario.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        max_lag_seconds: float,
+        check_seconds: float,
+    ):
+        """
+        Args:
+            engines: Engines asíncronos de las réplicas
+            max_lag_seconds: Retraso máximo tolerado
+            check_seconds: Intervalo mínimo entre consultas de retraso
+        """
+        self.engines = list(engines)
+        self.max_lag_seconds = max_lag_seconds
+        self.check_seconds = check_seconds
+        # Índice de réplica -> (momento de la consulta, disponible)
+        self._status: Dict[int, Tuple[float, bool]] = {}
+        self._next = 0
+
+    async def lag_seconds(self, engine: AsyncEngine) -> float:
+        """Retraso de replicación de una réplica"""
+        async with engine.connect() as conn:
+            return float(await conn.scalar(LAG_QUERY))
+
+    async def _available(self, index: int) -> bool:
+        checked_at, available = self._status.get(index, (None, False))
+        now = time.monotonic()
+        if checked_at is not None and now - checked_at < self.check_seconds:
+            return available
+
+        try:
+            lag = await self.lag_seconds(self.engines[index])
+            available = lag <= self.max_lag_seconds
+            if not available:
+                logger.warning(f"Réplica {index} con {lag:.1f}s de retraso, se usa el primario")
+        except Exception as e:
+            logger.warning(f"Réplica {index} no disponible: {e}")
+            available = False
+
+        self._status[index] = (now, available)
+        return available
+
+    async def pick(self) -> AsyncEngine | None:
+        """
+        Réplica para la próxima sesión de lectura.
+
+        Returns:
+            Engine de la réplica, o None si se debe usar el primario
+        """
+        for _ in range(len(self.engines)):
+            index = self._next % len(self.engines)
+            self._next += 1
+            if await self._available(index):
+                return self.engines[index]
+        return None
+
+
+def _replica_engines(urls: List[str]) -> List[AsyncEngine]:
+    engines = []
+    for i, url in enumerate(urls):
+        replica = create_async_engine(async_database_url(url), **engine_options(async_driver=True))
+        instrument_pool(replica.sync_engine, name=f"replica{i}")
+        engines.append(replica)
+    return engines
+
+
+# Instancia global
+replica_router = ReplicaRouter(
+    _replica_engines(settings.database_replica_urls),
+    max_lag_seconds=settings.database_replica_max_lag_seconds,
+    check_seconds=settings.database_replica_check_seconds,
+)
+
+
+@asynccontextmanager
+async def read_session() -> AsyncIterator[AsyncSession]:
+    """
+    Sesión de solo lectura en una réplica al día o, si no hay, en el primario.
+
+    Para lecturas que viven más que la request (respuestas por streaming).
+    """
+    replica = await replica_router.pick()
+    session = AsyncSessionLocal(bind=replica) if replica else AsyncSessionLocal()
+    async with session as db:
+        yield db
+
+
+async def get_read_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency para FastAPI con una sesión de solo lectura.
+
+    Usa una réplica al día si hay alguna configurada y, si no, el primario.
+    No usar para escrituras: usar `get_async_db`.
+    """
+    async with read_session() as db:
+        yield db
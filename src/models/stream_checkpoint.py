@@ -0,0 +1,41 @@
+"""
+Modelo StreamCheckpoint - Posición de consumidores de streaming
+"""
+
+from sqlalchemy import Column, String, DateTime, func
+
+from src.models.base import Base
+
+
+class StreamCheckpoint(Base):
+    """
+    Modelo para la última posición procesada por cada stream.
+
+    Permite que los consumidores continuos (Mastodon, Reddit) retomen
+    desde el último elemento guardado tras un reinicio o desconexión.
+    """
+    __tablename__ = "stream_checkpoints"
+    __table_args__ = (
+        {"comment": "Último elemento procesado por cada consumidor de streaming"}
+    )
+
+    stream_key = Column(
+        String(255),
+        primary_key=True,
+        comment="Identificador del stream (ej: mastodon:public, reddit:submissions)"
+    )
+    last_id = Column(
+        String(255),
+        nullable=False,
+        comment="ID en la plataforma del último elemento guardado"
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Fecha de la última actualización del checkpoint"
+    )
+
+    def __repr__(self):
+        return f"<StreamCheckpoint(stream_key='{self.stream_key}', last_id='{self.last_id}')>"
@@ -79,6 +79,12 @@ class TemaIdentificado(Base):
         server_default=func.now(),
         comment="Fecha en que se identificó el tema"
     )
+    coocurrencia_indexada = Column(
+        Boolean,
+        nullable=False,
+        default=False,
+        comment="Indica si keywords y entidades ya se sumaron al índice de co-ocurrencias"
+    )
 
     # Relaciones
     contenido = relationship(
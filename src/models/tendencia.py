@@ -3,7 +3,7 @@ Modelo Tendencia - Datos de series temporales para temas en tendencia
 """
 
 import uuid
-from sqlalchemy import Column, String, Boolean, DateTime, Integer, Float, Text, ForeignKey, PrimaryKeyConstraint, func
+from sqlalchemy import Column, String, Boolean, DateTime, Integer, BigInteger, Float, Text, ForeignKey, PrimaryKeyConstraint, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 
@@ -63,6 +63,34 @@ class Tendencia(Base):
         Float,
         comment="Tasa de crecimiento comparada con período anterior"
     )
+    sentimiento_promedio = Column(
+        Float,
+        comment="Sentimiento promedio del segmento (-1 a 1)"
+    )
+    engagement_total = Column(
+        BigInteger,
+        comment="Engagement sumado del contenido del segmento"
+    )
+    autores_unicos = Column(
+        Integer,
+        comment="Autores distintos que mencionaron el tema en el segmento"
+    )
+    puntuacion = Column(
+        Float,
+        comment="Puntuación de tendencia ponderada por engagement"
+    )
+    puntuacion_z = Column(
+        Float,
+        comment="Z-score de la puntuación respecto del resto de segmentos del análisis"
+    )
+    pico_z = Column(
+        Float,
+        comment="Z-score de menciones respecto de la línea base del segmento"
+    )
+    pico_pvalor = Column(
+        Float,
+        comment="Probabilidad Poisson de observar al menos estas menciones según la línea base"
+    )
 
     # Segmentación (para API jerárquica FR-017)
     plataforma = Column(
@@ -0,0 +1,80 @@
+"""
+Modelo TrendBaseline - Línea base móvil de menciones por segmento
+"""
+
+from sqlalchemy import Column, String, DateTime, Integer, Float, func
+
+from src.models.base import Base
+
+
+class TrendBaseline(Base):
+    """
+    Modelo para la línea base de menciones por hora de cada segmento.
+
+    Guarda la media y varianza móviles exponenciales (EWMA) de las
+    menciones por análisis de cada segmento (tema × plataforma × ubicación
+    × edad × género). Se actualiza incrementalmente en cada análisis en
+    lugar de recalcularse desde el historial.
+    """
+    __tablename__ = "trend_baselines"
+    __table_args__ = (
+        {"comment": "Media y varianza móviles de menciones por segmento (detección de picos)"}
+    )
+
+    tema_nombre = Column(
+        String(255),
+        primary_key=True,
+        comment="Nombre del tema"
+    )
+    plataforma = Column(
+        String(50),
+        primary_key=True,
+        comment="Plataforma: youtube, reddit, mastodon"
+    )
+    ubicacion = Column(
+        String(100),
+        primary_key=True,
+        comment="Ubicación geográfica del segmento"
+    )
+    edad_rango = Column(
+        String(20),
+        primary_key=True,
+        comment="Rango de edad del segmento"
+    )
+    genero = Column(
+        String(20),
+        primary_key=True,
+        comment="Género del segmento"
+    )
+
+    ewma_mean = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="Media móvil exponencial de menciones por análisis"
+    )
+    ewma_var = Column(
+        Float,
+        nullable=False,
+        default=0.0,
+        comment="Varianza móvil exponencial de menciones por análisis"
+    )
+    runs = Column(
+        Integer,
+        nullable=False,
+        default=0,
+        comment="Análisis incorporados a la línea base"
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+        comment="Fecha de la última actualización"
+    )
+
+    def __repr__(self):
+        return (
+            f"<TrendBaseline(tema='{self.tema_nombre}', plataforma='{self.plataforma}', "
+            f"ewma_mean={self.ewma_mean:.2f})>"
+        )
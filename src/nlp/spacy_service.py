@@ -8,6 +8,7 @@ import spacy
 from spacy.language import Language
 
 from src.utils.config import settings
+from src.utils.language_detector import language_detector
 
 logger = logging.getLogger(__name__)
 
@@ -188,7 +189,8 @@ class SpacyService:
         """
         Verifica si un texto está en español.
 
-        Usa una heurística simple basada en palabras en español.
+        Usa el detector de n-gramas de caracteres, sin ejecutar el
+        pipeline de spaCy.
 
         Args:
             texto: Texto a verificar
@@ -197,22 +199,9 @@ class SpacyService:
         Returns:
             True si el texto parece estar en español
         """
-        doc = self.nlp(texto)
-
-        if len(doc) == 0:
-            return False
-
-        # Contar tokens que no son stopwords en español
-        spanish_tokens = sum(1 for token in doc if token.is_alpha)
-
-        if spanish_tokens == 0:
-            return False
-
-        # Calcular proporción de tokens reconocidos
-        recognized = sum(1 for token in doc if not token.is_oov)
-        confidence = recognized / spanish_tokens if spanish_tokens > 0 else 0
+        idioma, confidence = language_detector.detect(texto)
 
-        return confidence >= min_confidence
+        return idioma == "es" and confidence >= min_confidence
 
 
 # Instancia global
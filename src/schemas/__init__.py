@@ -15,6 +15,10 @@ from src.schemas.tendencia import (
     TendenciaJerarquica,
     TendenciaJerarquicaResponse,
 )
+from src.schemas.contenido import (
+    ContenidoBusquedaItem,
+    ContenidoBusquedaResponse,
+)
 
 __all__ = [
     "LineamientoCreate",
@@ -26,4 +30,6 @@ __all__ = [
     "TendenciaAgregada",
     "TendenciaJerarquica",
     "TendenciaJerarquicaResponse",
+    "ContenidoBusquedaItem",
+    "ContenidoBusquedaResponse",
 ]
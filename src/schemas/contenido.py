@@ -0,0 +1,31 @@
+"""
+Schemas Pydantic para búsqueda de Contenido
+"""
+
+from pydantic import BaseModel, Field
+from typing import List
+from uuid import UUID
+from datetime import datetime
+
+
+class ContenidoBusquedaItem(BaseModel):
+    """Schema para un contenido encontrado por búsqueda de texto"""
+    id: UUID = Field(..., description="ID del contenido")
+    lineamiento_id: UUID = Field(..., description="Lineamiento que recolectó el contenido")
+    plataforma: str = Field(..., description="Plataforma de origen")
+    titulo: str | None = Field(None, description="Título del contenido")
+    autor: str | None = Field(None, description="Autor del contenido")
+    url: str | None = Field(None, description="URL del contenido original")
+    fecha_publicacion: datetime = Field(..., description="Fecha de publicación")
+    relevancia: float = Field(..., description="ts_rank del contenido para la búsqueda")
+    fragmento: str = Field(
+        ..., description="Extracto en HTML escapado con los términos marcados con <mark>"
+    )
+
+
+class ContenidoBusquedaResponse(BaseModel):
+    """Schema para una página de resultados de búsqueda"""
+    items: List[ContenidoBusquedaItem] = Field(..., description="Resultados por relevancia")
+    next_cursor: str | None = Field(
+        None, description="Cursor de la página siguiente (None si no hay más)"
+    )
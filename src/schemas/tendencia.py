@@ -3,7 +3,7 @@ Schemas Pydantic para Tendencias
 """
 
 from pydantic import BaseModel, Field
-from typing import List, Dict, Any
+from typing import List
 from uuid import UUID
 from datetime import datetime
 
@@ -28,6 +28,10 @@ class TendenciaResponse(TendenciaBase):
     fecha_hora: datetime = Field(..., description="Fecha y hora de la tendencia")
     keywords: List[str] = Field(default=[], description="Keywords del tema")
     validada: bool | None = Field(None, description="Si fue validada con Google Trends")
+    engagement_total: int | None = Field(None, description="Engagement sumado del segmento")
+    autores_unicos: int | None = Field(None, description="Autores distintos del segmento")
+    puntuacion: float | None = Field(None, description="Puntuación ponderada por engagement")
+    puntuacion_z: float | None = Field(None, description="Z-score de la puntuación")
 
     class Config:
         from_attributes = True
@@ -42,12 +46,42 @@ class TendenciaAgregada(BaseModel):
     sentimiento_promedio: float = Field(..., description="Sentimiento promedio")
     keywords: List[str] = Field(..., description="Keywords del tema")
     ubicaciones: List[str] = Field(..., description="Ubicaciones donde es tendencia")
+    autores_unicos: int | None = Field(
+        None, description="Autores distintos en todas las plataformas y ubicaciones (aproximado)"
+    )
+
+
+class TemaSegmento(BaseModel):
+    """Schema para un tema dentro de un segmento demográfico"""
+    tema_nombre: str = Field(..., description="Nombre del tema")
+    volumen: int = Field(..., ge=0, description="Número de menciones")
+    crecimiento: float | None = Field(None, description="Tasa de crecimiento")
+    sentimiento: float | None = Field(None, description="Sentimiento promedio")
+    keywords: List[str] = Field(default=[], description="Keywords del tema")
+
+
+class TendenciaGenero(BaseModel):
+    """Schema para el nivel de género de la jerarquía"""
+    genero: str | None = Field(None, description="Género")
+    temas: List[TemaSegmento] = Field(..., description="Temas en tendencia del segmento")
+
+
+class TendenciaEdad(BaseModel):
+    """Schema para el nivel de rango de edad de la jerarquía"""
+    edad_rango: str | None = Field(None, description="Rango de edad")
+    generos: List[TendenciaGenero] = Field(..., description="Datos por género")
+
+
+class TendenciaUbicacion(BaseModel):
+    """Schema para el nivel de ubicación de la jerarquía"""
+    ubicacion: str = Field(..., description="Ubicación geográfica")
+    edades: List[TendenciaEdad] = Field(..., description="Datos por rango de edad")
 
 
 class TendenciaJerarquica(BaseModel):
     """Schema para respuesta jerárquica de tendencias"""
     plataforma: str = Field(..., description="Plataforma")
-    ubicaciones: List[Dict[str, Any]] = Field(..., description="Datos por ubicación")
+    ubicaciones: List[TendenciaUbicacion] = Field(..., description="Datos por ubicación")
 
 
 class TendenciaListResponse(BaseModel):
@@ -60,3 +94,35 @@ class TendenciaJerarquicaResponse(BaseModel):
     """Schema para respuesta jerárquica"""
     total_tendencias: int = Field(..., ge=0)
     plataformas: List[TendenciaJerarquica] = Field(...)
+
+
+class TerminoTendencia(BaseModel):
+    """Schema para un término en tendencia en tiempo real"""
+    termino: str = Field(..., description="Keyword normalizada")
+    menciones: int = Field(..., ge=0, description="Menciones estimadas en la ventana actual")
+    menciones_previas: int = Field(..., ge=0, description="Menciones estimadas en ventana anterior")
+    crecimiento: float = Field(..., description="Tasa de crecimiento entre ventanas")
+
+
+class TrendingNowResponse(BaseModel):
+    """Schema para respuesta de tendencias en tiempo real"""
+    ventana_minutos: int = Field(..., ge=1, description="Duración de la ventana")
+    plataforma: str | None = Field(None, description="Plataforma filtrada")
+    ubicacion: str | None = Field(None, description="Ubicación filtrada")
+    items: List[TerminoTendencia] = Field(..., description="Términos ordenados por aumento")
+
+
+class TerminoEmergente(BaseModel):
+    """Schema para un término con vecindario de co-ocurrencia en expansión"""
+    termino: str = Field(..., description="Keyword o entidad normalizada")
+    vecinos: int = Field(..., ge=0, description="Términos co-ocurrentes en la ventana actual")
+    vecinos_previos: int = Field(..., ge=0, description="Términos co-ocurrentes en ventana anterior")
+    vecinos_nuevos: int = Field(..., ge=0, description="Vecinos ausentes en la ventana anterior")
+    coocurrencias: int = Field(..., ge=0, description="Co-ocurrencias totales en la ventana actual")
+    expansion: float = Field(..., ge=0.0, description="Vecinos nuevos / vecindario anterior")
+
+
+class TerminosEmergentesResponse(BaseModel):
+    """Schema para respuesta de términos emergentes"""
+    ventana_horas: int = Field(..., ge=1, description="Duración de cada ventana comparada")
+    items: List[TerminoEmergente] = Field(..., description="Términos ordenados por vecinos nuevos")
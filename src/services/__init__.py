@@ -3,7 +3,9 @@ Servicios de lógica de negocio
 """
 
 from src.services.lineamiento_service import LineamientoService
+from src.services.lineamiento_matcher import LineamientoMatcherService
 
 __all__ = [
     "LineamientoService",
+    "LineamientoMatcherService",
 ]
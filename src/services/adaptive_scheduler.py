@@ -0,0 +1,253 @@
+"""
+Programación adaptativa de recolección por lineamiento y plataforma
+"""
+
+from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import logging
+
+from sqlalchemy.orm import Session
+
+from src.models.collection_schedule import CollectionSchedule
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveScheduler:
+    """
+    Ajusta el intervalo de polling de cada par (lineamiento, plataforma)
+    según el contenido nuevo que obtuvo en ejecuciones recientes.
+
+    Política:
+    - Ejecución sin contenido nuevo: backoff exponencial
+      (intervalo × `collection_backoff_factor`)
+    - Promedio móvil ≥ `collection_hot_yield`: polling más rápido
+      (intervalo ÷ `collection_backoff_factor`)
+    - En otro caso: vuelve al intervalo base
+
+    El intervalo siempre queda entre `collection_min_interval_minutes` y
+    `collection_max_interval_minutes`.
+    """
+
+    @staticmethod
+    def next_interval(current: int, new_items: int, ewma_yield: float) -> int:
+        """
+        Calcula el próximo intervalo de polling.
+
+        Args:
+            current: Intervalo actual en minutos
+            new_items: Contenido nuevo de la última ejecución
+            ewma_yield: Promedio móvil exponencial ya actualizado
+
+        Returns:
+            Intervalo en minutos dentro de los límites configurados
+        """
+        factor = settings.collection_backoff_factor
+
+        if new_items == 0:
+            interval = current * factor
+        elif ewma_yield >= settings.collection_hot_yield:
+            interval = current / factor
+        else:
+            interval = settings.collection_base_interval_minutes
+
+        return int(
+            min(
+                max(round(interval), settings.collection_min_interval_minutes),
+                settings.collection_max_interval_minutes,
+            )
+        )
+
+    @staticmethod
+    def update_ewma(previous: float, new_items: int, first_run: bool) -> float:
+        """
+        Actualiza el promedio móvil exponencial de rendimiento.
+
+        Args:
+            previous: Promedio anterior
+            new_items: Contenido nuevo de la última ejecución
+            first_run: True si es la primera ejecución registrada
+
+        Returns:
+            Promedio actualizado
+        """
+        if first_run:
+            return float(new_items)
+        alpha = settings.collection_yield_alpha
+        return alpha * new_items + (1 - alpha) * previous
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def due_pairs(
+        self,
+        db: Session,
+        lineamientos: Sequence,
+        now: datetime | None = None,
+    ) -> Set[Tuple[str, str]]:
+        """
+        Retorna los pares (lineamiento_id, plataforma) que deben recolectarse.
+
+        Los pares sin historial siempre están pendientes.
+
+        Args:
+            db: Sesión de SQLAlchemy
+            lineamientos: Lineamientos activos
+            now: Momento de referencia (por defecto ahora, UTC)
+
+        Returns:
+            Conjunto de pares pendientes (IDs como string)
+        """
+        now = now or self._now()
+        ids = [lineamiento.id for lineamiento in lineamientos]
+        if not ids:
+            return set()
+
+        schedules = {
+            (str(row.lineamiento_id), row.plataforma): row
+            for row in db.query(CollectionSchedule).filter(
+                CollectionSchedule.lineamiento_id.in_(ids)
+            )
+        }
+
+        due = set()
+        for lineamiento in lineamientos:
+            for plataforma in lineamiento.plataformas or []:
+                key = (str(lineamiento.id), plataforma)
+                row = schedules.get(key)
+                if row is None or row.next_run_at <= now:
+                    due.add(key)
+
+        return due
+
+    def mark_dispatched(
+        self,
+        db: Session,
+        pairs: Iterable[Tuple[str, str]],
+        now: datetime | None = None,
+    ) -> None:
+        """
+        Reprograma pares despachados para no repetirlos en el próximo tick.
+
+        El resultado de la recolección (`record_yields`) vuelve a
+        reprogramarlos con el intervalo ajustado. No hace commit.
+
+        Args:
+            db: Sesión de SQLAlchemy
+            pairs: Pares (lineamiento_id, plataforma) despachados
+            now: Momento de referencia (por defecto ahora, UTC)
+        """
+        now = now or self._now()
+
+        for lineamiento_id, plataforma in pairs:
+            row = db.get(CollectionSchedule, (UUID(lineamiento_id), plataforma))
+            if row is None:
+                row = CollectionSchedule(
+                    lineamiento_id=UUID(lineamiento_id),
+                    plataforma=plataforma,
+                    interval_minutes=settings.collection_base_interval_minutes,
+                    last_yield=0,
+                    ewma_yield=0.0,
+                )
+                db.add(row)
+            row.next_run_at = now + timedelta(minutes=row.interval_minutes)
+
+    @staticmethod
+    def aggregate_yields(results: Iterable[Dict[str, Any]]) -> Dict[str, Dict[UUID, int]]:
+        """
+        Suma el rendimiento de las queries de un ciclo por plataforma y lineamiento.
+
+        Con queries combinadas un lineamiento aparece en varias queries del
+        mismo ciclo; registrar cada una por separado avanzaría el promedio
+        varias veces y el resultado dependería de cuál termina última (una
+        query sin resultados para él lo mandaría a backoff).
+
+        Args:
+            results: Resultados de las queries (`platform` y `yields` con IDs string)
+
+        Returns:
+            Dict plataforma -> {lineamiento_id: contenido nuevo}
+        """
+        aggregated: Dict[str, Dict[UUID, int]] = {}
+        for result in results:
+            if not result or "yields" not in result:
+                continue
+            yields = aggregated.setdefault(result["platform"], {})
+            for lineamiento_id, new_items in result["yields"].items():
+                key = UUID(lineamiento_id)
+                yields[key] = yields.get(key, 0) + new_items
+        return aggregated
+
+    def record_yields(
+        self,
+        db: Session,
+        plataforma: str,
+        yields: Dict[UUID, int],
+        now: datetime | None = None,
+    ) -> List[CollectionSchedule]:
+        """
+        Registra el contenido nuevo obtenido por cada lineamiento y ajusta
+        su intervalo (un paso por llamada: para un ciclo con varias queries,
+        sumar antes con `aggregate_yields`). No hace commit.
+
+        Args:
+            db: Sesión de SQLAlchemy
+            plataforma: Plataforma recolectada
+            yields: Dict lineamiento_id -> contenido nuevo
+            now: Momento de referencia (por defecto ahora, UTC)
+
+        Returns:
+            Filas de programación actualizadas
+        """
+        if not yields:
+            return []
+
+        now = now or self._now()
+
+        # Bloquear filas: varias queries pueden cubrir el mismo lineamiento
+        rows = {
+            row.lineamiento_id: row
+            for row in db.query(CollectionSchedule)
+            .filter(
+                CollectionSchedule.plataforma == plataforma,
+                CollectionSchedule.lineamiento_id.in_(list(yields)),
+            )
+            .with_for_update()
+        }
+
+        updated = []
+        for lineamiento_id, new_items in yields.items():
+            row = rows.get(lineamiento_id)
+            if row is None:
+                row = CollectionSchedule(
+                    lineamiento_id=lineamiento_id,
+                    plataforma=plataforma,
+                    interval_minutes=settings.collection_base_interval_minutes,
+                    ewma_yield=0.0,
+                )
+                db.add(row)
+
+            row.ewma_yield = self.update_ewma(
+                row.ewma_yield or 0.0, new_items, first_run=row.last_run_at is None
+            )
+            row.interval_minutes = self.next_interval(
+                row.interval_minutes, new_items, row.ewma_yield
+            )
+            row.last_yield = new_items
+            row.last_run_at = now
+            row.next_run_at = now + timedelta(minutes=row.interval_minutes)
+            updated.append(row)
+
+            logger.debug(
+                f"Programación {plataforma}/{lineamiento_id}: nuevos={new_items}, "
+                f"ewma={row.ewma_yield:.1f}, intervalo={row.interval_minutes}min"
+            )
+
+        return updated
+
+
+# Instancia global
+adaptive_scheduler = AdaptiveScheduler()
@@ -0,0 +1,129 @@
+"""
+Autores únicos por segmento con HyperLogLog en Redis
+"""
+
+from typing import Iterable, List, Sequence, Tuple
+from datetime import datetime, timedelta, timezone
+import logging
+
+import numpy as np
+import redis
+
+from src.utils.config import settings
+from src.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+# (tema_nombre, plataforma, ubicacion, edad_rango, genero)
+Segment = Tuple[str, str, str, str, str]
+
+_HOUR = 3600
+
+
+class AuthorSketches:
+    """
+    Cuenta autores distintos por segmento y hora con HyperLogLog.
+
+    Cada hora de cada segmento es una clave Redis (PFADD), de a lo sumo
+    12 KB y con error estándar de ~0.81%. Los sketches se combinan sin
+    perder precisión: PFCOUNT sobre varias claves cuenta la unión, de modo
+    que un rango de horas o varias plataformas se cuentan sin volver a
+    leer el contenido. Las claves expiran tras
+    `author_sketch_retention_hours`.
+
+    La resolución es horaria: un rango se amplía a las horas completas
+    que toca.
+    """
+
+    PREFIX = "trends:authors"
+
+    def __init__(self, client: redis.Redis | None = None):
+        """
+        Args:
+            client: Cliente Redis. Si None, usa el cliente compartido
+        """
+        self._client = client
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = get_redis()
+        return self._client
+
+    @staticmethod
+    def _hour(moment: datetime) -> int:
+        return int(moment.timestamp() // _HOUR)
+
+    def key(self, segment: Sequence[str], hour: int) -> str:
+        """Clave del sketch de un segmento en una hora (epoch / 3600)"""
+        return f"{self.PREFIX}:{'|'.join(segment)}:{hour}"
+
+    def keys(self, segment: Sequence[str], start: datetime, end: datetime) -> List[str]:
+        """Claves de las horas que cubren [start, end)"""
+        first = self._hour(start)
+        last = max(first, self._hour(end - timedelta(microseconds=1)))
+        return [self.key(segment, hour) for hour in range(first, last + 1)]
+
+    def record(
+        self,
+        segment: Segment,
+        autor: str,
+        moment: datetime | None = None,
+    ) -> None:
+        """
+        Agrega un autor al sketch de la hora del segmento.
+
+        Args:
+            segment: Segmento de tendencia
+            autor: Identificador del autor en la plataforma
+            moment: Momento de la mención. Si None, usa la hora actual
+        """
+        key = self.key(segment, self._hour(moment or datetime.now(timezone.utc)))
+
+        pipe = self.client.pipeline(transaction=False)
+        pipe.pfadd(key, autor)
+        pipe.expire(key, settings.author_sketch_retention_hours * _HOUR)
+        pipe.execute()
+
+    def count(
+        self,
+        segments: Sequence[Segment],
+        start: datetime,
+        end: datetime,
+    ) -> np.ndarray:
+        """
+        Autores únicos de cada segmento en el rango.
+
+        Un solo round trip (pipeline) con un PFCOUNT por segmento.
+
+        Returns:
+            Array alineado con `segments`
+        """
+        if not segments:
+            return np.zeros(0)
+
+        pipe = self.client.pipeline(transaction=False)
+        for segment in segments:
+            pipe.pfcount(*self.keys(segment, start, end))
+
+        return np.fromiter(pipe.execute(), dtype=np.float64, count=len(segments))
+
+    def count_union(
+        self,
+        segments: Iterable[Segment],
+        start: datetime,
+        end: datetime,
+    ) -> int:
+        """
+        Autores únicos de la unión de varios segmentos en el rango.
+
+        Un autor presente en varios segmentos u horas se cuenta una vez.
+        """
+        keys = sorted({key for segment in segments for key in self.keys(segment, start, end)})
+        if not keys:
+            return 0
+        return int(self.client.pfcount(*keys))
+
+
+# Instancia global
+author_sketches = AuthorSketches()
@@ -0,0 +1,248 @@
+"""
+Detección de picos de menciones sobre líneas base móviles
+"""
+
+from typing import Dict, List, Tuple
+from dataclasses import dataclass
+import math
+import logging
+
+import numpy as np
+from sqlalchemy import delete, func, tuple_
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.trend_baseline import TrendBaseline
+from src.services.trend_scoring import SegmentFeatures, SegmentKey
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+_lgamma = np.vectorize(math.lgamma, otypes=[np.float64])
+_erfc = np.vectorize(math.erfc, otypes=[np.float64])
+
+# Media mínima (un segmento sin historial no tiene media 0)
+_MIN_LAMBDA = 0.1
+# A partir de esta media se usa la aproximación normal
+_NORMAL_LAMBDA = 50.0
+# Con media < 50 y k > media la serie converge en pocos términos
+_SERIES_TERMS = 200
+
+
+def poisson_sf(k: np.ndarray, lam: np.ndarray) -> np.ndarray:
+    """
+    Probabilidad de cola superior Poisson P(X >= k) con media `lam`.
+
+    Para medias pequeñas suma la serie exacta desde k; para medias grandes
+    usa la aproximación normal con corrección de continuidad. Cuando k no
+    supera la media la cola no es informativa y se retorna 1.0.
+
+    Args:
+        k: Conteos observados
+        lam: Medias esperadas
+
+    Returns:
+        Array de probabilidades
+    """
+    k = np.asarray(k, dtype=np.float64)
+    lam = np.maximum(np.asarray(lam, dtype=np.float64), _MIN_LAMBDA)
+    result = np.ones_like(k)
+
+    exact = (k > lam) & (lam < _NORMAL_LAMBDA)
+    if exact.any():
+        ks, ls = k[exact], lam[exact]
+        # pmf(k) en escala log y suma de la serie pmf(k+j)/pmf(k)
+        pmf = np.exp(-ls + ks * np.log(ls) - _lgamma(ks + 1))
+        term = np.ones_like(ks)
+        total = np.ones_like(ks)
+        for j in range(1, _SERIES_TERMS):
+            term = term * ls / (ks + j)
+            total += term
+        result[exact] = np.minimum(pmf * total, 1.0)
+
+    normal = (k > lam) & ~exact
+    if normal.any():
+        ks, ls = k[normal], lam[normal]
+        result[normal] = 0.5 * _erfc((ks - 0.5 - ls) / np.sqrt(2 * ls))
+
+    return result
+
+
+@dataclass
+class BurstResult:
+    """Resultado de la detección, alineado con `SegmentFeatures.keys`"""
+
+    zscore: np.ndarray
+    pvalue: np.ndarray
+    es_pico: np.ndarray
+    # Segmentos con suficiente historial para confiar en la línea base
+    warm: np.ndarray
+
+
+class BurstDetector:
+    """
+    Detecta picos de menciones por segmento con líneas base EWMA.
+
+    Cada análisis compara las menciones del segmento con su media y
+    varianza móviles (`trend_baselines`) y después incorpora la nueva
+    observación. Los segmentos de la línea base sin menciones en el
+    análisis se actualizan con 0, y se eliminan cuando su media cae por
+    debajo de `PRUNE_MEAN`.
+
+    Un segmento es pico si su z-score supera `burst_zscore_threshold` o su
+    probabilidad Poisson de cola es menor a `burst_pvalue_threshold`. La
+    desviación usada en el z-score nunca es menor a sqrt(max(media, 1)),
+    de modo que pasar de 0 a 2 menciones no se considera pico.
+    """
+
+    PRUNE_MEAN = 0.05
+
+    @staticmethod
+    def update_ewma(
+        mean: np.ndarray,
+        var: np.ndarray,
+        observed: np.ndarray,
+        runs: np.ndarray,
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Incorpora una observación a la media y varianza móviles.
+
+        La primera observación de un segmento inicializa la media.
+
+        Returns:
+            Tupla (media, varianza) actualizadas
+        """
+        alpha = settings.burst_ewma_alpha
+        diff = observed - mean
+        increment = alpha * diff
+        new_mean = np.where(runs == 0, observed, mean + increment)
+        new_var = np.where(runs == 0, 0.0, (1 - alpha) * (var + diff * increment))
+        return new_mean, new_var
+
+    @staticmethod
+    def evaluate(
+        observed: np.ndarray,
+        mean: np.ndarray,
+        var: np.ndarray,
+        runs: np.ndarray,
+    ) -> BurstResult:
+        """
+        Compara menciones observadas con la línea base (antes de actualizarla).
+
+        Returns:
+            Z-score, probabilidad Poisson, marca de pico y de historial suficiente
+        """
+        std = np.sqrt(np.maximum(var, np.maximum(mean, 1.0)))
+        zscore = (observed - mean) / std
+        pvalue = poisson_sf(observed, mean)
+        warm = runs >= settings.burst_warmup_runs
+
+        es_pico = warm & (
+            (zscore >= settings.burst_zscore_threshold)
+            | (pvalue <= settings.burst_pvalue_threshold)
+        )
+        return BurstResult(zscore=zscore, pvalue=pvalue, es_pico=es_pico, warm=warm)
+
+    @staticmethod
+    def _key_columns():
+        return (
+            TrendBaseline.tema_nombre,
+            TrendBaseline.plataforma,
+            TrendBaseline.ubicacion,
+            TrendBaseline.edad_rango,
+            TrendBaseline.genero,
+        )
+
+    def detect(self, db: Session, features: SegmentFeatures) -> BurstResult:
+        """
+        Evalúa los segmentos del análisis y actualiza las líneas base.
+
+        No hace commit.
+
+        Args:
+            db: Sesión de base de datos
+            features: Features del análisis actual
+
+        Returns:
+            Resultado alineado con `features.keys`
+        """
+        baselines: Dict[SegmentKey, Tuple[float, float, int]] = {
+            tuple(row[:5]): (row[5], row[6], row[7])
+            for row in db.query(
+                *self._key_columns(),
+                TrendBaseline.ewma_mean,
+                TrendBaseline.ewma_var,
+                TrendBaseline.runs,
+            )
+        }
+
+        # Segmentos del análisis primero, luego los que no tuvieron menciones
+        current = set(features.keys)
+        keys: List[SegmentKey] = list(features.keys) + [
+            key for key in baselines if key not in current
+        ]
+        n_current = len(features)
+
+        observed = np.zeros(len(keys))
+        observed[:n_current] = features.mentions
+
+        state = np.array(
+            [baselines.get(key, (0.0, 0.0, 0)) for key in keys], dtype=np.float64
+        ).reshape(len(keys), 3)
+        mean, var, runs = state[:, 0], state[:, 1], state[:, 2]
+
+        result = self.evaluate(
+            observed[:n_current], mean[:n_current], var[:n_current], runs[:n_current]
+        )
+
+        new_mean, new_var = self.update_ewma(mean, var, observed, runs)
+        new_runs = runs + 1
+
+        keep = (new_mean >= self.PRUNE_MEAN) | (np.arange(len(keys)) < n_current)
+        rows = [
+            {
+                "tema_nombre": key[0],
+                "plataforma": key[1],
+                "ubicacion": key[2],
+                "edad_rango": key[3],
+                "genero": key[4],
+                "ewma_mean": float(new_mean[i]),
+                "ewma_var": float(new_var[i]),
+                "runs": int(new_runs[i]),
+            }
+            for i, key in enumerate(keys)
+            if keep[i]
+        ]
+        pruned = [key for i, key in enumerate(keys) if not keep[i]]
+
+        if rows:
+            stmt = insert(TrendBaseline)
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[column.key for column in self._key_columns()],
+                    set_={
+                        "ewma_mean": stmt.excluded.ewma_mean,
+                        "ewma_var": stmt.excluded.ewma_var,
+                        "runs": stmt.excluded.runs,
+                        "updated_at": func.now(),
+                    },
+                ),
+                rows,
+            )
+
+        for i in range(0, len(pruned), 1000):
+            db.execute(
+                delete(TrendBaseline).where(
+                    tuple_(*self._key_columns()).in_(pruned[i : i + 1000])
+                )
+            )
+
+        logger.info(
+            f"Líneas base actualizadas: {len(rows)}, eliminadas: {len(pruned)}, "
+            f"picos: {int(result.es_pico.sum())}"
+        )
+        return result
+
+
+# Instancia global
+burst_detector = BurstDetector()
@@ -0,0 +1,277 @@
+"""
+Planificador de queries de recolección por ciclo
+"""
+
+from typing import Any, Dict, List, Sequence, Set, Tuple
+from dataclasses import dataclass, field
+import logging
+
+from src.utils.config import settings
+from src.utils.keyword_matcher import normalize_keyword
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PlannedQuery:
+    """
+    Query a ejecutar en una plataforma durante un ciclo de recolección.
+
+    Los resultados se reparten entre `lineamiento_ids` por matching local
+    de keywords (ver `LineamientoMatcherService`).
+    """
+
+    plataforma: str
+    keywords: List[str]
+    lineamiento_ids: List[str]
+    max_results: int
+    estimated_units: int
+
+    @property
+    def query(self) -> str:
+        """Query tal como la construye el collector de la plataforma"""
+        separator = " " if self.plataforma == "mastodon" else " OR "
+        return separator.join(self.keywords)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serializa la query para logs y resultados de tareas"""
+        return {
+            "plataforma": self.plataforma,
+            "keywords": self.keywords,
+            "lineamiento_ids": self.lineamiento_ids,
+            "max_results": self.max_results,
+            "estimated_units": self.estimated_units,
+        }
+
+
+@dataclass
+class CollectionPlan:
+    """Plan de recolección de un ciclo con su costo estimado de cuota"""
+
+    queries: List[PlannedQuery] = field(default_factory=list)
+    # Costo que tendría el esquema anterior (una query por lineamiento y plataforma)
+    naive_units: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def estimated_units(self) -> Dict[str, int]:
+        """Unidades de cuota estimadas por plataforma"""
+        units: Dict[str, int] = {}
+        for query in self.queries:
+            units[query.plataforma] = units.get(query.plataforma, 0) + query.estimated_units
+        return units
+
+    def summary(self) -> Dict[str, Any]:
+        """Resumen del plan para logs y resultados de tareas"""
+        queries_por_plataforma: Dict[str, int] = {}
+        for query in self.queries:
+            queries_por_plataforma[query.plataforma] = (
+                queries_por_plataforma.get(query.plataforma, 0) + 1
+            )
+
+        return {
+            "total_queries": len(self.queries),
+            "queries_por_plataforma": queries_por_plataforma,
+            "estimated_units": self.estimated_units,
+            "naive_units": self.naive_units,
+        }
+
+
+class CollectionPlanner:
+    """
+    Construye el plan de queries de un ciclo de recolección.
+
+    - Canonicaliza keywords (`normalize_keyword`) de todos los lineamientos
+      activos, de modo que "IA", "ia" e "#IA" se buscan una sola vez.
+    - YouTube y Reddit interpretan `OR`: las keywords de varios
+      lineamientos se combinan en una query hasta el límite de longitud
+      de cada plataforma.
+    - Mastodon busca todas las palabras (AND): solo se deduplican
+      lineamientos con el mismo conjunto de keywords.
+    """
+
+    # Resultados por query (YouTube pagina hasta youtube_max_results_per_query)
+    MAX_RESULTS = {"youtube": 50, "reddit": 100, "mastodon": 40}
+
+    # Costo por página de 50 videos: search.list (100) + videos.list (1)
+    YOUTUBE_PAGE_UNITS = 101
+
+    OR_SEPARATOR = " OR "
+
+    def _max_query_length(self, plataforma: str) -> int:
+        """Longitud máxima de query combinada para la plataforma"""
+        if plataforma == "youtube":
+            return settings.youtube_max_query_length
+        return settings.reddit_max_query_length
+
+    def _max_results(self, plataforma: str) -> int:
+        """Resultados máximos por query para la plataforma"""
+        if plataforma == "youtube":
+            return settings.youtube_max_results_per_query
+        return self.MAX_RESULTS[plataforma]
+
+    def _estimate_units(self, plataforma: str, max_results: int) -> int:
+        """Estima unidades de cuota de una query (peor caso)"""
+        if plataforma == "youtube":
+            pages = max(1, -(-max_results // 50))
+            return min(
+                pages * self.YOUTUBE_PAGE_UNITS, settings.youtube_units_budget_per_query
+            )
+        if plataforma == "reddit":
+            # Reddit pagina de 100 en 100 resultados
+            return max(1, -(-max_results // 100))
+        return 1
+
+    @staticmethod
+    def _canonical_keywords(keywords: Sequence[str]) -> Dict[str, str]:
+        """
+        Canonicaliza keywords de un lineamiento.
+
+        Returns:
+            Dict keyword normalizada -> keyword original (primera aparición)
+        """
+        canonical: Dict[str, str] = {}
+        for keyword in keywords or []:
+            normalized = normalize_keyword(keyword)
+            if normalized and normalized not in canonical:
+                canonical[normalized] = keyword.strip().lstrip("#")
+        return canonical
+
+    def plan(
+        self,
+        lineamientos: Sequence[Any],
+        pairs: Set[Tuple[str, str]] | None = None,
+    ) -> CollectionPlan:
+        """
+        Construye el plan de un ciclo.
+
+        Args:
+            lineamientos: Lineamientos activos (con id, keywords y plataformas)
+            pairs: Pares (lineamiento_id, plataforma) a incluir. Si None,
+                se incluyen todas las plataformas de cada lineamiento
+
+        Returns:
+            CollectionPlan con las queries a ejecutar
+        """
+        plan = CollectionPlan()
+
+        # Keywords canónicas por lineamiento y plataforma, en orden estable
+        por_plataforma: Dict[str, List[tuple]] = {}
+        for lineamiento in sorted(lineamientos, key=lambda lin: str(lin.id)):
+            canonical = self._canonical_keywords(lineamiento.keywords)
+            if not canonical:
+                continue
+            for plataforma in lineamiento.plataformas or []:
+                if plataforma not in self.MAX_RESULTS:
+                    continue
+                if pairs is not None and (str(lineamiento.id), plataforma) not in pairs:
+                    continue
+                por_plataforma.setdefault(plataforma, []).append(
+                    (str(lineamiento.id), canonical)
+                )
+                plan.naive_units[plataforma] = plan.naive_units.get(
+                    plataforma, 0
+                ) + self._estimate_units(plataforma, self._max_results(plataforma))
+
+        for plataforma, grupos in por_plataforma.items():
+            if plataforma == "mastodon":
+                plan.queries.extend(self._plan_dedup(plataforma, grupos))
+            else:
+                plan.queries.extend(self._plan_merged(plataforma, grupos))
+
+        logger.info(
+            f"Plan de recolección: {len(plan.queries)} queries, "
+            f"unidades estimadas={plan.estimated_units}, "
+            f"sin planificar={plan.naive_units}"
+        )
+
+        return plan
+
+    def _plan_dedup(
+        self,
+        plataforma: str,
+        grupos: List[tuple],
+    ) -> List[PlannedQuery]:
+        """Una query por conjunto distinto de keywords canónicas"""
+        por_conjunto: Dict[frozenset, PlannedQuery] = {}
+        max_results = self._max_results(plataforma)
+
+        for lineamiento_id, canonical in grupos:
+            key = frozenset(canonical)
+            query = por_conjunto.get(key)
+            if query is None:
+                por_conjunto[key] = PlannedQuery(
+                    plataforma=plataforma,
+                    keywords=list(canonical.values()),
+                    lineamiento_ids=[lineamiento_id],
+                    max_results=max_results,
+                    estimated_units=self._estimate_units(plataforma, max_results),
+                )
+            else:
+                query.lineamiento_ids.append(lineamiento_id)
+
+        return list(por_conjunto.values())
+
+    def _plan_merged(
+        self,
+        plataforma: str,
+        grupos: List[tuple],
+    ) -> List[PlannedQuery]:
+        """
+        Combina keywords de varios lineamientos en queries OR.
+
+        Empaqueta de forma voraz las keywords aún no asignadas de cada
+        lineamiento, respetando la longitud máxima y el máximo de keywords
+        por query. Una keyword ya incluida en otra query no se repite.
+        """
+        max_length = self._max_query_length(plataforma)
+        max_keywords = settings.collection_max_keywords_per_query
+        max_results = self._max_results(plataforma)
+
+        # Keyword canónica -> índice de la query que la contiene
+        asignadas: Dict[str, int] = {}
+        bloques: List[Dict[str, str]] = []
+        current: Dict[str, str] = {}
+        current_length = 0
+
+        for _, canonical in grupos:
+            for normalized, original in canonical.items():
+                if normalized in asignadas or normalized in current:
+                    continue
+
+                added = len(original) + (len(self.OR_SEPARATOR) if current else 0)
+                if current and (
+                    current_length + added > max_length or len(current) >= max_keywords
+                ):
+                    bloques.append(current)
+                    current, current_length = {}, 0
+                    added = len(original)
+
+                current[normalized] = original
+                current_length += added
+                asignadas[normalized] = len(bloques)
+
+        if current:
+            bloques.append(current)
+
+        queries = []
+        for index, bloque in enumerate(bloques):
+            lineamiento_ids = [
+                lineamiento_id
+                for lineamiento_id, canonical in grupos
+                if any(asignadas[normalized] == index for normalized in canonical)
+            ]
+            queries.append(
+                PlannedQuery(
+                    plataforma=plataforma,
+                    keywords=list(bloque.values()),
+                    lineamiento_ids=lineamiento_ids,
+                    max_results=max_results,
+                    estimated_units=self._estimate_units(plataforma, max_results),
+                )
+            )
+
+        return queries
+
+
+# Instancia global
+collection_planner = CollectionPlanner()
@@ -0,0 +1,234 @@
+"""
+Búsqueda de texto completo sobre el contenido recolectado
+"""
+
+from typing import Any, Dict, List, Tuple
+from datetime import datetime
+from uuid import UUID
+import base64
+import html
+import json
+
+from sqlalchemy import (
+    REAL,
+    Select,
+    and_,
+    cast,
+    exists,
+    func,
+    literal,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.models.contenido import ContenidoRecolectado
+from src.models.contenido_lineamiento import ContenidoLineamiento
+
+# Configuración de texto como literal (no parámetro) para que la expresión
+# coincida con la del índice idx_contenido_texto_search
+SPANISH = literal_column("'spanish'")
+
+# ts_headline marca los términos con caracteres de uso privado (no HTML):
+# el extracto se escapa y recién entonces se convierten en <mark>
+MARK_START = "\ue000"
+MARK_END = "\ue001"
+HEADLINE_OPTIONS = (
+    f"StartSel={MARK_START}, StopSel={MARK_END}, MaxWords=35, MinWords=15, MaxFragments=2"
+)
+
+
+class ContentSearch:
+    """
+    Búsqueda con `websearch_to_tsquery` sobre el índice GIN de `contenido_texto`.
+
+    Los resultados se ordenan por `ts_rank` y se paginan por keyset
+    (relevancia, id): el cursor guarda la última fila de la página, así
+    que las páginas siguientes no recorren las anteriores como haría un
+    OFFSET. `ts_headline` (que vuelve a procesar el texto completo) se
+    calcula solo para las filas de la página.
+    """
+
+    @staticmethod
+    def encode_cursor(relevancia: float, contenido_id: UUID) -> str:
+        """Cursor opaco con la última fila de una página"""
+        raw = json.dumps({"r": relevancia, "id": str(contenido_id)}, separators=(",", ":"))
+        return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[float, UUID]:
+        """
+        Interpreta un cursor de `encode_cursor`.
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        try:
+            padded = cursor + "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            return float(data["r"]), UUID(data["id"])
+        except (ValueError, KeyError, TypeError) as e:
+            raise ValueError(f"Cursor inválido: {cursor}") from e
+
+    def build_query(
+        self,
+        q: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        lineamiento_id: UUID | None = None,
+        plataforma: str | None = None,
+        fecha_desde: datetime | None = None,
+        fecha_hasta: datetime | None = None,
+    ) -> Select:
+        """
+        Query de una página de resultados (con una fila extra).
+
+        Ver `search` para los parámetros.
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        contenido = ContenidoRecolectado
+        tsquery = func.websearch_to_tsquery(SPANISH, q)
+        relevancia = func.ts_rank(
+            func.to_tsvector(SPANISH, contenido.contenido_texto), tsquery, type_=REAL
+        ).label("relevancia")
+
+        conditions = [func.to_tsvector(SPANISH, contenido.contenido_texto).op("@@")(tsquery)]
+
+        if lineamiento_id:
+            # Contenido recolectado por el lineamiento o asociado después por keywords
+            conditions.append(
+                or_(
+                    contenido.lineamiento_id == lineamiento_id,
+                    exists().where(
+                        ContenidoLineamiento.contenido_id == contenido.id,
+                        ContenidoLineamiento.lineamiento_id == lineamiento_id,
+                    ),
+                )
+            )
+
+        if plataforma:
+            conditions.append(contenido.plataforma == plataforma.lower())
+
+        if fecha_desde:
+            conditions.append(contenido.fecha_publicacion >= fecha_desde)
+
+        if fecha_hasta:
+            conditions.append(contenido.fecha_publicacion < fecha_hasta)
+
+        if cursor:
+            cursor_relevancia, cursor_id = self.decode_cursor(cursor)
+            cursor_row = tuple_(
+                cast(literal(cursor_relevancia), REAL), literal(cursor_id, contenido.id.type)
+            )
+            conditions.append(tuple_(relevancia, contenido.id) < cursor_row)
+
+        # Una fila extra indica si hay página siguiente
+        page = (
+            select(
+                contenido.id,
+                contenido.lineamiento_id,
+                contenido.plataforma,
+                contenido.titulo,
+                contenido.autor,
+                contenido.url,
+                contenido.fecha_publicacion,
+                contenido.contenido_texto,
+                relevancia,
+            )
+            .where(and_(*conditions))
+            .order_by(relevancia.desc(), contenido.id.desc())
+            .limit(limit + 1)
+            .subquery("pagina")
+        )
+
+        query = select(
+            page.c.id,
+            page.c.lineamiento_id,
+            page.c.plataforma,
+            page.c.titulo,
+            page.c.autor,
+            page.c.url,
+            page.c.fecha_publicacion,
+            page.c.relevancia,
+            func.ts_headline(SPANISH, page.c.contenido_texto, tsquery, HEADLINE_OPTIONS).label(
+                "fragmento"
+            ),
+        ).order_by(page.c.relevancia.desc(), page.c.id.desc())
+        return query
+
+    @staticmethod
+    def mark_fragment(fragmento: str) -> str:
+        """
+        Escapa el extracto como HTML y convierte los marcadores en `<mark>`.
+
+        `ts_headline` devuelve el texto original del post, que puede traer
+        HTML (ej: el contenido de Mastodon); solo las marcas de los términos
+        encontrados deben llegar como markup.
+        """
+        return (
+            html.escape(fragmento)
+            .replace(MARK_START, "<mark>")
+            .replace(MARK_END, "</mark>")
+        )
+
+    async def search(
+        self,
+        db: AsyncSession,
+        q: str,
+        limit: int = 20,
+        cursor: str | None = None,
+        lineamiento_id: UUID | None = None,
+        plataforma: str | None = None,
+        fecha_desde: datetime | None = None,
+        fecha_hasta: datetime | None = None,
+    ) -> Tuple[List[Dict[str, Any]], str | None]:
+        """
+        Busca contenido por texto.
+
+        Args:
+            db: Sesión de base de datos
+            q: Búsqueda en sintaxis web ("frase exacta", or, -excluir)
+            limit: Resultados por página
+            cursor: Cursor de la página anterior
+            lineamiento_id: Contenido recolectado por el lineamiento o asociado a él
+            plataforma: Filtrar por plataforma
+            fecha_desde: Publicado desde (inclusive)
+            fecha_hasta: Publicado hasta (exclusive)
+
+        Returns:
+            Tupla (resultados, cursor de la página siguiente o None). El
+            fragmento de cada resultado es HTML escapado con `<mark>`.
+
+        Raises:
+            ValueError: Si el cursor no es válido
+        """
+        query = self.build_query(
+            q,
+            limit=limit,
+            cursor=cursor,
+            lineamiento_id=lineamiento_id,
+            plataforma=plataforma,
+            fecha_desde=fecha_desde,
+            fecha_hasta=fecha_hasta,
+        )
+        rows = (await db.execute(query)).mappings().all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = self.encode_cursor(last["relevancia"], last["id"])
+
+        items = [dict(row) for row in rows]
+        for item in items:
+            item["fragmento"] = self.mark_fragment(item["fragmento"])
+
+        return items, next_cursor
+
+
+# Instancia global
+content_search = ContentSearch()
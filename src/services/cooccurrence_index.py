@@ -0,0 +1,255 @@
+"""
+Índice incremental de co-ocurrencia de términos y detección de términos emergentes
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from itertools import combinations
+import logging
+
+from sqlalchemy import and_, func, literal_column, select, union_all
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.coocurrencia import Coocurrencia
+from src.models.tema import TemaIdentificado
+from src.utils.config import settings
+from src.utils.keyword_matcher import normalize_keyword
+
+logger = logging.getLogger(__name__)
+
+
+class CooccurrenceIndex:
+    """
+    Mantiene conteos dispersos de pares de términos por bucket de tiempo.
+
+    Los términos de un tema son sus keywords y entidades nombradas
+    normalizadas. Cada lote de temas se reduce en memoria a un conteo por
+    (bucket, par) y se suma a `coocurrencias` con un upsert, de modo que el
+    índice nunca se recalcula.
+
+    Un término es emergente cuando su vecindario (términos con los que
+    co-ocurre) crece: se compara el vecindario de la ventana actual con el
+    de la ventana anterior y se cuentan los vecinos nuevos. Esa señal no
+    depende de reentrenar BERTopic.
+    """
+
+    # Filas por INSERT (límite de parámetros de PostgreSQL)
+    INSERT_CHUNK = 1000
+
+    @staticmethod
+    def terms(
+        keywords: Iterable[str] | None,
+        entidades: Dict[str, List[str]] | None,
+    ) -> List[str]:
+        """
+        Términos normalizados de un tema (sin duplicados, orden estable).
+
+        Se limita a `cooccurrence_max_terms_per_tema` para acotar los pares
+        (n términos generan n·(n-1)/2 pares).
+        """
+        raw = list(keywords or [])
+        for values in (entidades or {}).values():
+            raw.extend(values)
+
+        terms: Dict[str, None] = {}
+        for value in raw:
+            term = normalize_keyword(value)
+            if term:
+                terms.setdefault(term)
+
+        return list(terms)[: settings.cooccurrence_max_terms_per_tema]
+
+    @staticmethod
+    def bucket(moment: datetime) -> datetime:
+        """Inicio del bucket de `cooccurrence_bucket_minutes` que contiene el momento"""
+        size = settings.cooccurrence_bucket_minutes * 60
+        seconds = int(moment.timestamp()) // size * size
+        return datetime.fromtimestamp(seconds, tz=timezone.utc)
+
+    def count_pairs(self, temas: Iterable[Tuple[datetime, List[str]]]) -> Counter:
+        """
+        Reduce un lote de temas a conteos por (bucket, par ordenado).
+
+        Args:
+            temas: Tuplas (identificado_at, términos)
+
+        Returns:
+            Counter de (bucket, termino_a, termino_b)
+        """
+        counts: Counter = Counter()
+        for moment, terms in temas:
+            bucket = self.bucket(moment)
+            for a, b in combinations(sorted(set(terms)), 2):
+                counts[(bucket, a, b)] += 1
+        return counts
+
+    def save_counts(self, db: Session, counts: Counter) -> int:
+        """
+        Suma los conteos al índice con un upsert. No hace commit.
+
+        Returns:
+            Número de pares (bucket, par) actualizados
+        """
+        # Orden fijo para que workers concurrentes tomen los locks en el mismo orden
+        rows = [
+            {"bucket": bucket, "termino_a": a, "termino_b": b, "conteo": conteo}
+            for (bucket, a, b), conteo in sorted(counts.items())
+        ]
+
+        for i in range(0, len(rows), self.INSERT_CHUNK):
+            stmt = insert(Coocurrencia).values(rows[i : i + self.INSERT_CHUNK])
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=["bucket", "termino_a", "termino_b"],
+                    set_={"conteo": Coocurrencia.conteo + stmt.excluded.conteo},
+                )
+            )
+
+        return len(rows)
+
+    def index_pending(self, db: Session, limit: int | None = None) -> Tuple[int, int]:
+        """
+        Indexa un lote de temas pendientes y los marca. No hace commit.
+
+        Los temas se bloquean con SKIP LOCKED, así que varias ejecuciones
+        concurrentes no indexan dos veces el mismo tema.
+
+        Args:
+            db: Sesión de base de datos
+            limit: Temas por lote. Si None, usa settings
+
+        Returns:
+            Tupla (temas indexados, pares actualizados)
+        """
+        temas = (
+            db.query(
+                TemaIdentificado.id,
+                TemaIdentificado.identificado_at,
+                TemaIdentificado.keywords,
+                TemaIdentificado.entidades_mencionadas,
+            )
+            .filter(TemaIdentificado.coocurrencia_indexada == False)
+            .order_by(TemaIdentificado.identificado_at)
+            .limit(limit or settings.cooccurrence_batch_size)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+        if not temas:
+            return 0, 0
+
+        counts = self.count_pairs(
+            (identificado_at, self.terms(keywords, entidades))
+            for _, identificado_at, keywords, entidades in temas
+        )
+        pairs = self.save_counts(db, counts)
+
+        db.query(TemaIdentificado).filter(
+            TemaIdentificado.id.in_([tema_id for tema_id, *_ in temas])
+        ).update({TemaIdentificado.coocurrencia_indexada: True}, synchronize_session=False)
+
+        return len(temas), pairs
+
+    def emerging(
+        self,
+        db: Session,
+        window_hours: int,
+        top_n: int = 20,
+        min_neighbors: int = 3,
+        now: datetime | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Términos cuyo vecindario de co-ocurrencia crece más rápido.
+
+        Compara [now - ventana, now) con la ventana anterior de igual
+        duración en una sola query agregada.
+
+        Args:
+            db: Sesión de base de datos
+            window_hours: Duración de cada ventana
+            top_n: Número de términos a retornar
+            min_neighbors: Vecinos mínimos en la ventana actual
+            now: Fin de la ventana actual. Si None, usa la hora actual
+
+        Returns:
+            Lista de dicts (termino, vecinos, vecinos_previos, vecinos_nuevos,
+            coocurrencias, expansion) ordenada por vecinos nuevos
+        """
+        now = now or datetime.now(timezone.utc)
+        start = now - timedelta(hours=window_hours)
+        previous_start = start - timedelta(hours=window_hours)
+
+        window = and_(Coocurrencia.bucket >= previous_start, Coocurrencia.bucket < now)
+
+        # Cada par aporta un vecino a cada uno de sus dos términos
+        edges = union_all(
+            select(
+                Coocurrencia.bucket,
+                Coocurrencia.termino_a.label("termino"),
+                Coocurrencia.termino_b.label("vecino"),
+                Coocurrencia.conteo,
+            ).where(window),
+            select(
+                Coocurrencia.bucket,
+                Coocurrencia.termino_b.label("termino"),
+                Coocurrencia.termino_a.label("vecino"),
+                Coocurrencia.conteo,
+            ).where(window),
+        ).subquery()
+
+        actual = edges.c.bucket >= start
+        neighbors = (
+            select(
+                edges.c.termino,
+                edges.c.vecino,
+                func.bool_or(actual).label("actual"),
+                func.bool_or(~actual).label("previo"),
+                func.coalesce(func.sum(edges.c.conteo).filter(actual), 0).label("conteo"),
+            )
+            .group_by(edges.c.termino, edges.c.vecino)
+            .subquery()
+        )
+
+        vecinos = func.count().filter(neighbors.c.actual)
+        vecinos_nuevos = func.count().filter(and_(neighbors.c.actual, ~neighbors.c.previo))
+        query = (
+            select(
+                neighbors.c.termino,
+                vecinos.label("vecinos"),
+                func.count().filter(neighbors.c.previo).label("vecinos_previos"),
+                vecinos_nuevos.label("vecinos_nuevos"),
+                func.sum(neighbors.c.conteo).label("coocurrencias"),
+            )
+            .group_by(neighbors.c.termino)
+            .having(vecinos >= min_neighbors)
+            .order_by(
+                literal_column("vecinos_nuevos").desc(),
+                literal_column("coocurrencias").desc(),
+            )
+            .limit(top_n)
+        )
+
+        return [
+            {
+                "termino": row.termino,
+                "vecinos": row.vecinos,
+                "vecinos_previos": row.vecinos_previos,
+                "vecinos_nuevos": row.vecinos_nuevos,
+                "coocurrencias": int(row.coocurrencias),
+                "expansion": self.expansion(row.vecinos_nuevos, row.vecinos_previos),
+            }
+            for row in db.execute(query)
+        ]
+
+    @staticmethod
+    def expansion(nuevos: int, previos: int) -> float:
+        """Vecinos nuevos relativos al vecindario anterior (1.0 si no existía)"""
+        if previos > 0:
+            return nuevos / previos
+        return 1.0 if nuevos > 0 else 0.0
+
+
+# Instancia global
+cooccurrence_index = CooccurrenceIndex()
@@ -0,0 +1,115 @@
+"""
+Refresco periódico de métricas de engagement
+"""
+
+from typing import Any, Dict, List, Tuple
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+import logging
+
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.contenido import ContenidoRecolectado
+from src.models.engagement_snapshot import EngagementSnapshot
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class EngagementRefresher:
+    """
+    Vuelve a medir el engagement del contenido que sigue dentro de la
+    ventana de tendencias.
+
+    La deduplicación de los collectors descarta para siempre el contenido
+    ya guardado, así que sus métricas quedan congeladas en el momento de
+    la recolección. Este servicio selecciona el contenido reciente de cada
+    plataforma, lo consulta con los endpoints masivos de cada collector
+    (`get_engagement`) y guarda cada medición en `engagement_snapshots`.
+    """
+
+    # Filas por INSERT (límite de parámetros de PostgreSQL)
+    INSERT_CHUNK = 1000
+
+    @staticmethod
+    def _now() -> datetime:
+        return datetime.now(timezone.utc)
+
+    def candidates(
+        self,
+        db: Session,
+        plataforma: str,
+        now: datetime | None = None,
+    ) -> List[Tuple[UUID, str]]:
+        """
+        Selecciona el contenido de una plataforma a refrescar.
+
+        Args:
+            db: Sesión de base de datos
+            plataforma: youtube, reddit o mastodon
+            now: Momento de referencia. Si None, usa la hora actual
+
+        Returns:
+            Lista de (contenido_id, plataforma_id), más recientes primero
+        """
+        since = (now or self._now()) - timedelta(hours=settings.engagement_refresh_window_hours)
+
+        return [
+            (contenido_id, plataforma_id)
+            for contenido_id, plataforma_id in db.query(
+                ContenidoRecolectado.id, ContenidoRecolectado.plataforma_id
+            )
+            .filter(
+                ContenidoRecolectado.plataforma == plataforma,
+                ContenidoRecolectado.fecha_publicacion >= since,
+            )
+            .order_by(ContenidoRecolectado.fecha_publicacion.desc())
+            .limit(settings.engagement_refresh_max_items)
+        ]
+
+    def save_snapshots(
+        self,
+        db: Session,
+        candidates: List[Tuple[UUID, str]],
+        engagement: Dict[str, Dict[str, Any]],
+        now: datetime | None = None,
+    ) -> int:
+        """
+        Guarda una medición por cada contenido con métricas. No hace commit.
+
+        Args:
+            db: Sesión de base de datos
+            candidates: Resultado de `candidates`
+            engagement: Métricas por plataforma_id (`get_engagement`)
+            now: Momento de la medición. Si None, usa la hora actual
+
+        Returns:
+            Número de mediciones guardadas
+        """
+        tiempo = now or self._now()
+        rows = [
+            {
+                "contenido_id": contenido_id,
+                "tiempo": tiempo,
+                "views": engagement[plataforma_id].get("views"),
+                "likes": engagement[plataforma_id].get("likes"),
+                "comments": engagement[plataforma_id].get("comments"),
+                "shares": engagement[plataforma_id].get("shares"),
+            }
+            for contenido_id, plataforma_id in candidates
+            if plataforma_id in engagement
+        ]
+
+        for i in range(0, len(rows), self.INSERT_CHUNK):
+            db.execute(
+                insert(EngagementSnapshot)
+                .values(rows[i : i + self.INSERT_CHUNK])
+                .on_conflict_do_nothing()
+            )
+
+        return len(rows)
+
+
+# Instancia global
+engagement_refresher = EngagementRefresher()
@@ -0,0 +1,273 @@
+"""
+Escritores incrementales para exportar tendencias (CSV, JSON Lines, Excel, Parquet)
+"""
+
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Sequence
+from datetime import datetime, timezone
+from uuid import UUID
+import csv
+import io
+import tempfile
+
+import orjson
+from sqlalchemy import Select
+
+# Columnas exportadas, en orden (la query de exportación las selecciona así)
+EXPORT_COLUMNS = [
+    "id",
+    "fecha_hora",
+    "tema_id",
+    "tema_nombre",
+    "plataforma",
+    "ubicacion",
+    "edad_rango",
+    "genero",
+    "volumen_menciones",
+    "tasa_crecimiento",
+    "sentimiento_promedio",
+    "es_tendencia",
+    "engagement_total",
+    "autores_unicos",
+    "puntuacion",
+    "puntuacion_z",
+    "keywords",
+]
+
+# Límite de filas de una hoja de Excel (sin contar la cabecera)
+XLSX_MAX_ROWS = 1_048_575
+
+# Tamaño de las partes en que se envía un archivo armado al final (Excel)
+CLOSE_CHUNK_BYTES = 1024 * 1024
+
+
+class _ChunkBuffer(io.RawIOBase):
+    """Archivo de solo escritura cuyo contenido se retira por partes"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ExportWriter(ABC):
+    """
+    Convierte lotes de filas en bytes a medida que llegan.
+
+    `open()` devuelve el encabezado, `write(rows)` los bytes de cada lote y
+    `close()` las partes del final del archivo, de modo que la exportación
+    se puede enviar por partes (StreamingResponse) o escribir a disco sin
+    tener todas las filas en memoria. Las filas son tuplas en el orden de
+    `EXPORT_COLUMNS`.
+
+    Los formatos con `max_rows` descartan las filas que exceden el límite
+    y marcan `truncated`; la query se limita con `limit_rows` para no
+    seguir leyendo filas que no se van a escribir.
+    """
+
+    media_type = "application/octet-stream"
+    extension = "bin"
+    max_rows: int | None = None
+    truncated = False
+
+    def limit_rows(self, query: Select) -> Select:
+        """Limita la query a `max_rows` + 1 filas (la extra detecta el recorte)"""
+        if self.max_rows is None:
+            return query
+        return query.limit(self.max_rows + 1)
+
+    def open(self) -> bytes:
+        return b""
+
+    @abstractmethod
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        """Bytes de un lote de filas (vacío si el formato acumula hasta `close`)"""
+
+    def close(self) -> Iterator[bytes]:
+        return iter(())
+
+
+class CsvWriter(ExportWriter):
+    """CSV UTF-8 con cabecera; las keywords se unen con '|'"""
+
+    media_type = "text/csv; charset=utf-8"
+    extension = "csv"
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if isinstance(value, list):
+            return "|".join(value)
+        if isinstance(value, datetime):
+            return value.isoformat()
+        return value
+
+    def _encode(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        writer.writerows([self._cell(value) for value in row] for row in rows)
+        return buffer.getvalue().encode("utf-8")
+
+    def open(self) -> bytes:
+        return self._encode([EXPORT_COLUMNS])
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        return self._encode(rows)
+
+
+class NdjsonWriter(ExportWriter):
+    """JSON Lines: un objeto por línea"""
+
+    media_type = "application/x-ndjson"
+    extension = "jsonl"
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        return b"".join(
+            orjson.dumps(dict(zip(EXPORT_COLUMNS, row)), option=orjson.OPT_UTC_Z) + b"\n"
+            for row in rows
+        )
+
+
+class XlsxWriter(ExportWriter):
+    """
+    Libro de Excel con openpyxl en modo write-only.
+
+    En modo write-only openpyxl vuelca cada fila a un archivo temporal, así
+    que la memoria no crece con las filas; el .xlsx (un zip) se arma
+    recién en `close()` y se devuelve por partes. Las filas que exceden el
+    límite de una hoja se descartan.
+    """
+
+    media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    extension = "xlsx"
+    max_rows = XLSX_MAX_ROWS
+
+    def __init__(self):
+        from openpyxl import Workbook
+
+        self._workbook = Workbook(write_only=True)
+        self._sheet = self._workbook.create_sheet("tendencias")
+        self._rows = 0
+        self.truncated = False
+
+    @staticmethod
+    def _cell(value: Any) -> Any:
+        if isinstance(value, UUID):
+            return str(value)
+        if isinstance(value, list):
+            return ", ".join(value)
+        if isinstance(value, datetime) and value.tzinfo is not None:
+            # Excel no admite zonas horarias: se exporta en UTC
+            return value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+    def open(self) -> bytes:
+        self._sheet.append(EXPORT_COLUMNS)
+        return b""
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        for row in rows:
+            if self._rows >= self.max_rows:
+                self.truncated = True
+                break
+            self._sheet.append([self._cell(value) for value in row])
+            self._rows += 1
+        return b""
+
+    def close(self) -> Iterator[bytes]:
+        # El libro se guarda en un temporal y se lee por partes: el .xlsx
+        # completo puede pesar cientos de MB
+        with tempfile.TemporaryFile() as output:
+            self._workbook.save(output)
+            output.seek(0)
+            while chunk := output.read(CLOSE_CHUNK_BYTES):
+                yield chunk
+
+
+class ParquetWriter(ExportWriter):
+    """Parquet con pyarrow: cada lote es un row group"""
+
+    media_type = "application/vnd.apache.parquet"
+    extension = "parquet"
+
+    def __init__(self):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise ValueError("Exportación a Parquet no disponible: instalar pyarrow")
+
+        self._pa = pa
+        self._schema = pa.schema(
+            [
+                ("id", pa.string()),
+                ("fecha_hora", pa.timestamp("us", tz="UTC")),
+                ("tema_id", pa.string()),
+                ("tema_nombre", pa.string()),
+                ("plataforma", pa.string()),
+                ("ubicacion", pa.string()),
+                ("edad_rango", pa.string()),
+                ("genero", pa.string()),
+                ("volumen_menciones", pa.int64()),
+                ("tasa_crecimiento", pa.float64()),
+                ("sentimiento_promedio", pa.float64()),
+                ("es_tendencia", pa.bool_()),
+                ("engagement_total", pa.int64()),
+                ("autores_unicos", pa.int64()),
+                ("puntuacion", pa.float64()),
+                ("puntuacion_z", pa.float64()),
+                ("keywords", pa.list_(pa.string())),
+            ]
+        )
+        self._buffer = _ChunkBuffer()
+        self._writer = pq.ParquetWriter(self._buffer, self._schema, compression="zstd")
+
+    def write(self, rows: Sequence[Sequence[Any]]) -> bytes:
+        if not rows:
+            return b""
+
+        columns: Dict[str, List[Any]] = {name: [] for name in EXPORT_COLUMNS}
+        for row in rows:
+            for name, value in zip(EXPORT_COLUMNS, row):
+                columns[name].append(str(value) if isinstance(value, UUID) else value)
+
+        self._writer.write_table(self._pa.table(columns, schema=self._schema))
+        return self._buffer.drain()
+
+    def close(self) -> Iterator[bytes]:
+        self._writer.close()
+        yield self._buffer.drain()
+
+
+WRITERS = {
+    "csv": CsvWriter,
+    "ndjson": NdjsonWriter,
+    "xlsx": XlsxWriter,
+    "parquet": ParquetWriter,
+}
+
+
+def export_writer(formato: str) -> ExportWriter:
+    """
+    Escritor para un formato de exportación.
+
+    Raises:
+        ValueError: Si el formato no existe o su dependencia no está instalada
+    """
+    if formato not in WRITERS:
+        raise ValueError(f"Formato inválido: {formato}. Válidos: {list(WRITERS)}")
+    return WRITERS[formato]()
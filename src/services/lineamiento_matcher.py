@@ -0,0 +1,148 @@
+"""
+Servicio de matching de contenido contra keywords de lineamientos
+"""
+
+from typing import Dict, List, Set, Tuple
+from uuid import UUID
+from threading import Lock
+import logging
+
+from sqlalchemy import func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.models.lineamiento import Lineamiento
+from src.models.contenido_lineamiento import ContenidoLineamiento
+from src.utils.keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+
+class LineamientoMatcherService:
+    """
+    Mantiene un `KeywordMatcher` compilado con las keywords de todos los
+    lineamientos activos.
+
+    El autómata se reconstruye solo cuando cambian los lineamientos. Para
+    detectarlo se consulta una huella barata (conteo y último
+    `updated_at` de la tabla), válida entre procesos de API y workers.
+    """
+
+    def __init__(self):
+        self._matcher: KeywordMatcher | None = None
+        self._fingerprint: Tuple | None = None
+        self._lock = Lock()
+
+    @staticmethod
+    def _get_fingerprint(db: Session) -> Tuple:
+        """
+        Calcula la huella de la tabla de lineamientos.
+
+        Incluye inactivos para detectar desactivaciones (que también
+        actualizan `updated_at`).
+        """
+        count, last_update = db.query(
+            func.count(Lineamiento.id),
+            func.max(Lineamiento.updated_at),
+        ).one()
+        return (count, last_update)
+
+    @staticmethod
+    def build_matcher(lineamientos: List[Lineamiento]) -> KeywordMatcher:
+        """
+        Compila un matcher a partir de una lista de lineamientos.
+
+        Args:
+            lineamientos: Lineamientos con sus keywords
+
+        Returns:
+            KeywordMatcher con payload = ID del lineamiento
+        """
+        return KeywordMatcher(
+            (keyword, lineamiento.id)
+            for lineamiento in lineamientos
+            for keyword in (lineamiento.keywords or [])
+        )
+
+    def get_matcher(self, db: Session) -> KeywordMatcher:
+        """
+        Retorna el matcher vigente, reconstruyéndolo si cambiaron los lineamientos.
+
+        Args:
+            db: Sesión de SQLAlchemy
+
+        Returns:
+            KeywordMatcher de lineamientos activos
+        """
+        fingerprint = self._get_fingerprint(db)
+
+        with self._lock:
+            if self._matcher is None or fingerprint != self._fingerprint:
+                lineamientos = (
+                    db.query(Lineamiento).filter(Lineamiento.activo == True).all()
+                )
+                self._matcher = self.build_matcher(lineamientos)
+                self._fingerprint = fingerprint
+                logger.info(
+                    f"Matcher de lineamientos reconstruido: {len(lineamientos)} "
+                    f"lineamientos, {len(self._matcher)} keywords únicas"
+                )
+
+            return self._matcher
+
+    def invalidate(self) -> None:
+        """Fuerza la reconstrucción del matcher en la próxima consulta"""
+        with self._lock:
+            self._matcher = None
+            self._fingerprint = None
+
+    def tag_contenidos(
+        self,
+        db: Session,
+        contenidos: List[Tuple[UUID, str]],
+        lineamiento_origen: UUID | None = None,
+    ) -> int:
+        """
+        Asocia contenidos con todos los lineamientos cuyas keywords coinciden.
+
+        No hace commit; la inserción forma parte de la transacción actual.
+
+        Args:
+            db: Sesión de SQLAlchemy
+            contenidos: Pares (contenido_id, texto)
+            lineamiento_origen: Lineamiento que originó la búsqueda. Se
+                asocia siempre, aunque el texto no contenga sus keywords
+                (ej: YouTube también busca en tags y descripciones ocultas)
+
+        Returns:
+            Número de asociaciones enviadas a la base de datos
+        """
+        if not contenidos:
+            return 0
+
+        matcher = self.get_matcher(db)
+        rows = []
+
+        for contenido_id, texto in contenidos:
+            matches: Dict[UUID, Set[str]] = matcher.match(texto)
+            if lineamiento_origen is not None:
+                matches.setdefault(lineamiento_origen, set())
+
+            for lineamiento_id, keywords in matches.items():
+                rows.append(
+                    {
+                        "contenido_id": contenido_id,
+                        "lineamiento_id": lineamiento_id,
+                        "keywords_coincidentes": sorted(keywords),
+                    }
+                )
+
+        if rows:
+            stmt = insert(ContenidoLineamiento).values(rows).on_conflict_do_nothing()
+            db.execute(stmt)
+
+        return len(rows)
+
+
+# Instancia global
+lineamiento_matcher = LineamientoMatcherService()
@@ -4,7 +4,8 @@ Servicio CRUD para Lineamientos
 
 from typing import List
 from uuid import UUID
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
 import logging
 
@@ -20,16 +21,16 @@ logger = logging.getLogger(__name__)
 class LineamientoService:
     """
     Servicio para operaciones CRUD de Lineamientos.
-    Encapsula la lógica de negocio y acceso a datos.
+    Encapsula la lógica de negocio y acceso a datos (sesión asíncrona).
     """
 
     @staticmethod
-    def create(db: Session, lineamiento_data: LineamientoCreate) -> Lineamiento:
+    async def create(db: AsyncSession, lineamiento_data: LineamientoCreate) -> Lineamiento:
         """
         Crea un nuevo lineamiento.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_data: Datos para crear el lineamiento
 
         Returns:
@@ -41,10 +42,8 @@ class LineamientoService:
         logger.info(f"Creando lineamiento: {lineamiento_data.nombre}")
 
         # Verificar si ya existe un lineamiento con el mismo nombre
-        existing = (
-            db.query(Lineamiento)
-            .filter(Lineamiento.nombre == lineamiento_data.nombre)
-            .first()
+        existing = await db.scalar(
+            select(Lineamiento).where(Lineamiento.nombre == lineamiento_data.nombre)
         )
 
         if existing:
@@ -61,34 +60,34 @@ class LineamientoService:
 
         try:
             db.add(lineamiento)
-            db.commit()
-            db.refresh(lineamiento)
+            await db.commit()
+            await db.refresh(lineamiento)
             logger.info(f"Lineamiento creado: {lineamiento.id}")
             return lineamiento
 
         except IntegrityError as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Error de integridad al crear lineamiento: {e}")
             raise ValueError("Error al crear lineamiento: violación de restricción única")
 
     @staticmethod
-    def get_by_id(db: Session, lineamiento_id: UUID) -> Lineamiento | None:
+    async def get_by_id(db: AsyncSession, lineamiento_id: UUID) -> Lineamiento | None:
         """
         Obtiene un lineamiento por ID.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_id: ID del lineamiento
 
         Returns:
             Lineamiento si existe, None si no se encuentra
         """
         logger.debug(f"Buscando lineamiento: {lineamiento_id}")
-        return db.query(Lineamiento).filter(Lineamiento.id == lineamiento_id).first()
+        return await db.get(Lineamiento, lineamiento_id)
 
     @staticmethod
-    def get_all(
-        db: Session,
+    async def get_all(
+        db: AsyncSession,
         skip: int = 0,
         limit: int = 100,
         activo_only: bool = False,
@@ -97,7 +96,7 @@ class LineamientoService:
         Obtiene lista de lineamientos con paginación.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             skip: Número de registros a saltar (offset)
             limit: Número máximo de registros a retornar
             activo_only: Si True, solo retorna lineamientos activos
@@ -107,35 +106,38 @@ class LineamientoService:
         """
         logger.debug(f"Listando lineamientos: skip={skip}, limit={limit}, activo_only={activo_only}")
 
-        query = db.query(Lineamiento)
+        query = select(Lineamiento)
 
         if activo_only:
-            query = query.filter(Lineamiento.activo == True)
+            query = query.where(Lineamiento.activo == True)
 
-        return query.order_by(Lineamiento.created_at.desc()).offset(skip).limit(limit).all()
+        result = await db.scalars(
+            query.order_by(Lineamiento.created_at.desc()).offset(skip).limit(limit)
+        )
+        return list(result)
 
     @staticmethod
-    def count(db: Session, activo_only: bool = False) -> int:
+    async def count(db: AsyncSession, activo_only: bool = False) -> int:
         """
         Cuenta el total de lineamientos.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             activo_only: Si True, solo cuenta lineamientos activos
 
         Returns:
             Total de lineamientos
         """
-        query = db.query(Lineamiento)
+        query = select(func.count()).select_from(Lineamiento)
 
         if activo_only:
-            query = query.filter(Lineamiento.activo == True)
+            query = query.where(Lineamiento.activo == True)
 
-        return query.count()
+        return await db.scalar(query)
 
     @staticmethod
-    def update(
-        db: Session,
+    async def update(
+        db: AsyncSession,
         lineamiento_id: UUID,
         lineamiento_data: LineamientoUpdate,
     ) -> Lineamiento | None:
@@ -143,7 +145,7 @@ class LineamientoService:
         Actualiza un lineamiento existente.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_id: ID del lineamiento a actualizar
             lineamiento_data: Datos a actualizar
 
@@ -156,7 +158,7 @@ class LineamientoService:
         logger.info(f"Actualizando lineamiento: {lineamiento_id}")
 
         # Obtener el lineamiento existente
-        lineamiento = LineamientoService.get_by_id(db, lineamiento_id)
+        lineamiento = await LineamientoService.get_by_id(db, lineamiento_id)
 
         if not lineamiento:
             logger.warning(f"Lineamiento no encontrado: {lineamiento_id}")
@@ -167,13 +169,11 @@ class LineamientoService:
 
         # Si se está actualizando el nombre, verificar que no exista otro con ese nombre
         if "nombre" in update_data and update_data["nombre"] != lineamiento.nombre:
-            existing = (
-                db.query(Lineamiento)
-                .filter(
+            existing = await db.scalar(
+                select(Lineamiento).where(
                     Lineamiento.nombre == update_data["nombre"],
                     Lineamiento.id != lineamiento_id,
                 )
-                .first()
             )
 
             if existing:
@@ -185,23 +185,23 @@ class LineamientoService:
             setattr(lineamiento, field, value)
 
         try:
-            db.commit()
-            db.refresh(lineamiento)
+            await db.commit()
+            await db.refresh(lineamiento)
             logger.info(f"Lineamiento actualizado: {lineamiento.id}")
             return lineamiento
 
         except IntegrityError as e:
-            db.rollback()
+            await db.rollback()
             logger.error(f"Error de integridad al actualizar lineamiento: {e}")
             raise ValueError("Error al actualizar lineamiento: violación de restricción única")
 
     @staticmethod
-    def delete(db: Session, lineamiento_id: UUID) -> bool:
+    async def delete(db: AsyncSession, lineamiento_id: UUID) -> bool:
         """
         Elimina un lineamiento (soft delete - marca como inactivo).
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_id: ID del lineamiento a eliminar
 
         Returns:
@@ -209,7 +209,7 @@ class LineamientoService:
         """
         logger.info(f"Eliminando lineamiento: {lineamiento_id}")
 
-        lineamiento = LineamientoService.get_by_id(db, lineamiento_id)
+        lineamiento = await LineamientoService.get_by_id(db, lineamiento_id)
 
         if not lineamiento:
             logger.warning(f"Lineamiento no encontrado: {lineamiento_id}")
@@ -218,12 +218,12 @@ class LineamientoService:
         # Soft delete: marcar como inactivo
         lineamiento.activo = False
 
-        db.commit()
+        await db.commit()
         logger.info(f"Lineamiento marcado como inactivo: {lineamiento.id}")
         return True
 
     @staticmethod
-    def hard_delete(db: Session, lineamiento_id: UUID) -> bool:
+    async def hard_delete(db: AsyncSession, lineamiento_id: UUID) -> bool:
         """
         Elimina permanentemente un lineamiento de la base de datos.
 
@@ -231,7 +231,7 @@ class LineamientoService:
         también todo el contenido recolectado asociado (CASCADE).
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_id: ID del lineamiento a eliminar
 
         Returns:
@@ -239,24 +239,24 @@ class LineamientoService:
         """
         logger.warning(f"HARD DELETE de lineamiento: {lineamiento_id}")
 
-        lineamiento = LineamientoService.get_by_id(db, lineamiento_id)
+        lineamiento = await LineamientoService.get_by_id(db, lineamiento_id)
 
         if not lineamiento:
             logger.warning(f"Lineamiento no encontrado: {lineamiento_id}")
             return False
 
-        db.delete(lineamiento)
-        db.commit()
+        await db.delete(lineamiento)
+        await db.commit()
         logger.info(f"Lineamiento eliminado permanentemente: {lineamiento_id}")
         return True
 
     @staticmethod
-    def activate(db: Session, lineamiento_id: UUID) -> Lineamiento | None:
+    async def activate(db: AsyncSession, lineamiento_id: UUID) -> Lineamiento | None:
         """
         Reactiva un lineamiento inactivo.
 
         Args:
-            db: Sesión de SQLAlchemy
+            db: Sesión asíncrona de SQLAlchemy
             lineamiento_id: ID del lineamiento a activar
 
         Returns:
@@ -264,14 +264,14 @@ class LineamientoService:
         """
         logger.info(f"Activando lineamiento: {lineamiento_id}")
 
-        lineamiento = LineamientoService.get_by_id(db, lineamiento_id)
+        lineamiento = await LineamientoService.get_by_id(db, lineamiento_id)
 
         if not lineamiento:
             logger.warning(f"Lineamiento no encontrado: {lineamiento_id}")
             return None
 
         lineamiento.activo = True
-        db.commit()
-        db.refresh(lineamiento)
+        await db.commit()
+        await db.refresh(lineamiento)
         logger.info(f"Lineamiento activado: {lineamiento.id}")
         return lineamiento
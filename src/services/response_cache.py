@@ -0,0 +1,190 @@
+"""
+Caché de respuestas de la API en Redis con invalidación por generación
+"""
+
+from typing import Any, Awaitable, Callable, Dict
+from uuid import uuid4
+import asyncio
+import hashlib
+import json
+import logging
+import time
+
+import redis
+import redis.asyncio
+
+from src.utils.config import settings
+from src.utils.redis_client import get_async_redis, get_redis
+
+logger = logging.getLogger(__name__)
+
+# Borra el lock solo si sigue siendo del proceso que lo tomó
+_UNLOCK_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+
+class ResponseCache:
+    """
+    Guarda el JSON ya serializado de las respuestas de consulta.
+
+    Las claves incluyen un contador de generación que las tareas de
+    análisis incrementan al hacer commit (`bump`): las entradas de
+    generaciones anteriores dejan de leerse y expiran solas por TTL, sin
+    borrar claves.
+
+    Cuando una clave no está en caché, solo un proceso la calcula (lock
+    con SET NX); los demás esperan el resultado en lugar de repetir la
+    misma consulta contra la base de datos.
+    """
+
+    PREFIX = "api:cache"
+    GENERATION_KEY = "api:cache:generation"
+    POLL_SECONDS = 0.05
+
+    def __init__(
+        self,
+        client: redis.Redis | None = None,
+        async_client: redis.asyncio.Redis | None = None,
+    ):
+        """
+        Args:
+            client: Cliente Redis síncrono (tareas). Si None, usa el compartido
+            async_client: Cliente Redis asíncrono (API). Si None, usa el compartido
+        """
+        self._client = client
+        self._async_client = async_client
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = get_redis()
+        return self._client
+
+    @property
+    def async_client(self) -> redis.asyncio.Redis:
+        if self._async_client is None:
+            self._async_client = get_async_redis()
+        return self._async_client
+
+    @staticmethod
+    def normalize(params: Dict[str, Any]) -> str:
+        """Parámetros en forma canónica: claves ordenadas, texto en minúsculas, sin None"""
+        canonical = {
+            name: value.strip().lower() if isinstance(value, str) else value
+            for name, value in params.items()
+            if value is not None
+        }
+        return json.dumps(canonical, sort_keys=True, separators=(",", ":"), default=str)
+
+    def key(self, endpoint: str, params: Dict[str, Any], generation: int) -> str:
+        """Clave de la respuesta de un endpoint con ciertos parámetros"""
+        digest = hashlib.blake2b(self.normalize(params).encode(), digest_size=16).hexdigest()
+        return f"{self.PREFIX}:{endpoint}:{generation}:{digest}"
+
+    def bump(self) -> int:
+        """
+        Invalida todas las respuestas en caché pasando a una nueva generación.
+
+        Returns:
+            Nueva generación
+        """
+        return int(self.client.incr(self.GENERATION_KEY))
+
+    async def generation(self) -> int:
+        """Generación actual (0 si nunca se corrió un análisis)"""
+        value = await self.async_client.get(self.GENERATION_KEY)
+        return int(value or 0)
+
+    def etag(self, endpoint: str, params: Dict[str, Any], generation: int) -> str:
+        """
+        ETag débil de una respuesta.
+
+        Depende solo de la generación y de los parámetros, así que se
+        puede comparar con If-None-Match sin calcular la respuesta. Es
+        débil porque el mismo contenido sale sin comprimir, con GZip o con
+        Brotli según Accept-Encoding, y un ETag fuerte debe cambiar con los
+        bytes enviados.
+        """
+        raw = f"{endpoint}:{generation}:{self.normalize(params)}"
+        return f'W/"{hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()}"'
+
+    async def _wait(self, key: str, lock: str) -> bytes | None:
+        """Espera a que el dueño del lock guarde la respuesta"""
+        deadline = time.monotonic() + settings.cache_lock_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.POLL_SECONDS)
+            cached, locked = await self.async_client.mget([key, lock])
+            if cached is not None:
+                return cached
+            if locked is None:
+                # El dueño terminó sin guardar (error): calcular aquí
+                return None
+        return None
+
+    async def get_or_compute(
+        self,
+        endpoint: str,
+        params: Dict[str, Any],
+        compute: Callable[[], Awaitable[bytes]],
+        generation: int | None = None,
+    ) -> bytes:
+        """
+        Respuesta en caché o calculada (y guardada) si no existe.
+
+        Si Redis no está disponible se calcula sin caché.
+
+        Args:
+            endpoint: Nombre del endpoint (parte de la clave)
+            params: Parámetros de la query
+            compute: Corutina que genera el JSON serializado
+            generation: Generación ya leída. Si None, se consulta
+
+        Returns:
+            Cuerpo JSON de la respuesta
+        """
+        if not settings.cache_api_responses:
+            return await compute()
+
+        token = None
+        try:
+            if generation is None:
+                generation = await self.generation()
+            key = self.key(endpoint, params, generation)
+            cached = await self.async_client.get(key)
+            if cached is not None:
+                return cached
+
+            lock = f"{key}:lock"
+            token = uuid4().hex
+            if not await self.async_client.set(
+                lock, token, nx=True, ex=settings.cache_lock_seconds
+            ):
+                token = None
+                cached = await self._wait(key, lock)
+                if cached is not None:
+                    return cached
+        except redis.RedisError as e:
+            logger.warning(f"Caché de respuestas no disponible: {e}")
+            return await compute()
+
+        try:
+            body = await compute()
+            try:
+                await self.async_client.set(key, body, ex=settings.cache_ttl_seconds)
+            except redis.RedisError as e:
+                logger.warning(f"No se pudo guardar la respuesta en caché: {e}")
+            return body
+        finally:
+            if token is not None:
+                try:
+                    await self.async_client.eval(_UNLOCK_SCRIPT, 1, lock, token)
+                except redis.RedisError as e:
+                    logger.warning(f"No se pudo liberar el lock de caché {lock}: {e}")
+
+
+# Instancia global
+response_cache = ResponseCache()
@@ -0,0 +1,264 @@
+"""
+Contador de tendencias en tiempo real sobre ventanas deslizantes
+"""
+
+from typing import Any, Dict, Iterable, List
+from collections import Counter
+import time
+import logging
+
+import redis
+from redis.commands.core import Script
+
+from src.utils.config import settings
+from src.utils.keyword_matcher import normalize_keyword
+from src.utils.redis_client import get_redis
+from src.utils.sketches import SketchIndexer
+
+logger = logging.getLogger(__name__)
+
+# Space-Saving atómico sobre un sorted set (miembro = término, score = conteo)
+_SPACE_SAVING_LUA = """
+local k = tonumber(ARGV[1])
+for i = 3, #ARGV, 2 do
+    local term = ARGV[i]
+    local count = tonumber(ARGV[i + 1])
+    if redis.call('ZSCORE', KEYS[1], term) or redis.call('ZCARD', KEYS[1]) < k then
+        redis.call('ZINCRBY', KEYS[1], count, term)
+    else
+        local victim = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+        redis.call('ZREM', KEYS[1], victim[1])
+        redis.call('ZADD', KEYS[1], tonumber(victim[2]) + count, term)
+    end
+end
+redis.call('EXPIRE', KEYS[1], tonumber(ARGV[2]))
+return 1
+"""
+
+TODOS = "*"
+
+
+class StreamingTrendCounter:
+    """
+    Cuenta keywords de temas recién procesados en ventanas deslizantes.
+
+    El tiempo se divide en buckets de `streaming_trends_bucket_seconds`.
+    Por cada bucket y segmento (plataforma × ubicación, más los agregados
+    por plataforma y global) se guarda en Redis:
+
+    - Un Count-Min Sketch como hash (campo = posición en la tabla)
+    - Un top-K Space-Saving como sorted set de `streaming_trends_topk`
+
+    Ambos tienen tamaño acotado y expiran solos. La ventana actual son los
+    últimos `streaming_trends_window_buckets` buckets; la anterior, los
+    mismos buckets desplazados una ventana. Las actualizaciones son
+    atómicas (HINCRBY y un script Lua), así que varios workers pueden
+    registrar en paralelo.
+    """
+
+    PREFIX = "trends:stream"
+
+    def __init__(self, client: redis.Redis | None = None):
+        """
+        Args:
+            client: Cliente Redis. Si None, usa el cliente compartido
+        """
+        self._client = client
+        self._space_saving: Script | None = None
+        self.sketch = SketchIndexer(
+            width=settings.streaming_trends_cms_width,
+            depth=settings.streaming_trends_cms_depth,
+        )
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = get_redis()
+        return self._client
+
+    @property
+    def space_saving(self) -> Script:
+        if self._space_saving is None:
+            self._space_saving = self.client.register_script(_SPACE_SAVING_LUA)
+        return self._space_saving
+
+    # ------------------------------------------------------------------
+    # Claves
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def segment(plataforma: str | None, ubicacion: str | None) -> str:
+        """Identificador de segmento ('*' = todos)"""
+        return f"{plataforma or TODOS}:{ubicacion or TODOS}"
+
+    @staticmethod
+    def _bucket(timestamp: float) -> int:
+        return int(timestamp // settings.streaming_trends_bucket_seconds)
+
+    def _cms_key(self, segment: str, bucket: int) -> str:
+        return f"{self.PREFIX}:cms:{segment}:{bucket}"
+
+    def _topk_key(self, segment: str, bucket: int) -> str:
+        return f"{self.PREFIX}:topk:{segment}:{bucket}"
+
+    @staticmethod
+    def _ttl() -> int:
+        # Dos ventanas (actual y anterior) más el bucket en curso
+        return settings.streaming_trends_bucket_seconds * (
+            2 * settings.streaming_trends_window_buckets + 1
+        )
+
+    # ------------------------------------------------------------------
+    # Escritura
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        plataforma: str,
+        ubicacion: str | None,
+        terms: Iterable[str],
+        timestamp: float | None = None,
+    ) -> int:
+        """
+        Registra los términos de un tema procesado.
+
+        Args:
+            plataforma: youtube, reddit o mastodon
+            ubicacion: Ubicación inferida (None = desconocida)
+            terms: Keywords del tema (se normalizan y deduplican)
+            timestamp: Momento del evento. Si None, usa la hora actual
+
+        Returns:
+            Número de términos distintos registrados
+        """
+        counts = Counter(
+            term for term in {normalize_keyword(raw) for raw in terms} if term
+        )
+        if not counts:
+            return 0
+
+        bucket = self._bucket(timestamp if timestamp is not None else time.time())
+        ttl = self._ttl()
+        pairs: List[Any] = [value for item in counts.items() for value in item]
+
+        pipe = self.client.pipeline(transaction=False)
+        for segment in {
+            self.segment(plataforma, ubicacion),
+            self.segment(plataforma, None),
+            self.segment(None, None),
+        }:
+            cms_key = self._cms_key(segment, bucket)
+            for term, count in counts.items():
+                for index in self.sketch.indexes(term):
+                    pipe.hincrby(cms_key, index, count)
+            pipe.expire(cms_key, ttl)
+
+            self.space_saving(
+                keys=[self._topk_key(segment, bucket)],
+                args=[settings.streaming_trends_topk, ttl, *pairs],
+                client=pipe,
+            )
+        pipe.execute()
+
+        return len(counts)
+
+    # ------------------------------------------------------------------
+    # Lectura
+    # ------------------------------------------------------------------
+
+    def _estimates(
+        self,
+        segment: str,
+        buckets: List[int],
+        terms: List[str],
+    ) -> Dict[str, int]:
+        """Frecuencia estimada de cada término sumando los buckets de una ventana"""
+        indexes = {term: self.sketch.indexes(term) for term in terms}
+        fields = sorted({index for positions in indexes.values() for index in positions})
+
+        pipe = self.client.pipeline(transaction=False)
+        for bucket in buckets:
+            pipe.hmget(self._cms_key(segment, bucket), fields)
+
+        totals = dict.fromkeys(fields, 0)
+        for values in pipe.execute():
+            for field, value in zip(fields, values):
+                if value is not None:
+                    totals[field] += int(value)
+
+        return {
+            term: min(totals[index] for index in positions)
+            for term, positions in indexes.items()
+        }
+
+    def trending_now(
+        self,
+        plataforma: str | None = None,
+        ubicacion: str | None = None,
+        top_n: int = 20,
+        timestamp: float | None = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Términos en tendencia en la ventana actual.
+
+        Los candidatos son los términos con más conteo en los top-K de los
+        buckets de la ventana; sus frecuencias salen de los Count-Min
+        Sketches de la ventana actual y la anterior.
+
+        Args:
+            plataforma: Filtrar por plataforma (None = todas)
+            ubicacion: Filtrar por ubicación (requiere plataforma)
+            top_n: Número de términos a retornar
+            timestamp: Fin de la ventana. Si None, usa la hora actual
+
+        Returns:
+            Lista de dicts (termino, menciones, menciones_previas,
+            crecimiento), ordenada por aumento de menciones
+        """
+        segment = self.segment(plataforma, ubicacion if plataforma else None)
+        window = settings.streaming_trends_window_buckets
+        current = self._bucket(timestamp if timestamp is not None else time.time())
+        current_buckets = [current - i for i in range(window)]
+        previous_buckets = [current - window - i for i in range(window)]
+
+        pipe = self.client.pipeline(transaction=False)
+        for bucket in current_buckets:
+            pipe.zrange(self._topk_key(segment, bucket), 0, -1, withscores=True)
+
+        merged: Counter = Counter()
+        for members in pipe.execute():
+            for term, count in members:
+                merged[term] += int(count)
+
+        candidates = [term for term, _ in merged.most_common(settings.streaming_trends_topk)]
+        if not candidates:
+            return []
+
+        menciones = self._estimates(segment, current_buckets, candidates)
+        previas = self._estimates(segment, previous_buckets, candidates)
+
+        items = []
+        for term in candidates:
+            actual, anterior = menciones[term], previas[term]
+            if anterior > 0:
+                crecimiento = (actual - anterior) / anterior
+            else:
+                crecimiento = 1.0 if actual > 0 else 0.0
+            items.append(
+                {
+                    "termino": term,
+                    "menciones": actual,
+                    "menciones_previas": anterior,
+                    "crecimiento": crecimiento,
+                }
+            )
+
+        items.sort(
+            key=lambda item: (item["menciones"] - item["menciones_previas"], item["menciones"]),
+            reverse=True,
+        )
+        return items[:top_n]
+
+
+# Instancia global
+streaming_trends = StreamingTrendCounter()
@@ -0,0 +1,191 @@
+"""
+Consultas de exportación de tendencias y archivos de exportación en spool
+"""
+
+from typing import Callable, Tuple
+from datetime import datetime, timedelta
+from pathlib import Path
+import logging
+import os
+import time
+
+from sqlalchemy import Select, desc, func, select
+from sqlalchemy.orm import Session
+
+from src.models.tema import TemaIdentificado
+from src.models.tendencia import Tendencia
+from src.services.export_writers import export_writer
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+def filter_tendencias(
+    query: Select,
+    cutoff_time: datetime,
+    plataforma: str | None,
+    ubicacion: str | None,
+    solo_activas: bool,
+) -> Select:
+    """Filtros comunes del listado y la exportación de tendencias"""
+    query = query.where(Tendencia.fecha_hora >= cutoff_time)
+
+    if solo_activas:
+        query = query.where(Tendencia.es_tendencia == True)
+
+    if plataforma:
+        query = query.where(Tendencia.plataforma == plataforma.lower())
+
+    if ubicacion:
+        query = query.where(Tendencia.ubicacion.ilike(f"%{ubicacion}%"))
+
+    return query
+
+
+def export_query(
+    hours_back: int,
+    plataforma: str | None = None,
+    ubicacion: str | None = None,
+    solo_activas: bool = True,
+) -> Select:
+    """
+    Query de exportación con las columnas de `EXPORT_COLUMNS`.
+
+    Returns:
+        Select ordenado por fecha descendente
+    """
+    cutoff_time = datetime.utcnow() - timedelta(hours=hours_back)
+    query = select(
+        Tendencia.id,
+        Tendencia.fecha_hora,
+        Tendencia.tema_id,
+        func.coalesce(TemaIdentificado.tema_nombre, "Desconocido"),
+        Tendencia.plataforma,
+        Tendencia.ubicacion,
+        Tendencia.edad_rango,
+        Tendencia.genero,
+        Tendencia.volumen_menciones,
+        Tendencia.tasa_crecimiento,
+        Tendencia.sentimiento_promedio,
+        Tendencia.es_tendencia,
+        Tendencia.engagement_total,
+        Tendencia.autores_unicos,
+        Tendencia.puntuacion,
+        Tendencia.puntuacion_z,
+        TemaIdentificado.keywords,
+    ).outerjoin(TemaIdentificado, TemaIdentificado.id == Tendencia.tema_id)
+
+    query = filter_tendencias(query, cutoff_time, plataforma, ubicacion, solo_activas)
+    return query.order_by(desc(Tendencia.fecha_hora))
+
+
+class ExportSpool:
+    """
+    Directorio local donde las tareas de exportación dejan sus archivos.
+
+    Cada exportación se escribe como `<task_id>.<ext>.part` y se renombra
+    al terminar, así que un archivo sin `.part` siempre está completo. El
+    directorio puede ser un volumen compartido entre el worker y la API
+    (o el punto de montaje de un object store).
+    """
+
+    PARTIAL_SUFFIX = ".part"
+
+    def __init__(self, directory: str | None = None):
+        """
+        Args:
+            directory: Directorio del spool. Si None, usa settings
+        """
+        self._directory = directory
+
+    @property
+    def directory(self) -> Path:
+        path = Path(self._directory or settings.export_spool_dir)
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def find(self, task_id: str) -> Path | None:
+        """Archivo terminado de una exportación (None si no existe o sigue en curso)"""
+        for path in self.directory.glob(f"{task_id}.*"):
+            if path.suffix != self.PARTIAL_SUFFIX:
+                return path
+        return None
+
+    def write(
+        self,
+        db: Session,
+        formato: str,
+        query: Select,
+        task_id: str,
+        progress: Callable[[int], None] | None = None,
+    ) -> Tuple[Path, int, bool]:
+        """
+        Ejecuta la query con un cursor del servidor y escribe el archivo por lotes.
+
+        En formatos con límite de filas (Excel) la query se limita y las
+        filas que no caben se descartan; el resultado indica el recorte.
+
+        Args:
+            db: Sesión de base de datos
+            formato: csv, ndjson, xlsx o parquet
+            query: Query de `export_query`
+            task_id: Identificador de la exportación (nombre del archivo)
+            progress: Se llama con las filas escritas tras cada lote
+
+        Returns:
+            Tupla (archivo final, filas escritas, si se descartaron filas)
+
+        Raises:
+            ValueError: Si el formato no es válido o no está disponible
+        """
+        writer = export_writer(formato)
+        final = self.directory / f"{task_id}.{writer.extension}"
+        partial = final.with_name(final.name + self.PARTIAL_SUFFIX)
+
+        filas = 0
+        try:
+            with open(partial, "wb") as output:
+                output.write(writer.open())
+                result = db.execute(
+                    writer.limit_rows(query).execution_options(
+                        yield_per=settings.export_chunk_rows
+                    )
+                )
+                for partition in result.partitions():
+                    output.write(writer.write([tuple(row) for row in partition]))
+                    filas += len(partition)
+                    if writer.truncated:
+                        filas = writer.max_rows
+                    if progress:
+                        progress(filas)
+                for chunk in writer.close():
+                    output.write(chunk)
+        except BaseException:
+            partial.unlink(missing_ok=True)
+            raise
+
+        os.replace(partial, final)
+        if writer.truncated:
+            logger.warning(
+                f"Exportación {task_id} recortada a {writer.max_rows} filas ({formato})"
+            )
+        return final, filas, writer.truncated
+
+    def cleanup(self, max_age_hours: int) -> int:
+        """
+        Borra exportaciones (terminadas o abandonadas) más antiguas que la retención.
+
+        Returns:
+            Archivos borrados
+        """
+        limit = time.time() - max_age_hours * 3600
+        removed = 0
+        for path in self.directory.iterdir():
+            if path.is_file() and path.stat().st_mtime < limit:
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
+
+
+# Instancia global
+export_spool = ExportSpool()
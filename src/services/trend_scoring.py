@@ -0,0 +1,278 @@
+"""
+Puntuación de tendencias ponderada por engagement
+"""
+
+from typing import Any, Dict, List, Tuple
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+
+import numpy as np
+import redis
+from sqlalchemy import BigInteger, func, literal_column
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import Session
+
+from src.models.contenido import ContenidoRecolectado
+from src.models.demografia import Demografia
+from src.models.tema import TemaIdentificado
+from src.services.author_sketches import author_sketches
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+# (tema_nombre, plataforma, ubicacion, edad_rango, genero)
+SegmentKey = Tuple[str, str, str, str, str]
+
+# Métricas de `metadata` que se suman como engagement (según plataforma)
+ENGAGEMENT_KEYS = (
+    "view_count",
+    "like_count",
+    "comment_count",
+    "score",
+    "num_comments",
+    "favourites_count",
+    "reblogs_count",
+    "replies_count",
+)
+
+DESCONOCIDO = "Desconocido"
+
+
+@dataclass
+class SegmentFeatures:
+    """
+    Matriz de features por segmento (una fila por segmento).
+
+    Cada array tiene la misma longitud que `keys`.
+    """
+
+    keys: List[SegmentKey]
+    tema_ids: List[Any]
+    mentions: np.ndarray
+    previous_mentions: np.ndarray
+    engagement: np.ndarray
+    sentiment: np.ndarray
+    authors: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+
+@dataclass
+class SegmentScores:
+    """Resultado vectorizado de `TrendScorer.score`"""
+
+    growth: np.ndarray
+    score: np.ndarray
+    zscore: np.ndarray
+    es_tendencia: np.ndarray
+
+
+class TrendScorer:
+    """
+    Calcula la puntuación de tendencia de todos los segmentos en una pasada.
+
+    Features (escala log para volumen, engagement y autores):
+    - log1p(menciones)
+    - log1p(engagement sumado de `metadata`)
+    - log1p(autores únicos)
+    - crecimiento respecto del período anterior (acotado)
+    - intensidad del sentimiento (|promedio|)
+
+    La puntuación es la suma ponderada con los pesos `trend_weight_*` de
+    settings, y el z-score la compara con el resto de segmentos del mismo
+    análisis. Un segmento es tendencia si alcanza `trending_min_mentions` y
+    es un pico respecto de su línea base (ver `BurstDetector`; umbral de
+    crecimiento si aún no tiene historial) o supera el umbral de z-score.
+    """
+
+    # Cota del crecimiento para que un segmento nuevo no domine la puntuación
+    MAX_GROWTH = 10.0
+
+    @staticmethod
+    def weights() -> np.ndarray:
+        """Pesos de cada feature, en el orden de `feature_matrix`"""
+        return np.array(
+            [
+                settings.trend_weight_mentions,
+                settings.trend_weight_engagement,
+                settings.trend_weight_authors,
+                settings.trend_weight_growth,
+                settings.trend_weight_sentiment,
+            ],
+            dtype=np.float64,
+        )
+
+    @staticmethod
+    def growth(mentions: np.ndarray, previous: np.ndarray) -> np.ndarray:
+        """
+        Tasa de crecimiento respecto del período anterior.
+
+        Sin menciones previas, el crecimiento es 1.0 si hay menciones y 0.0
+        si no (misma convención que el análisis por conteo).
+        """
+        mentions = mentions.astype(np.float64)
+        previous = previous.astype(np.float64)
+        safe_previous = np.where(previous > 0, previous, 1.0)
+        return np.where(
+            previous > 0,
+            (mentions - previous) / safe_previous,
+            np.where(mentions > 0, 1.0, 0.0),
+        )
+
+    def feature_matrix(self, features: SegmentFeatures, growth: np.ndarray) -> np.ndarray:
+        """Matriz (segmentos × features) ya escalada"""
+        return np.column_stack(
+            [
+                np.log1p(features.mentions),
+                np.log1p(np.maximum(features.engagement, 0)),
+                np.log1p(features.authors),
+                np.clip(growth, -1.0, self.MAX_GROWTH),
+                np.abs(features.sentiment),
+            ]
+        )
+
+    def score(self, features: SegmentFeatures, bursts=None) -> SegmentScores:
+        """
+        Puntúa todos los segmentos.
+
+        Args:
+            features: Features por segmento
+            bursts: Resultado de `BurstDetector.detect` (opcional). Los
+                segmentos con línea base suficiente usan la detección de
+                picos en lugar del umbral de crecimiento
+
+        Returns:
+            Crecimiento, puntuación, z-score y marca de tendencia por segmento
+        """
+        growth = self.growth(features.mentions, features.previous_mentions)
+
+        if len(features) == 0:
+            empty = np.zeros(0)
+            return SegmentScores(empty, empty, empty, np.zeros(0, dtype=bool))
+
+        score = self.feature_matrix(features, growth) @ self.weights()
+
+        std = score.std()
+        zscore = (score - score.mean()) / std if std > 0 else np.zeros_like(score)
+
+        creciendo = growth >= settings.trending_growth_threshold
+        if bursts is not None:
+            creciendo = np.where(bursts.warm, bursts.es_pico, creciendo)
+
+        es_tendencia = (features.mentions >= settings.trending_min_mentions) & (
+            creciendo | (zscore >= settings.trending_zscore_threshold)
+        )
+
+        return SegmentScores(growth, score, zscore, es_tendencia)
+
+    # ------------------------------------------------------------------
+    # Extracción de features
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _engagement_expression():
+        """Suma de las métricas de engagement guardadas en `metadata`"""
+        metadata = ContenidoRecolectado.__table__.c.metadata
+        total = None
+        for key in ENGAGEMENT_KEYS:
+            value = func.coalesce(metadata[key].astext.cast(BigInteger), 0)
+            total = value if total is None else total + value
+        return total
+
+    @staticmethod
+    def _segment_columns():
+        # Literal (no parámetro) para que SELECT y GROUP BY coincidan
+        desconocido = literal_column(f"'{DESCONOCIDO}'")
+        return (
+            TemaIdentificado.tema_nombre,
+            Demografia.plataforma,
+            func.coalesce(Demografia.ubicacion_pais, desconocido),
+            func.coalesce(Demografia.edad_rango, desconocido),
+            func.coalesce(Demografia.genero, desconocido),
+        )
+
+    def load_features(
+        self,
+        db: Session,
+        start: datetime,
+        end: datetime,
+        previous_start: datetime,
+    ) -> SegmentFeatures:
+        """
+        Agrupa temas por segmento y arma la matriz de features.
+
+        Usa dos queries agrupadas (período actual y anterior) en lugar de
+        una query por segmento. Los autores únicos salen de los sketches
+        HyperLogLog (`AuthorSketches`), no de un COUNT(DISTINCT) sobre el join.
+
+        Args:
+            db: Sesión de base de datos
+            start: Inicio del período analizado
+            end: Fin del período analizado
+            previous_start: Inicio del período anterior (termina en `start`)
+
+        Returns:
+            Features de los segmentos con menciones en el período
+        """
+        segment = self._segment_columns()
+
+        rows = (
+            db.query(
+                *segment,
+                func.count(TemaIdentificado.id),
+                func.coalesce(func.sum(self._engagement_expression()), 0),
+                func.coalesce(func.avg(TemaIdentificado.sentimiento_score), 0.0),
+                # Tema representativo: el identificado más recientemente
+                func.array_agg(
+                    aggregate_order_by(
+                        TemaIdentificado.id, TemaIdentificado.identificado_at.desc()
+                    )
+                )[1],
+            )
+            .join(Demografia, Demografia.tema_id == TemaIdentificado.id)
+            .join(ContenidoRecolectado, ContenidoRecolectado.id == TemaIdentificado.contenido_id)
+            .filter(
+                TemaIdentificado.identificado_at >= start,
+                TemaIdentificado.identificado_at < end,
+            )
+            .group_by(*segment)
+            .all()
+        )
+
+        previous: Dict[SegmentKey, int] = {
+            tuple(row[:5]): row[5]
+            for row in db.query(*segment, func.count(TemaIdentificado.id))
+            .join(Demografia, Demografia.tema_id == TemaIdentificado.id)
+            .filter(
+                TemaIdentificado.identificado_at >= previous_start,
+                TemaIdentificado.identificado_at < start,
+            )
+            .group_by(*segment)
+        }
+
+        keys: List[SegmentKey] = [tuple(row[:5]) for row in rows]
+        count = len(rows)
+
+        try:
+            authors = author_sketches.count(keys, start, end)
+        except redis.RedisError as e:
+            logger.warning(f"Sketches de autores no disponibles: {e}")
+            authors = np.zeros(count)
+
+        return SegmentFeatures(
+            keys=keys,
+            tema_ids=[row[8] for row in rows],
+            mentions=np.fromiter((row[5] for row in rows), dtype=np.float64, count=count),
+            previous_mentions=np.fromiter(
+                (previous.get(key, 0) for key in keys), dtype=np.float64, count=count
+            ),
+            engagement=np.fromiter((row[6] for row in rows), dtype=np.float64, count=count),
+            sentiment=np.fromiter((row[7] for row in rows), dtype=np.float64, count=count),
+            authors=authors,
+        )
+
+
+# Instancia global
+trend_scorer = TrendScorer()
@@ -0,0 +1,189 @@
+"""
+Consulta de Google Trends por lotes con caché para validar tendencias
+"""
+
+from typing import Any, Callable, Dict, Iterable, List
+import json
+import logging
+
+import redis
+
+from src.utils.config import settings
+from src.utils.rate_limiter import RateLimiter, rate_limiter_manager
+from src.utils.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+class TrendsValidator:
+    """
+    Obtiene el interés de Google Trends de muchos términos con pocas requests.
+
+    - Los términos se deduplican entre todas las tendencias pendientes
+      (los segmentos de un mismo tema comparten keywords)
+    - Cada request lleva hasta `TERMS_PER_REQUEST` términos (límite de
+      Google Trends)
+    - El resultado de cada término se guarda en Redis con TTL, con clave
+      (término, geo, timeframe)
+    - Las requests pasan por el rate limiter compartido `google_trends`
+
+    Google Trends normaliza los valores de una request respecto del
+    término más buscado de la misma request, así que el valor absoluto
+    depende de con qué términos se empaquetó. Por eso la validación usa
+    una métrica que no cambia con esa escala: el interés del último
+    tramo del período respecto del promedio del período.
+    """
+
+    TERMS_PER_REQUEST = 5
+    CACHE_PREFIX = "gtrends"
+    # Fracción final del período considerada "reciente" (1 día de 7)
+    RECENT_FRACTION = 1 / 7
+
+    def __init__(
+        self,
+        client_factory: Callable[[], Any] | None = None,
+        client: redis.Redis | None = None,
+        rate_limiter: RateLimiter | None = None,
+    ):
+        """
+        Args:
+            client_factory: Crea el cliente de pytrends. Si None, usa TrendReq
+            client: Cliente Redis para la caché. Si None, usa el compartido
+            rate_limiter: Limiter de requests. Si None, usa el compartido
+        """
+        self._client_factory = client_factory
+        self._client = client
+        self.rate_limiter = rate_limiter or rate_limiter_manager.get_limiter(
+            "google_trends",
+            max_requests=settings.google_trends_rate_limit_requests,
+            period_seconds=settings.google_trends_rate_limit_period_seconds,
+        )
+
+    @property
+    def client(self) -> redis.Redis:
+        if self._client is None:
+            self._client = get_redis()
+        return self._client
+
+    def _pytrends(self) -> Any:
+        if self._client_factory is None:
+            from pytrends.request import TrendReq
+
+            self._client_factory = lambda: TrendReq(hl="es", tz=360)
+        return self._client_factory()
+
+    def _cache_key(self, term: str, geo: str, timeframe: str) -> str:
+        return f"{self.CACHE_PREFIX}:{geo}:{timeframe}:{term}"
+
+    @classmethod
+    def summarize(cls, values: List[float]) -> Dict[str, float]:
+        """
+        Resume la serie de interés de un término.
+
+        Returns:
+            Dict con promedio, promedio reciente y máximo
+        """
+        if not values:
+            return {"promedio": 0.0, "reciente": 0.0, "maximo": 0.0}
+
+        recent = values[-max(1, round(len(values) * cls.RECENT_FRACTION)) :]
+        return {
+            "promedio": sum(values) / len(values),
+            "reciente": sum(recent) / len(recent),
+            "maximo": float(max(values)),
+        }
+
+    @staticmethod
+    def rise(stats: Dict[str, float] | None) -> float:
+        """Interés reciente relativo al promedio del período (0.0 sin datos)"""
+        if not stats or stats["promedio"] <= 0:
+            return 0.0
+        return stats["reciente"] / stats["promedio"]
+
+    def _query(self, pytrends: Any, terms: List[str], geo: str, timeframe: str) -> Dict[str, Any]:
+        """Una request a Google Trends para hasta 5 términos"""
+        self.rate_limiter.acquire()
+        pytrends.build_payload(terms, cat=0, timeframe=timeframe, geo=geo)
+        interest = pytrends.interest_over_time()
+
+        return {
+            term: self.summarize(
+                [float(value) for value in interest[term].tolist()]
+                if not interest.empty and term in interest.columns
+                else []
+            )
+            for term in terms
+        }
+
+    def fetch(
+        self,
+        terms: Iterable[str],
+        geo: str | None = None,
+        timeframe: str | None = None,
+    ) -> Dict[str, Dict[str, float]]:
+        """
+        Interés de Google Trends de cada término.
+
+        Los términos en caché no se consultan. Si una request falla, sus
+        términos quedan fuera del resultado (se reintentan en la próxima
+        ejecución).
+
+        Args:
+            terms: Términos a consultar (se deduplican)
+            geo: Código de país. Si None, usa settings
+            timeframe: Período de pytrends. Si None, usa settings
+
+        Returns:
+            Resumen (`summarize`) por término
+        """
+        geo = settings.google_trends_geo if geo is None else geo
+        timeframe = timeframe or settings.google_trends_timeframe
+        unique = sorted(set(terms))
+        if not unique:
+            return {}
+
+        results: Dict[str, Dict[str, float]] = {}
+        try:
+            cached = self.client.mget([self._cache_key(term, geo, timeframe) for term in unique])
+            for term, value in zip(unique, cached):
+                if value is not None:
+                    results[term] = json.loads(value)
+        except redis.RedisError as e:
+            logger.warning(f"Caché de Google Trends no disponible: {e}")
+
+        missing = [term for term in unique if term not in results]
+        logger.info(
+            f"Google Trends: {len(unique)} términos, {len(unique) - len(missing)} en caché"
+        )
+        if not missing:
+            return results
+
+        pytrends = self._pytrends()
+        fetched: Dict[str, Dict[str, float]] = {}
+
+        for i in range(0, len(missing), self.TERMS_PER_REQUEST):
+            pack = missing[i : i + self.TERMS_PER_REQUEST]
+            try:
+                fetched.update(self._query(pytrends, pack, geo, timeframe))
+            except Exception as e:
+                logger.error(f"Error consultando Google Trends {pack}: {e}")
+
+        if fetched:
+            try:
+                pipe = self.client.pipeline(transaction=False)
+                for term, stats in fetched.items():
+                    pipe.setex(
+                        self._cache_key(term, geo, timeframe),
+                        settings.google_trends_cache_hours * 3600,
+                        json.dumps(stats),
+                    )
+                pipe.execute()
+            except redis.RedisError as e:
+                logger.warning(f"No se pudo guardar en caché de Google Trends: {e}")
+
+        results.update(fetched)
+        return results
+
+
+# Instancia global
+trends_validator = TrendsValidator()
@@ -3,20 +3,26 @@ Tareas Celery para análisis de tendencias
 """
 
 from typing import Dict, Any
+from collections import defaultdict
 from uuid import UUID
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import logging
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+from sqlalchemy import and_, insert
+import redis
 
 from src.celery_app import celery_app
 from src.models.base import SessionLocal
 from src.models.tema import TemaIdentificado
-from src.models.demografia import Demografia
 from src.models.tendencia import Tendencia
 from src.models.validacion import ValidacionTendencia
+from src.services.trend_scoring import trend_scorer
+from src.services.burst_detector import burst_detector
+from src.services.response_cache import response_cache
+from src.services.trends_validator import trends_validator
 from src.utils.config import settings
+from src.utils.geo import trends_geo
 
 try:
     from pytrends.request import TrendReq
@@ -31,14 +37,24 @@ def get_db() -> Session:
     return SessionLocal()
 
 
+def _invalidate_responses() -> None:
+    """Invalida las respuestas de /tendencias en caché tras un commit"""
+    try:
+        response_cache.bump()
+    except redis.RedisError as e:
+        logger.warning(f"No se pudo invalidar la caché de respuestas: {e}")
+
+
 @celery_app.task
 def analyze_trends() -> Dict[str, Any]:
     """
     Tarea programada que analiza tendencias basándose en temas identificados.
 
-    Calcula:
-    - Volumen de menciones por tema
-    - Crecimiento en las últimas horas
+    Calcula por segmento (tema × plataforma × ubicación × edad × género):
+    - Volumen de menciones, engagement, sentimiento y autores únicos
+    - Crecimiento respecto de la hora anterior
+    - Picos respecto de la línea base móvil del segmento (ver `BurstDetector`)
+    - Puntuación ponderada y z-score (ver `TrendScorer`)
     - Marca como tendencia si cumple umbrales
     """
     logger.info("Iniciando análisis de tendencias")
@@ -47,117 +63,56 @@ def analyze_trends() -> Dict[str, Any]:
 
     try:
         # Ventana de tiempo: última hora
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
         hour_ago = now - timedelta(hours=1)
-
-        # Agrupar temas por nombre y datos demográficos
-        query = (
-            db.query(
-                TemaIdentificado.tema_nombre,
-                Demografia.plataforma,
-                Demografia.ubicacion_pais,
-                Demografia.edad_rango,
-                Demografia.genero,
-                func.count(TemaIdentificado.id).label("volumen"),
-                func.avg(TemaIdentificado.sentimiento_score).label("avg_sentiment"),
-            )
-            .join(Demografia, Demografia.tema_id == TemaIdentificado.id)
-            .filter(TemaIdentificado.created_at >= hour_ago)
-            .group_by(
-                TemaIdentificado.tema_nombre,
-                Demografia.plataforma,
-                Demografia.ubicacion_pais,
-                Demografia.edad_rango,
-                Demografia.genero,
-            )
-        )
-
-        resultados = query.all()
-
-        logger.info(f"Segmentos encontrados: {len(resultados)}")
-
-        tendencias_creadas = 0
-
-        for row in resultados:
-            tema_nombre = row.tema_nombre
-            plataforma = row.plataforma
-            ubicacion = row.ubicacion_pais or "Desconocido"
-            edad_rango = row.edad_rango or "Desconocido"
-            genero = row.genero or "Desconocido"
-            volumen = row.volumen
-            avg_sentiment = row.avg_sentiment or 0.0
-
-            # Calcular crecimiento comparando con hora anterior
-            two_hours_ago = hour_ago - timedelta(hours=1)
-
-            volumen_anterior = (
-                db.query(func.count(TemaIdentificado.id))
-                .join(Demografia, Demografia.tema_id == TemaIdentificado.id)
-                .filter(
-                    and_(
-                        TemaIdentificado.tema_nombre == tema_nombre,
-                        TemaIdentificado.created_at >= two_hours_ago,
-                        TemaIdentificado.created_at < hour_ago,
-                        Demografia.plataforma == plataforma,
-                    )
-                )
-                .scalar()
-                or 0
-            )
-
-            # Calcular tasa de crecimiento
-            if volumen_anterior > 0:
-                tasa_crecimiento = (volumen - volumen_anterior) / volumen_anterior
-            else:
-                tasa_crecimiento = 1.0 if volumen > 0 else 0.0
-
-            # Determinar si es tendencia
-            es_tendencia = (
-                volumen >= settings.trending_min_mentions
-                and tasa_crecimiento >= settings.trending_growth_threshold
-            )
-
-            # Obtener un tema representativo (el primero)
-            tema_id = (
-                db.query(TemaIdentificado.id)
-                .join(Demografia, Demografia.tema_id == TemaIdentificado.id)
-                .filter(
-                    and_(
-                        TemaIdentificado.tema_nombre == tema_nombre,
-                        Demografia.plataforma == plataforma,
-                    )
-                )
-                .first()
-            )
-
-            if not tema_id:
-                continue
-
-            # Crear o actualizar registro de tendencia
-            tendencia = Tendencia(
-                tema_id=tema_id[0],
-                fecha_hora=now,
-                plataforma=plataforma,
-                ubicacion=ubicacion,
-                edad_rango=edad_rango,
-                genero=genero,
-                volumen_menciones=volumen,
-                tasa_crecimiento=tasa_crecimiento,
-                sentimiento_promedio=avg_sentiment,
-                es_tendencia=es_tendencia,
-            )
-
-            db.add(tendencia)
-            tendencias_creadas += 1
+        two_hours_ago = hour_ago - timedelta(hours=1)
+
+        features = trend_scorer.load_features(db, hour_ago, now, two_hours_ago)
+
+        logger.info(f"Segmentos encontrados: {len(features)}")
+
+        bursts = burst_detector.detect(db, features)
+        scores = trend_scorer.score(features, bursts)
+
+        rows = [
+            {
+                "tema_id": features.tema_ids[i],
+                "fecha_hora": now,
+                "plataforma": plataforma,
+                "ubicacion": ubicacion,
+                "edad_rango": edad_rango,
+                "genero": genero,
+                "volumen_menciones": int(features.mentions[i]),
+                "tasa_crecimiento": float(scores.growth[i]),
+                "sentimiento_promedio": float(features.sentiment[i]),
+                "engagement_total": int(features.engagement[i]),
+                "autores_unicos": int(features.authors[i]),
+                "puntuacion": float(scores.score[i]),
+                "puntuacion_z": float(scores.zscore[i]),
+                "pico_z": float(bursts.zscore[i]),
+                "pico_pvalor": float(bursts.pvalue[i]),
+                "es_tendencia": bool(scores.es_tendencia[i]),
+            }
+            for i, (_, plataforma, ubicacion, edad_rango, genero) in enumerate(features.keys)
+        ]
+
+        if rows:
+            # Insert masivo (executemany) en lugar de un ORM add por fila
+            db.execute(insert(Tendencia.__table__), rows)
 
         db.commit()
+        _invalidate_responses()
 
-        logger.info(f"Tendencias analizadas: {tendencias_creadas}")
+        logger.info(
+            f"Tendencias analizadas: {len(rows)}, "
+            f"activas: {int(scores.es_tendencia.sum())}"
+        )
 
         return {
             "status": "success",
-            "total_segments": len(resultados),
-            "trends_created": tendencias_creadas,
+            "total_segments": len(features),
+            "trends_created": len(rows),
+            "trending": int(scores.es_tendencia.sum()),
         }
 
     except Exception as e:
@@ -174,8 +129,11 @@ def validate_trends() -> Dict[str, Any]:
     """
     Tarea programada que valida tendencias con Google Trends.
 
-    Obtiene datos de Google Trends para las tendencias detectadas
-    y las marca como validadas o no validadas.
+    Toma hasta `google_trends_max_per_run` tendencias activas sin validar,
+    consulta una sola vez cada keyword de sus temas en el geo de la
+    ubicación del segmento (ver `TrendsValidator` y `trends_geo`) y marca
+    como validadas las que también muestran interés creciente en Google
+    Trends en esa ubicación.
     """
     if TrendReq is None:
         logger.warning("pytrends no instalado, validación no disponible")
@@ -186,92 +144,94 @@ def validate_trends() -> Dict[str, Any]:
     db = get_db()
 
     try:
-        # Obtener tendencias recientes sin validar
-        tendencias = (
-            db.query(Tendencia)
-            .outerjoin(ValidacionTendencia)
+        # Tendencias recientes sin validar, con las keywords de su tema
+        pendientes = (
+            db.query(
+                Tendencia.id,
+                Tendencia.ubicacion,
+                TemaIdentificado.tema_nombre,
+                TemaIdentificado.keywords,
+            )
+            .join(TemaIdentificado, TemaIdentificado.id == Tendencia.tema_id)
+            .outerjoin(ValidacionTendencia, ValidacionTendencia.tendencia_id == Tendencia.id)
             .filter(
                 and_(
                     Tendencia.es_tendencia == True,
                     ValidacionTendencia.id.is_(None),
                 )
             )
-            .limit(10)  # Limitar para no saturar API
+            .order_by(Tendencia.fecha_hora.desc())
+            .limit(settings.google_trends_max_per_run)
             .all()
         )
 
-        logger.info(f"Tendencias a validar: {len(tendencias)}")
-
-        pytrends = TrendReq(hl="es", tz=360)
-
-        validadas = 0
-
-        for tendencia in tendencias:
-            try:
-                # Obtener tema
-                tema = (
-                    db.query(TemaIdentificado)
-                    .filter(TemaIdentificado.id == tendencia.tema_id)
-                    .first()
-                )
+        # Cerrar la transacción mientras se consulta la API externa
+        db.commit()
 
-                if not tema or not tema.keywords:
-                    continue
+        # Primeras 3 keywords de cada tema y geo de Trends de su ubicación
+        por_tendencia = {
+            tendencia_id: (
+                tema_nombre,
+                (keywords or [])[:3],
+                trends_geo(ubicacion, default=settings.google_trends_geo),
+            )
+            for tendencia_id, ubicacion, tema_nombre, keywords in pendientes
+        }
 
-                # Usar primeras keywords para consultar Google Trends
-                keywords = tema.keywords[:3]  # Máximo 3 keywords
+        # Keywords por geo: cada (keyword, geo) se consulta una sola vez y
+        # sirve a todos los segmentos de esa ubicación
+        keywords_por_geo: Dict[str, set] = defaultdict(set)
+        for _, keywords, geo in por_tendencia.values():
+            keywords_por_geo[geo].update(keywords)
 
-                # Consultar Google Trends
-                pytrends.build_payload(
-                    keywords,
-                    cat=0,
-                    timeframe="now 7-d",  # Últimos 7 días
-                    geo="",  # Global, se puede especificar país
-                )
+        logger.info(
+            f"Tendencias a validar: {len(por_tendencia)}, geos: {len(keywords_por_geo)}"
+        )
 
-                # Obtener interest over time
-                interest_df = pytrends.interest_over_time()
-
-                google_trends_data = {}
-                validada = False
-
-                if not interest_df.empty:
-                    # Convertir a dict
-                    google_trends_data = interest_df.to_dict("list")
-
-                    # Verificar si hay interés significativo
-                    for keyword in keywords:
-                        if keyword in interest_df.columns:
-                            avg_interest = interest_df[keyword].mean()
-                            if avg_interest > 50:  # Umbral arbitrario
-                                validada = True
-                                break
-
-                # Crear registro de validación
-                validacion = ValidacionTendencia(
-                    tendencia_id=tendencia.id,
-                    google_trends_data=google_trends_data,
-                    validada=validada,
-                )
+        interes = {
+            geo: trends_validator.fetch(keywords, geo=geo)
+            for geo, keywords in keywords_por_geo.items()
+        }
 
-                db.add(validacion)
-                validadas += 1
+        rows = []
+        for tendencia_id, (tema_nombre, keywords, geo) in por_tendencia.items():
+            datos = {
+                keyword: interes[geo][keyword] for keyword in keywords if keyword in interes[geo]
+            }
 
-                # Pequeña pausa para no saturar API
-                import time
+            # Sin datos (sin keywords o request fallida): reintentar en otra ejecución
+            if not datos:
+                continue
 
-                time.sleep(2)
+            subida = max(trends_validator.rise(stats) for stats in datos.values())
+            en_google_trends = any(stats["maximo"] > 0 for stats in datos.values())
+
+            rows.append(
+                {
+                    "tendencia_id": tendencia_id,
+                    "tema_nombre": tema_nombre,
+                    "google_trends_data": {"geo": geo, "keywords": datos},
+                    "indice_coincidencia": min(
+                        1.0, subida / settings.google_trends_rise_ratio
+                    ),
+                    "validada": subida >= settings.google_trends_rise_ratio,
+                    "en_google_trends": en_google_trends,
+                    "solo_en_plataforma": not en_google_trends,
+                }
+            )
 
-            except Exception as e:
-                logger.error(f"Error validando tendencia {tendencia.id}: {e}")
-                continue
+        if rows:
+            db.execute(insert(ValidacionTendencia.__table__), rows)
 
         db.commit()
+        _invalidate_responses()
 
-        logger.info(f"Tendencias validadas: {validadas}")
+        validadas = sum(row["validada"] for row in rows)
+        logger.info(f"Tendencias evaluadas: {len(rows)}, validadas: {validadas}")
 
         return {
             "status": "success",
+            "total_evaluated": len(rows),
             "total_validated": validadas,
         }
 
@@ -2,30 +2,210 @@
 Tareas Celery para recolección de contenido
 """
 
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Set
+from collections import defaultdict
 from uuid import UUID
-from datetime import datetime
+from datetime import datetime, timezone
 import logging
 
 from celery import group, chord
+from redis.exceptions import LockError
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from src.celery_app import celery_app
 from src.models.base import SessionLocal
 from src.models.lineamiento import Lineamiento
 from src.models.contenido import ContenidoRecolectado
+from src.models.contenido_lineamiento import ContenidoLineamiento
 from src.collectors.youtube_collector import YouTubeCollector
 from src.collectors.reddit_collector import RedditCollector
 from src.collectors.mastodon_collector import MastodonCollector
+from src.collectors.contenido_builder import item_texto, contenido_values
+from src.services.lineamiento_matcher import lineamiento_matcher
+from src.services.collection_planner import collection_planner
+from src.services.adaptive_scheduler import adaptive_scheduler
+from src.services.engagement_refresher import engagement_refresher
+from src.utils.config import settings
+from src.utils.redis_client import get_redis
 
 logger = logging.getLogger(__name__)
 
+# Lock que impide ejecuciones simultáneas del refresco de engagement
+ENGAGEMENT_REFRESH_LOCK = "engagement_refresh:lock"
+
 
 def get_db() -> Session:
     """Helper para obtener sesión de base de datos"""
     return SessionLocal()
 
 
+# Collectors por plataforma (todos exponen collect_for_lineamiento y get_engagement)
+COLLECTORS = {
+    "youtube": YouTubeCollector,
+    "reddit": RedditCollector,
+    "mastodon": MastodonCollector,
+}
+
+
+def latest_publication(
+    db: Session,
+    plataforma: str,
+    lineamiento_ids: List[UUID],
+) -> datetime | None:
+    """
+    Cursor incremental de una query: publicación más reciente ya guardada.
+
+    Con varios lineamientos se usa la menor de sus publicaciones más
+    recientes, para no saltarse contenido de ninguno.
+
+    Args:
+        db: Sesión de SQLAlchemy
+        plataforma: youtube, reddit o mastodon
+        lineamiento_ids: Lineamientos cubiertos por la query
+
+    Returns:
+        Fecha UTC (naive) o None si algún lineamiento no tiene historial
+    """
+    rows = (
+        db.query(
+            ContenidoLineamiento.lineamiento_id,
+            func.max(ContenidoRecolectado.fecha_publicacion),
+        )
+        .join(
+            ContenidoRecolectado,
+            ContenidoRecolectado.id == ContenidoLineamiento.contenido_id,
+        )
+        .filter(
+            ContenidoRecolectado.plataforma == plataforma,
+            ContenidoLineamiento.lineamiento_id.in_(lineamiento_ids),
+        )
+        .group_by(ContenidoLineamiento.lineamiento_id)
+        .all()
+    )
+
+    if not rows or len(rows) < len(set(lineamiento_ids)):
+        return None
+
+    cursor = min(ultima for _, ultima in rows)
+    if cursor.tzinfo is not None:
+        cursor = cursor.astimezone(timezone.utc).replace(tzinfo=None)
+    return cursor
+
+
+def save_collected_items(
+    db: Session,
+    plataforma: str,
+    items: List[Dict[str, Any]],
+    lineamiento_ids: List[UUID],
+    record: bool = True,
+) -> Dict[str, Any]:
+    """
+    Guarda items recolectados y los asocia con sus lineamientos.
+
+    Con un solo lineamiento (recolección directa) todo el contenido se le
+    atribuye. Con varios (query combinada del planificador) cada item se
+    atribuye al primer lineamiento cuyas keywords coinciden localmente, y
+    se descartan los items que no coinciden con ninguno.
+
+    En el scheduler adaptativo cada item cuenta para todos los lineamientos
+    de la búsqueda que coinciden con él, no solo para el que lo guarda;
+    los items ya recolectados cuentan para los lineamientos con los que
+    aún no estaban asociados. No hace commit.
+
+    Args:
+        db: Sesión de SQLAlchemy
+        plataforma: youtube, reddit o mastodon
+        items: Items normalizados por el collector
+        lineamiento_ids: Lineamientos que originaron la búsqueda
+        record: Si False, no registra el rendimiento en el scheduler (las
+            queries de un ciclo planificado lo registran juntas al final)
+
+    Returns:
+        Dict con new_saved, lineamientos_tagged, discarded y yields
+        (lineamiento_id -> contenido nuevo)
+    """
+    # Buscar existentes en una sola query
+    plataforma_ids = [item["plataforma_id"] for item in items]
+    existentes: Dict[str, ContenidoRecolectado] = {}
+    if plataforma_ids:
+        existentes = {
+            contenido.plataforma_id: contenido
+            for contenido in db.query(ContenidoRecolectado).filter(
+                ContenidoRecolectado.plataforma == plataforma,
+                ContenidoRecolectado.plataforma_id.in_(plataforma_ids),
+            )
+        }
+
+    # Asociaciones previas de los existentes con los lineamientos de la búsqueda
+    # (por plataforma_id, para cubrir también items repetidos en el lote)
+    asociados: Dict[str, Set[UUID]] = defaultdict(set)
+    if existentes:
+        plataforma_id_de = {c.id: c.plataforma_id for c in existentes.values()}
+        for contenido_id, lineamiento_id in db.query(
+            ContenidoLineamiento.contenido_id, ContenidoLineamiento.lineamiento_id
+        ).filter(
+            ContenidoLineamiento.contenido_id.in_(list(plataforma_id_de)),
+            ContenidoLineamiento.lineamiento_id.in_(lineamiento_ids),
+        ):
+            asociados[plataforma_id_de[contenido_id]].add(lineamiento_id)
+
+    single = len(lineamiento_ids) == 1
+    matcher = None if single else lineamiento_matcher.get_matcher(db)
+
+    # Contenidos a asociar con lineamientos coincidentes
+    procesados = []
+    saved_count = 0
+    discarded = 0
+    yields: Dict[UUID, int] = {lineamiento_id: 0 for lineamiento_id in lineamiento_ids}
+
+    for item in items:
+        if single:
+            matches = [lineamiento_ids[0]]
+        else:
+            coincidencias = matcher.match(item_texto(plataforma, item))
+            matches = [lid for lid in lineamiento_ids if lid in coincidencias]
+
+        existing = existentes.get(item["plataforma_id"])
+        if existing:
+            # Ya recolectado por otro lineamiento: solo asociarlo
+            procesados.append(existing)
+            for lineamiento_id in matches:
+                if lineamiento_id not in asociados[existing.plataforma_id]:
+                    asociados[existing.plataforma_id].add(lineamiento_id)
+                    yields[lineamiento_id] += 1
+            continue
+
+        if not matches:
+            discarded += 1
+            continue
+
+        contenido = ContenidoRecolectado(**contenido_values(plataforma, item, matches[0]))
+        db.add(contenido)
+        existentes[contenido.plataforma_id] = contenido
+        procesados.append(contenido)
+        saved_count += 1
+        asociados[contenido.plataforma_id].update(matches)
+        for lineamiento_id in matches:
+            yields[lineamiento_id] += 1
+
+    db.flush()  # Obtener IDs de contenidos nuevos
+    tagged_count = lineamiento_matcher.tag_contenidos(
+        db,
+        [(c.id, c.contenido_texto) for c in procesados],
+        lineamiento_origen=lineamiento_ids[0] if single else None,
+    )
+    if record:
+        adaptive_scheduler.record_yields(db, plataforma, yields)
+
+    return {
+        "new_saved": saved_count,
+        "lineamientos_tagged": tagged_count,
+        "discarded": discarded,
+        "yields": {str(lineamiento_id): n for lineamiento_id, n in yields.items()},
+    }
+
+
 @celery_app.task(bind=True, max_retries=3)
 def collect_youtube(
     self,
@@ -61,49 +241,24 @@ def collect_youtube(
 
         # Guardar en base de datos
         db = get_db()
-        saved_count = 0
 
         try:
-            for video in videos:
-                # Verificar si ya existe
-                existing = (
-                    db.query(ContenidoRecolectado)
-                    .filter(
-                        ContenidoRecolectado.plataforma == "youtube",
-                        ContenidoRecolectado.plataforma_id == video["plataforma_id"],
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    contenido = ContenidoRecolectado(
-                        lineamiento_id=UUID(lineamiento_id),
-                        plataforma="youtube",
-                        plataforma_id=video["plataforma_id"],
-                        contenido_texto=f"{video['titulo']} {video['descripcion']}",
-                        autor=video["autor"],
-                        fecha_publicacion=datetime.fromisoformat(
-                            video["fecha_publicacion"].replace("Z", "+00:00")
-                        ),
-                        url=video["url"],
-                        metadata=video["metadata"],
-                        nlp_procesado=False,
-                    )
-                    db.add(contenido)
-                    saved_count += 1
-
+            stats = save_collected_items(
+                db, "youtube", videos, [UUID(lineamiento_id)]
+            )
             db.commit()
 
             logger.info(
                 f"Recolección YouTube completada: {len(videos)} encontrados, "
-                f"{saved_count} nuevos guardados"
+                f"{stats['new_saved']} nuevos guardados"
             )
 
             return {
                 "platform": "youtube",
                 "lineamiento_id": lineamiento_id,
                 "total_found": len(videos),
-                "new_saved": saved_count,
+                "new_saved": stats["new_saved"],
+                "lineamientos_tagged": stats["lineamientos_tagged"],
                 "status": "success",
             }
 
@@ -154,49 +309,24 @@ def collect_reddit(
 
         # Guardar en base de datos
         db = get_db()
-        saved_count = 0
 
         try:
-            for post in posts:
-                # Verificar si ya existe
-                existing = (
-                    db.query(ContenidoRecolectado)
-                    .filter(
-                        ContenidoRecolectado.plataforma == "reddit",
-                        ContenidoRecolectado.plataforma_id == post["plataforma_id"],
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    contenido = ContenidoRecolectado(
-                        lineamiento_id=UUID(lineamiento_id),
-                        plataforma="reddit",
-                        plataforma_id=post["plataforma_id"],
-                        contenido_texto=f"{post['titulo']} {post['descripcion']}",
-                        autor=post["autor"],
-                        fecha_publicacion=datetime.fromisoformat(
-                            post["fecha_publicacion"]
-                        ),
-                        url=post["url"],
-                        metadata=post["metadata"],
-                        nlp_procesado=False,
-                    )
-                    db.add(contenido)
-                    saved_count += 1
-
+            stats = save_collected_items(
+                db, "reddit", posts, [UUID(lineamiento_id)]
+            )
             db.commit()
 
             logger.info(
                 f"Recolección Reddit completada: {len(posts)} encontrados, "
-                f"{saved_count} nuevos guardados"
+                f"{stats['new_saved']} nuevos guardados"
             )
 
             return {
                 "platform": "reddit",
                 "lineamiento_id": lineamiento_id,
                 "total_found": len(posts),
-                "new_saved": saved_count,
+                "new_saved": stats["new_saved"],
+                "lineamientos_tagged": stats["lineamientos_tagged"],
                 "status": "success",
             }
 
@@ -243,55 +373,24 @@ def collect_mastodon(
 
         # Guardar en base de datos
         db = get_db()
-        saved_count = 0
 
         try:
-            for toot in toots:
-                # Verificar si ya existe
-                existing = (
-                    db.query(ContenidoRecolectado)
-                    .filter(
-                        ContenidoRecolectado.plataforma == "mastodon",
-                        ContenidoRecolectado.plataforma_id == toot["plataforma_id"],
-                    )
-                    .first()
-                )
-
-                if not existing:
-                    # Mastodon puede tener fecha en diferentes formatos
-                    try:
-                        fecha_pub = datetime.fromisoformat(
-                            toot["fecha_publicacion"].replace("Z", "+00:00")
-                        )
-                    except Exception:
-                        fecha_pub = datetime.utcnow()
-
-                    contenido = ContenidoRecolectado(
-                        lineamiento_id=UUID(lineamiento_id),
-                        plataforma="mastodon",
-                        plataforma_id=toot["plataforma_id"],
-                        contenido_texto=toot["descripcion"],
-                        autor=toot["autor"],
-                        fecha_publicacion=fecha_pub,
-                        url=toot["url"],
-                        metadata=toot["metadata"],
-                        nlp_procesado=False,
-                    )
-                    db.add(contenido)
-                    saved_count += 1
-
+            stats = save_collected_items(
+                db, "mastodon", toots, [UUID(lineamiento_id)]
+            )
             db.commit()
 
             logger.info(
                 f"Recolección Mastodon completada: {len(toots)} encontrados, "
-                f"{saved_count} nuevos guardados"
+                f"{stats['new_saved']} nuevos guardados"
             )
 
             return {
                 "platform": "mastodon",
                 "lineamiento_id": lineamiento_id,
                 "total_found": len(toots),
-                "new_saved": saved_count,
+                "new_saved": stats["new_saved"],
+                "lineamientos_tagged": stats["lineamientos_tagged"],
                 "status": "success",
             }
 
@@ -381,13 +480,100 @@ def collect_all_platforms(
     }
 
 
+@celery_app.task(bind=True, max_retries=3)
+def collect_planned_query(
+    self,
+    plataforma: str,
+    keywords: List[str],
+    lineamiento_ids: List[str],
+    hours_back: int = 24,
+    max_results: int = 50,
+) -> Dict[str, Any]:
+    """
+    Tarea Celery para ejecutar una query del plan de recolección.
+
+    La query puede combinar keywords de varios lineamientos; los resultados
+    se reparten entre ellos por matching local de keywords.
+
+    Args:
+        plataforma: youtube, reddit o mastodon
+        keywords: Keywords combinadas de la query
+        lineamiento_ids: UUIDs de los lineamientos cubiertos por la query
+        hours_back: Horas hacia atrás
+        max_results: Máximo de resultados
+
+    Returns:
+        Diccionario con estadísticas de recolección
+    """
+    try:
+        logger.info(
+            f"Iniciando query planificada {plataforma}: keywords={keywords}, "
+            f"lineamientos={len(lineamiento_ids)}"
+        )
+
+        ids = [UUID(lid) for lid in lineamiento_ids]
+        collect_kwargs: Dict[str, Any] = {}
+
+        if plataforma == "youtube":
+            # Cursor incremental: cada página de YouTube cuesta 100 unidades
+            db = get_db()
+            try:
+                collect_kwargs["since"] = latest_publication(db, plataforma, ids)
+            finally:
+                db.close()
+
+        collector = COLLECTORS[plataforma]()
+        items = collector.collect_for_lineamiento(
+            keywords=keywords,
+            hours_back=hours_back,
+            max_results=max_results,
+            **collect_kwargs,
+        )
+
+        # Guardar en base de datos
+        db = get_db()
+
+        try:
+            # El rendimiento se registra una vez por ciclo (record_collection_cycle)
+            stats = save_collected_items(db, plataforma, items, ids, record=False)
+            db.commit()
+
+            logger.info(
+                f"Query planificada {plataforma} completada: {len(items)} encontrados, "
+                f"{stats['new_saved']} nuevos guardados, "
+                f"{stats['discarded']} sin lineamiento coincidente"
+            )
+
+            return {
+                "platform": plataforma,
+                "lineamiento_ids": lineamiento_ids,
+                "total_found": len(items),
+                **stats,
+                "status": "success",
+            }
+
+        finally:
+            db.close()
+
+    except Exception as e:
+        logger.error(f"Error en query planificada {plataforma}: {e}", exc_info=True)
+        raise self.retry(exc=e, countdown=60 * (2**self.request.retries))
+
+
 @celery_app.task
-def collect_all_lineamientos() -> Dict[str, Any]:
+def collect_all_lineamientos(force: bool = False) -> Dict[str, Any]:
     """
     Tarea programada que recolecta contenido para todos los lineamientos activos.
 
+    Solo incluye los pares (lineamiento, plataforma) pendientes según el
+    scheduler adaptativo. Construye un plan que deduplica y combina sus
+    keywords (ver `CollectionPlanner`) y dispara una tarea por query.
+
+    Args:
+        force: Si True, ignora la programación y recolecta todos los pares
+
     Returns:
-        Estadísticas de recolección
+        Estadísticas de recolección y resumen del plan
     """
     logger.info("Iniciando recolección para todos los lineamientos activos")
 
@@ -399,30 +585,164 @@ def collect_all_lineamientos() -> Dict[str, Any]:
 
         logger.info(f"Lineamientos activos encontrados: {len(lineamientos)}")
 
-        # Crear tareas para cada lineamiento
-        tasks = []
+        if force:
+            pairs = None
+        else:
+            pairs = adaptive_scheduler.due_pairs(db, lineamientos)
+            logger.info(f"Pares (lineamiento, plataforma) pendientes: {len(pairs)}")
+
+        plan = collection_planner.plan(lineamientos, pairs=pairs)
 
-        for lineamiento in lineamientos:
-            task = collect_all_platforms.s(
-                lineamiento_id=str(lineamiento.id),
-                keywords=lineamiento.keywords,
-                plataformas=lineamiento.plataformas,
+        # Crear una tarea por query planificada
+        tasks = [
+            collect_planned_query.s(
+                plataforma=query.plataforma,
+                keywords=query.keywords,
+                lineamiento_ids=query.lineamiento_ids,
                 hours_back=24,
+                max_results=query.max_results,
             )
-            tasks.append(task)
+            for query in plan.queries
+        ]
+
+        # Reprogramar antes de despachar para no repetir pares en el próximo tick
+        adaptive_scheduler.mark_dispatched(
+            db,
+            {
+                (lineamiento_id, query.plataforma)
+                for query in plan.queries
+                for lineamiento_id in query.lineamiento_ids
+            },
+        )
+        db.commit()
 
-        # Ejecutar en paralelo
+        # Ejecutar en paralelo y ajustar la programación con el resultado
+        # combinado: un lineamiento puede estar en varias queries del ciclo
         if tasks:
-            job = group(tasks)
-            results = job.apply_async()
-            results.get(timeout=3600)  # Timeout de 1 hora
+            chord(tasks)(record_collection_cycle.s())
 
-        logger.info(f"Recolección completada para {len(lineamientos)} lineamientos")
+        logger.info(
+            f"Recolección disparada para {len(lineamientos)} lineamientos: "
+            f"{len(tasks)} queries"
+        )
 
         return {
             "total_lineamientos": len(lineamientos),
+            "plan": plan.summary(),
             "status": "success",
         }
 
     finally:
         db.close()
+
+
+@celery_app.task
+def record_collection_cycle(results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Registra en el scheduler adaptativo el rendimiento de un ciclo planificado.
+
+    Callback del chord de `collect_all_lineamientos`: suma el contenido
+    nuevo de todas las queries por (lineamiento, plataforma) y aplica un
+    solo paso de `record_yields`. Si alguna query falla, el chord no llama
+    al callback y los pares conservan el intervalo de `mark_dispatched`.
+
+    Args:
+        results: Resultados de `collect_planned_query`
+
+    Returns:
+        Pares actualizados por plataforma
+    """
+    db = get_db()
+
+    try:
+        updated = {}
+        for plataforma, yields in adaptive_scheduler.aggregate_yields(results).items():
+            updated[plataforma] = len(adaptive_scheduler.record_yields(db, plataforma, yields))
+        db.commit()
+
+        logger.info(f"Programación adaptativa actualizada: {updated}")
+        return {"status": "success", "actualizados": updated}
+
+    finally:
+        db.close()
+
+
+@celery_app.task
+def refresh_engagement() -> Dict[str, Any]:
+    """
+    Tarea programada que vuelve a medir el engagement del contenido reciente.
+
+    Por cada plataforma selecciona el contenido dentro de la ventana
+    `engagement_refresh_window_hours`, consulta sus métricas con los
+    endpoints masivos del collector y guarda una medición por contenido
+    en `engagement_snapshots`.
+
+    Si la ejecución anterior sigue en curso (lock en Redis), se omite para
+    que las ejecuciones no se acumulen ni compitan por el rate limit.
+
+    Returns:
+        Estadísticas por plataforma
+    """
+    lock = get_redis().lock(
+        ENGAGEMENT_REFRESH_LOCK, timeout=settings.engagement_refresh_lock_seconds
+    )
+    if not lock.acquire(blocking=False):
+        logger.warning("Refresco de engagement omitido: la ejecución anterior sigue en curso")
+        return {"status": "skipped"}
+
+    try:
+        return _refresh_engagement()
+    finally:
+        try:
+            lock.release()
+        except LockError:
+            logger.warning("El lock del refresco de engagement expiró antes de terminar")
+
+
+def _refresh_engagement() -> Dict[str, Any]:
+    """Refresca el engagement de cada plataforma (ver `refresh_engagement`)"""
+    logger.info("Iniciando refresco de engagement")
+
+    stats: Dict[str, Any] = {}
+
+    for plataforma, collector_class in COLLECTORS.items():
+        db = get_db()
+        try:
+            candidates = engagement_refresher.candidates(db, plataforma)
+        finally:
+            db.close()
+
+        if not candidates:
+            stats[plataforma] = {"candidates": 0, "refreshed": 0}
+            continue
+
+        try:
+            engagement = collector_class().get_engagement(
+                [plataforma_id for _, plataforma_id in candidates]
+            )
+        except ValueError as e:
+            # Plataforma sin credenciales configuradas
+            logger.warning(f"Refresco de engagement omitido para {plataforma}: {e}")
+            stats[plataforma] = {"candidates": len(candidates), "refreshed": 0}
+            continue
+        except Exception as e:
+            logger.error(f"Error al refrescar engagement de {plataforma}: {e}", exc_info=True)
+            stats[plataforma] = {"candidates": len(candidates), "error": str(e)}
+            continue
+
+        db = get_db()
+        try:
+            refreshed = engagement_refresher.save_snapshots(db, candidates, engagement)
+            db.commit()
+            stats[plataforma] = {"candidates": len(candidates), "refreshed": refreshed}
+
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error al guardar engagement de {plataforma}: {e}", exc_info=True)
+            stats[plataforma] = {"candidates": len(candidates), "error": str(e)}
+
+        finally:
+            db.close()
+
+    logger.info(f"Refresco de engagement completado: {stats}")
+    return {"status": "success", "plataformas": stats}
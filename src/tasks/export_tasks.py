@@ -0,0 +1,88 @@
+"""
+Tareas Celery para exportaciones de tendencias en segundo plano
+"""
+
+from typing import Any, Dict
+import logging
+
+from sqlalchemy import func, select
+
+from src.celery_app import celery_app
+from src.models.base import SessionLocal
+from src.services.tendencia_export import export_query, export_spool
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+@celery_app.task(bind=True)
+def export_tendencias(
+    self,
+    formato: str,
+    hours_back: int = 24,
+    plataforma: str | None = None,
+    ubicacion: str | None = None,
+    solo_activas: bool = True,
+) -> Dict[str, Any]:
+    """
+    Exporta tendencias a un archivo del spool.
+
+    El progreso se publica como estado PROGRESS con las filas escritas y
+    el total, para consultarlo desde la API mientras corre. Si el formato
+    no admite todas las filas (Excel), el resultado lleva `truncated`.
+
+    Args:
+        formato: csv, ndjson, xlsx o parquet
+        hours_back: Ventana de tiempo en horas
+        plataforma: Filtrar por plataforma
+        ubicacion: Filtrar por ubicación
+        solo_activas: Solo tendencias activas
+
+    Returns:
+        Dict con el archivo generado, las filas exportadas y si se recortó
+    """
+    db = SessionLocal()
+
+    try:
+        query = export_query(hours_back, plataforma, ubicacion, solo_activas)
+        total = db.scalar(select(func.count()).select_from(query.order_by(None).subquery()))
+
+        def progress(filas: int) -> None:
+            self.update_state(state="PROGRESS", meta={"filas": filas, "total": total})
+
+        progress(0)
+        path, filas, truncated = export_spool.write(
+            db, formato, query, self.request.id, progress
+        )
+
+        logger.info(f"Exportación {self.request.id} terminada: {filas} filas en {path.name}")
+
+        return {
+            "status": "success",
+            "formato": formato,
+            "filas": filas,
+            "total": total,
+            "truncated": truncated,
+            "archivo": path.name,
+            "bytes": path.stat().st_size,
+        }
+
+    except ValueError as e:
+        logger.warning(f"Exportación {self.request.id} inválida: {e}")
+        return {"status": "error", "error": str(e)}
+
+    finally:
+        db.close()
+
+
+@celery_app.task
+def cleanup_exports() -> Dict[str, Any]:
+    """
+    Borra del spool las exportaciones más antiguas que `export_retention_hours`.
+
+    Returns:
+        Dict con el número de archivos borrados
+    """
+    removed = export_spool.cleanup(settings.export_retention_hours)
+    logger.info(f"Exportaciones borradas del spool: {removed}")
+    return {"status": "success", "removed": removed}
@@ -4,6 +4,7 @@ Tareas Celery para procesamiento NLP
 
 from typing import Dict, Any, List
 from uuid import UUID
+from datetime import datetime
 import logging
 
 from sqlalchemy.orm import Session
@@ -16,6 +17,12 @@ from src.models.demografia import Demografia
 from src.nlp.spacy_service import spacy_service
 from src.nlp.sentiment_service import sentiment_service
 from src.nlp.topic_service import topic_service
+from src.services.author_sketches import author_sketches
+from src.services.cooccurrence_index import cooccurrence_index
+from src.services.streaming_trends import streaming_trends
+from src.services.trend_scoring import DESCONOCIDO
+from src.utils.config import settings
+from src.utils.language_detector import language_detector
 
 logger = logging.getLogger(__name__)
 
@@ -54,6 +61,16 @@ def process_content_nlp(self, contenido_id: str) -> Dict[str, Any]:
             logger.info(f"Contenido ya procesado: {contenido_id}")
             return {"status": "already_processed"}
 
+        # Los modelos son para español: no procesar otros idiomas
+        if not language_detector.is_supported(contenido.idioma):
+            logger.info(
+                f"Contenido en idioma no soportado ({contenido.idioma}): {contenido_id}"
+            )
+            contenido.nlp_procesado = True
+            contenido.nlp_procesado_at = datetime.utcnow()
+            db.commit()
+            return {"status": "skipped_language", "idioma": contenido.idioma}
+
         logger.info(f"Procesando NLP para contenido: {contenido_id}")
 
         texto = contenido.contenido_texto
@@ -106,8 +123,33 @@ def process_content_nlp(self, contenido_id: str) -> Dict[str, Any]:
         # Marcar contenido como procesado
         contenido.nlp_procesado = True
 
+        # Capturar antes del commit (que expira los atributos)
+        plataforma = contenido.plataforma
+        autor = contenido.autor
+        segmento = (
+            tema.tema_nombre,
+            plataforma,
+            demografia.ubicacion_pais or DESCONOCIDO,
+            demografia.edad_rango or DESCONOCIDO,
+            demografia.genero or DESCONOCIDO,
+        )
+
         db.commit()
 
+        # Los contadores en Redis son secundarios: un fallo no debe
+        # reintentar el procesamiento NLP
+        if autor:
+            try:
+                author_sketches.record(segmento, autor)
+            except Exception as e:
+                logger.warning(f"No se pudo registrar el autor del tema: {e}")
+
+        if settings.streaming_trends_enabled:
+            try:
+                streaming_trends.record(plataforma, ubicacion, nlp_result["keywords"])
+            except Exception as e:
+                logger.warning(f"No se pudo registrar en tendencias en tiempo real: {e}")
+
         logger.info(f"NLP procesado exitosamente: {contenido_id}")
 
         return {
@@ -140,6 +182,27 @@ def process_pending_content() -> Dict[str, Any]:
     db = get_db()
 
     try:
+        # Marcar como procesado el contenido en idiomas no soportados,
+        # así no ocupa cupo en el batch ni llega a los modelos en español
+        skipped = (
+            db.query(ContenidoRecolectado)
+            .filter(
+                ContenidoRecolectado.nlp_procesado == False,
+                ContenidoRecolectado.idioma.notin_(settings.nlp_supported_languages),
+            )
+            .update(
+                {
+                    ContenidoRecolectado.nlp_procesado: True,
+                    ContenidoRecolectado.nlp_procesado_at: datetime.utcnow(),
+                },
+                synchronize_session=False,
+            )
+        )
+        db.commit()
+
+        if skipped:
+            logger.info(f"Contenidos omitidos por idioma no soportado: {skipped}")
+
         # Obtener contenidos no procesados (límite para no saturar)
         contenidos = (
             db.query(ContenidoRecolectado)
@@ -151,7 +214,7 @@ def process_pending_content() -> Dict[str, Any]:
         logger.info(f"Contenidos pendientes encontrados: {len(contenidos)}")
 
         if not contenidos:
-            return {"status": "no_pending", "processed": 0}
+            return {"status": "no_pending", "processed": 0, "skipped_language": skipped}
 
         # Procesar cada contenido
         processed = 0
@@ -174,6 +237,7 @@ def process_pending_content() -> Dict[str, Any]:
             "status": "success",
             "total_pending": len(contenidos),
             "tasks_dispatched": processed,
+            "skipped_language": skipped,
             "errors": errors,
         }
 
@@ -181,6 +245,46 @@ def process_pending_content() -> Dict[str, Any]:
         db.close()
 
 
+@celery_app.task
+def index_cooccurrences() -> Dict[str, Any]:
+    """
+    Tarea programada que suma los temas nuevos al índice de co-ocurrencias.
+
+    Procesa lotes de `cooccurrence_batch_size` temas pendientes (cada lote
+    en su propia transacción) hasta que no quedan pendientes.
+
+    Returns:
+        Estadísticas de indexación
+    """
+    db = get_db()
+
+    indexed = 0
+    pairs = 0
+
+    try:
+        while True:
+            batch, batch_pairs = cooccurrence_index.index_pending(db)
+            db.commit()
+
+            indexed += batch
+            pairs += batch_pairs
+
+            if batch < settings.cooccurrence_batch_size:
+                break
+
+        logger.info(f"Co-ocurrencias indexadas: {indexed} temas, {pairs} pares")
+
+        return {"status": "success", "temas_indexed": indexed, "pairs_updated": pairs}
+
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Error indexando co-ocurrencias: {e}", exc_info=True)
+        return {"status": "error", "error": str(e), "temas_indexed": indexed}
+
+    finally:
+        db.close()
+
+
 @celery_app.task
 def batch_topic_modeling(lineamiento_id: str | None = None) -> Dict[str, Any]:
     """
@@ -22,6 +22,54 @@ class Settings(BaseSettings):
         default=False,
         description="Habilitar logging de queries SQL (solo desarrollo)",
     )
+    db_role: str = Field(
+        default="api",
+        description="Rol del proceso para el perfil del pool (api, collector, nlp, analytics)",
+    )
+    db_pool_size: int | None = Field(
+        default=None,
+        ge=0,
+        description="Conexiones persistentes del pool (None = perfil del rol, 0 = NullPool)",
+    )
+    db_max_overflow: int | None = Field(
+        default=None,
+        ge=0,
+        description="Conexiones extra sobre db_pool_size (None = perfil del rol)",
+    )
+    db_pool_recycle_seconds: int | None = Field(
+        default=None,
+        ge=60,
+        description="Edad máxima de una conexión antes de reabrirla (None = perfil del rol)",
+    )
+    db_pool_timeout_seconds: int | None = Field(
+        default=None,
+        ge=1,
+        description="Espera máxima por una conexión libre (None = perfil del rol)",
+    )
+    metrics_port: int | None = Field(
+        default=None,
+        ge=1,
+        le=65535,
+        description="Puerto de /metrics en los workers Celery (None = no exponer)",
+    )
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="Conexión vía PgBouncer en modo transaction (sin prepared statements)",
+    )
+    database_replica_urls: List[str] = Field(
+        default=[],
+        description="URLs de réplicas de lectura para las consultas de la API",
+    )
+    database_replica_max_lag_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="Retraso de replicación máximo antes de leer del primario",
+    )
+    database_replica_check_seconds: float = Field(
+        default=10.0,
+        gt=0,
+        description="Intervalo mínimo entre consultas del retraso de cada réplica",
+    )
 
     # Redis
     redis_url: str = Field(
@@ -75,6 +123,17 @@ class Settings(BaseSettings):
         description="Período de rate limiting para YouTube (86400 = 1 día)",
     )
 
+    youtube_max_results_per_query: int = Field(
+        default=200,
+        ge=1,
+        description="Máximo de videos por búsqueda (se pagina de 50 en 50)",
+    )
+    youtube_units_budget_per_query: int = Field(
+        default=500,
+        ge=101,
+        description="Presupuesto de unidades de cuota por búsqueda paginada (100 por página)",
+    )
+
     # Rate Limiting - Reddit
     reddit_rate_limit_requests: int = Field(
         default=60,
@@ -95,6 +154,134 @@ class Settings(BaseSettings):
         description="Período de rate limiting para Mastodon (300 = 5 minutos)",
     )
 
+    # Planificación de recolección
+    youtube_max_query_length: int = Field(
+        default=128,
+        ge=16,
+        description="Longitud máxima de una query combinada de YouTube (keywords unidas con OR)",
+    )
+    reddit_max_query_length: int = Field(
+        default=512,
+        ge=16,
+        description="Longitud máxima de una query combinada de Reddit (keywords unidas con OR)",
+    )
+    collection_max_keywords_per_query: int = Field(
+        default=12,
+        ge=1,
+        description="Máximo de keywords combinadas en una misma query",
+    )
+
+    # Programación adaptativa de recolección
+    collection_tick_minutes: int = Field(
+        default=5,
+        ge=1,
+        le=60,
+        description="Frecuencia con la que beat revisa pares (lineamiento, plataforma) pendientes",
+    )
+    collection_base_interval_minutes: int = Field(
+        default=30,
+        ge=1,
+        description="Intervalo inicial de polling para pares sin historial",
+    )
+    collection_min_interval_minutes: int = Field(
+        default=10,
+        ge=1,
+        description="Intervalo mínimo de polling (pares muy activos)",
+    )
+    collection_max_interval_minutes: int = Field(
+        default=360,
+        ge=1,
+        description="Intervalo máximo de polling (pares sin actividad)",
+    )
+    collection_backoff_factor: float = Field(
+        default=2.0,
+        gt=1.0,
+        description="Factor de backoff exponencial cuando una ejecución no trae contenido nuevo",
+    )
+    collection_hot_yield: float = Field(
+        default=20.0,
+        gt=0.0,
+        description="Contenido nuevo promedio por ejecución a partir del cual se acelera el polling",
+    )
+    collection_yield_alpha: float = Field(
+        default=0.3,
+        gt=0.0,
+        le=1.0,
+        description="Peso de la última ejecución en el promedio móvil exponencial de rendimiento",
+    )
+
+    # Refresco de engagement
+    engagement_refresh_minutes: int = Field(
+        default=30,
+        ge=1,
+        le=60,
+        description="Frecuencia del refresco de métricas de engagement",
+    )
+    engagement_refresh_window_hours: int = Field(
+        default=48,
+        ge=1,
+        description="Antigüedad máxima del contenido cuyo engagement se sigue midiendo",
+    )
+    engagement_refresh_max_items: int = Field(
+        default=5000,
+        ge=1,
+        description="Máximo de contenidos por plataforma en cada refresco",
+    )
+    engagement_refresh_lock_seconds: int = Field(
+        default=3600,
+        ge=60,
+        description="Duración máxima del lock que evita refrescos de engagement simultáneos",
+    )
+    mastodon_engagement_fallback_max_items: int = Field(
+        default=100,
+        ge=0,
+        description="Toots más recientes a refrescar uno por uno si no hay consulta masiva",
+    )
+
+    # Consumidores de streaming
+    stream_batch_size: int = Field(
+        default=100,
+        ge=1,
+        description="Elementos por micro-batch antes de guardar en la base de datos",
+    )
+    stream_flush_seconds: float = Field(
+        default=5.0,
+        gt=0.0,
+        description="Tiempo máximo que un elemento espera en el buffer antes de guardarse",
+    )
+    stream_buffer_max_items: int = Field(
+        default=10000,
+        ge=1,
+        description="Máximo de elementos en buffer por stream (se descartan los más antiguos)",
+    )
+    stream_reconnect_max_seconds: int = Field(
+        default=300,
+        ge=1,
+        description="Espera máxima entre reconexiones (backoff exponencial)",
+    )
+    mastodon_stream_hashtags: List[str] = Field(
+        default=[],
+        description="Hashtags a seguir por streaming (vacío = timeline público)",
+    )
+    mastodon_stream_local: bool = Field(
+        default=False,
+        description="Limitar el stream a toots de la instancia local",
+    )
+    mastodon_stream_backfill_pages: int = Field(
+        default=10,
+        ge=0,
+        description="Páginas (40 toots) a recuperar desde el checkpoint al reconectar",
+    )
+    reddit_subreddits: List[str] = Field(
+        default=["es", "mexico", "argentina", "chile", "colombia", "AskReddit"],
+        description="Subreddits en español monitoreados (búsqueda y stream)",
+    )
+    reddit_stream_pause_after: int = Field(
+        default=0,
+        ge=-1,
+        description="Respuestas vacías antes de ceder control en el stream de Reddit (PRAW pause_after)",
+    )
+
     # NLP Configuración
     spacy_model: str = Field(
         default="es_core_news_md",
@@ -109,6 +296,43 @@ class Settings(BaseSettings):
         description="Número de topics para BERTopic ('auto' o número)",
     )
 
+    # Detección de idioma
+    language_detection_enabled: bool = Field(
+        default=True,
+        description="Detectar idioma en la ingesta con n-gramas de caracteres",
+    )
+    language_min_confidence: float = Field(
+        default=0.4,
+        ge=0.0,
+        le=1.0,
+        description="Confianza mínima para aceptar el idioma detectado",
+    )
+    language_min_margin: float = Field(
+        default=0.2,
+        ge=0.0,
+        le=1.0,
+        description="Ventaja mínima de confianza sobre el segundo idioma más probable",
+    )
+    language_skip_confidence: float = Field(
+        default=0.85,
+        ge=0.0,
+        le=1.0,
+        description="Confianza mínima para guardar un idioma que NLP omite",
+    )
+    language_min_chars: int = Field(
+        default=15,
+        ge=1,
+        description="Mínimo de letras para intentar detectar idioma",
+    )
+    language_default: str = Field(
+        default="es",
+        description="Idioma asignado cuando no se puede determinar",
+    )
+    nlp_supported_languages: List[str] = Field(
+        default=["es"],
+        description="Idiomas que se envían al pipeline NLP (modelos en español)",
+    )
+
     # Análisis de tendencias
     trending_growth_threshold: float = Field(
         default=0.5,
@@ -121,6 +345,196 @@ class Settings(BaseSettings):
         ge=1,
         description="Mínimo de menciones para considerar tendencia",
     )
+    trending_zscore_threshold: float = Field(
+        default=2.0,
+        description="Z-score de puntuación a partir del cual un segmento es tendencia aunque no crezca",
+    )
+    burst_ewma_alpha: float = Field(
+        default=0.1,
+        gt=0.0,
+        le=1.0,
+        description="Peso de cada análisis en la media/varianza móvil de menciones por segmento",
+    )
+    burst_zscore_threshold: float = Field(
+        default=3.0,
+        gt=0.0,
+        description="Z-score respecto de la línea base a partir del cual hay un pico",
+    )
+    burst_pvalue_threshold: float = Field(
+        default=0.001,
+        gt=0.0,
+        lt=1.0,
+        description="Probabilidad Poisson de cola por debajo de la cual hay un pico",
+    )
+    burst_warmup_runs: int = Field(
+        default=24,
+        ge=1,
+        description="Análisis necesarios antes de usar la línea base (antes se usa el umbral de crecimiento)",
+    )
+    trend_weight_mentions: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Peso de log(menciones) en la puntuación de tendencia",
+    )
+    trend_weight_engagement: float = Field(
+        default=0.5,
+        ge=0.0,
+        description="Peso de log(engagement) en la puntuación de tendencia",
+    )
+    trend_weight_authors: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Peso de log(autores únicos) en la puntuación de tendencia",
+    )
+    trend_weight_growth: float = Field(
+        default=1.0,
+        ge=0.0,
+        description="Peso de la tasa de crecimiento en la puntuación de tendencia",
+    )
+    trend_weight_sentiment: float = Field(
+        default=0.25,
+        ge=0.0,
+        description="Peso de la intensidad del sentimiento en la puntuación de tendencia",
+    )
+
+    author_sketch_retention_hours: int = Field(
+        default=168,
+        ge=2,
+        description="Horas que se conservan los HyperLogLog de autores únicos por segmento",
+    )
+
+    # Tendencias en tiempo real
+    streaming_trends_enabled: bool = Field(
+        default=True,
+        description="Contar keywords en Redis al procesar NLP (endpoint trending-now)",
+    )
+    streaming_trends_bucket_seconds: int = Field(
+        default=300,
+        ge=60,
+        description="Duración de cada bucket de la ventana deslizante",
+    )
+    streaming_trends_window_buckets: int = Field(
+        default=12,
+        ge=1,
+        description="Buckets que forman la ventana actual (12 × 5 min = 1 hora)",
+    )
+    streaming_trends_cms_width: int = Field(
+        default=2048,
+        ge=16,
+        description="Contadores por fila del Count-Min Sketch",
+    )
+    streaming_trends_cms_depth: int = Field(
+        default=4,
+        ge=1,
+        le=16,
+        description="Filas (funciones hash) del Count-Min Sketch",
+    )
+    streaming_trends_topk: int = Field(
+        default=200,
+        ge=1,
+        description="Términos más frecuentes retenidos por bucket y segmento (Space-Saving)",
+    )
+
+    # Índice de co-ocurrencias
+    cooccurrence_bucket_minutes: int = Field(
+        default=60,
+        ge=5,
+        le=1440,
+        description="Duración de cada bucket de conteos de co-ocurrencia",
+    )
+    cooccurrence_batch_size: int = Field(
+        default=2000,
+        ge=1,
+        description="Temas indexados por lote en el índice de co-ocurrencias",
+    )
+    cooccurrence_max_terms_per_tema: int = Field(
+        default=15,
+        ge=2,
+        description="Términos (keywords + entidades) por tema que se combinan en pares",
+    )
+    cooccurrence_index_minutes: int = Field(
+        default=10,
+        ge=1,
+        le=60,
+        description="Frecuencia con la que se indexan los temas nuevos",
+    )
+
+    # Validación con Google Trends
+    google_trends_geo: str = Field(
+        default="",
+        description="Geo de Google Trends para ubicaciones no reconocidas ('' = global)",
+    )
+    google_trends_timeframe: str = Field(
+        default="now 7-d",
+        description="Período consultado en Google Trends (formato pytrends)",
+    )
+    google_trends_max_per_run: int = Field(
+        default=500,
+        ge=1,
+        description="Máximo de tendencias validadas por ejecución",
+    )
+    google_trends_cache_hours: int = Field(
+        default=6,
+        ge=1,
+        description="Horas que se reutiliza el interés consultado de cada keyword",
+    )
+    google_trends_rate_limit_requests: int = Field(
+        default=5,
+        ge=1,
+        description="Límite de requests a Google Trends",
+    )
+    google_trends_rate_limit_period_seconds: int = Field(
+        default=60,
+        ge=1,
+        description="Período de rate limiting para Google Trends",
+    )
+    google_trends_rise_ratio: float = Field(
+        default=1.5,
+        gt=0.0,
+        description="Interés reciente / promedio del período a partir del cual se valida una tendencia",
+    )
+
+    # Caché de respuestas de la API
+    cache_api_responses: bool = Field(
+        default=True,
+        description="Guardar en Redis las respuestas de consulta de /tendencias",
+    )
+    cache_ttl_seconds: int = Field(
+        default=3600,
+        ge=1,
+        description="TTL de las respuestas en caché (se invalidan antes con cada análisis)",
+    )
+    cache_lock_seconds: int = Field(
+        default=30,
+        ge=1,
+        description="Espera máxima por otra request que ya calcula la misma respuesta",
+    )
+    api_compression_min_bytes: int = Field(
+        default=1000,
+        ge=0,
+        description="Tamaño mínimo de respuesta para comprimir con brotli o gzip",
+    )
+    cache_max_age_seconds: int = Field(
+        default=0,
+        ge=0,
+        description="max-age de Cache-Control (0 = revalidar siempre con ETag)",
+    )
+
+    # Exportación
+    export_chunk_rows: int = Field(
+        default=5000,
+        ge=100,
+        description="Filas por lote leídas del cursor del servidor al exportar",
+    )
+    export_spool_dir: str = Field(
+        default="/tmp/trendsgpx/exports",
+        description="Directorio compartido donde las tareas dejan los archivos exportados",
+    )
+    export_retention_hours: int = Field(
+        default=24,
+        ge=1,
+        description="Horas que se conservan los archivos exportados",
+    )
 
     # Retención de datos
     data_retention_days: int = Field(
@@ -181,6 +595,16 @@ class Settings(BaseSettings):
             raise ValueError(f"log_level debe ser uno de: {valid_levels}")
         return v_upper
 
+    @field_validator("db_role")
+    @classmethod
+    def validate_db_role(cls, v: str) -> str:
+        """Valida que el rol del pool sea válido"""
+        valid_roles = ["api", "collector", "nlp", "analytics"]
+        v_lower = v.lower()
+        if v_lower not in valid_roles:
+            raise ValueError(f"db_role debe ser uno de: {valid_roles}")
+        return v_lower
+
     @field_validator("log_format")
     @classmethod
     def validate_log_format(cls, v: str) -> str:
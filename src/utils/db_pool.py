@@ -0,0 +1,177 @@
+"""
+Perfiles del pool de conexiones a PostgreSQL por rol de proceso
+"""
+
+from dataclasses import dataclass, replace
+from typing import Any, Dict
+from uuid import uuid4
+import time
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from src.utils.config import settings
+
+
+@dataclass(frozen=True)
+class PoolProfile:
+    """
+    Tamaño del pool de un proceso.
+
+    Cada proceso (API, cada hijo prefork de Celery) tiene su propio pool,
+    así que el máximo de conexiones de un despliegue es la suma de
+    `procesos × (pool_size + max_overflow)`. `pool_size=0` usa NullPool
+    (una conexión por checkout, útil detrás de PgBouncer).
+    """
+
+    pool_size: int
+    max_overflow: int
+    recycle_seconds: int
+    timeout_seconds: int
+
+    @property
+    def max_connections(self) -> int:
+        """Conexiones simultáneas máximas del proceso"""
+        return self.pool_size + self.max_overflow
+
+
+# Perfiles por defecto; cada valor se puede sobrescribir con DB_POOL_*
+POOL_PROFILES: Dict[str, PoolProfile] = {
+    # Uvicorn: un proceso atiende muchas requests concurrentes
+    "api": PoolProfile(pool_size=10, max_overflow=10, recycle_seconds=1800, timeout_seconds=30),
+    # gevent: los greenlets comparten el pool del proceso y pasan la mayor
+    # parte del tiempo esperando a las APIs externas, no a la base de datos
+    "collector": PoolProfile(
+        pool_size=10, max_overflow=10, recycle_seconds=1800, timeout_seconds=60
+    ),
+    # prefork: cada hijo ejecuta una tarea a la vez
+    "nlp": PoolProfile(pool_size=1, max_overflow=1, recycle_seconds=1800, timeout_seconds=30),
+    "analytics": PoolProfile(
+        pool_size=1, max_overflow=2, recycle_seconds=1800, timeout_seconds=30
+    ),
+}
+
+DB_POOL_CONNECTIONS = Counter(
+    "trendsgpx_db_pool_connections_total",
+    "Conexiones físicas abiertas por el pool",
+    ["role", "engine"],
+)
+DB_POOL_CHECKOUTS = Counter(
+    "trendsgpx_db_pool_checkouts_total",
+    "Conexiones tomadas del pool",
+    ["role", "engine"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "trendsgpx_db_pool_checked_out",
+    "Conexiones prestadas en este momento",
+    ["role", "engine"],
+    multiprocess_mode="livesum",  # Suma de los hijos vivos de un worker prefork
+)
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "trendsgpx_db_pool_checkout_duration_seconds",
+    "Tiempo que una conexión permanece fuera del pool",
+    ["role", "engine"],
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30, 120, 600),
+)
+
+
+def pool_profile(role: str | None = None) -> PoolProfile:
+    """
+    Perfil del rol con las sobrescrituras de settings aplicadas.
+
+    Args:
+        role: api, collector, nlp o analytics. Si None, usa `settings.db_role`
+
+    Returns:
+        PoolProfile efectivo
+    """
+    role = role or settings.db_role
+    if role not in POOL_PROFILES:
+        raise ValueError(f"Rol de pool desconocido: {role}. Válidos: {list(POOL_PROFILES)}")
+
+    overrides = {
+        field: value
+        for field, value in (
+            ("pool_size", settings.db_pool_size),
+            ("max_overflow", settings.db_max_overflow),
+            ("recycle_seconds", settings.db_pool_recycle_seconds),
+            ("timeout_seconds", settings.db_pool_timeout_seconds),
+        )
+        if value is not None
+    }
+    return replace(POOL_PROFILES[role], **overrides)
+
+
+def engine_options(role: str | None = None, async_driver: bool = False) -> Dict[str, Any]:
+    """
+    Argumentos de `create_engine` / `create_async_engine` para el rol.
+
+    Con `settings.db_pgbouncer` las conexiones son seguras para el modo
+    transaction pooling de PgBouncer: asyncpg no reutiliza prepared
+    statements (cada transacción puede caer en otra conexión del servidor)
+    y les da nombres únicos. psycopg2 no usa prepared statements del lado
+    del servidor.
+
+    Args:
+        role: Rol del proceso. Si None, usa `settings.db_role`
+        async_driver: True para el engine asyncpg
+
+    Returns:
+        Dict de keyword arguments para el engine
+    """
+    profile = pool_profile(role)
+    options: Dict[str, Any] = {"pool_pre_ping": True}  # Verificar conexiones antes de usar
+
+    if profile.pool_size == 0:
+        options["poolclass"] = NullPool
+    else:
+        options.update(
+            pool_size=profile.pool_size,
+            max_overflow=profile.max_overflow,
+            pool_recycle=profile.recycle_seconds,
+            pool_timeout=profile.timeout_seconds,
+        )
+
+    if settings.db_pgbouncer and async_driver:
+        options["connect_args"] = {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    return options
+
+
+def instrument_pool(engine: Engine, role: str | None = None, name: str = "sync") -> None:
+    """
+    Registra métricas Prometheus de checkout del pool del engine.
+
+    Args:
+        engine: Engine síncrono (para uno asíncrono, `async_engine.sync_engine`)
+        role: Rol del proceso. Si None, usa `settings.db_role`
+        name: Etiqueta del engine en las métricas (sync / async)
+    """
+    labels = {"role": role or settings.db_role, "engine": name}
+    connections = DB_POOL_CONNECTIONS.labels(**labels)
+    checkouts = DB_POOL_CHECKOUTS.labels(**labels)
+    checked_out = DB_POOL_CHECKED_OUT.labels(**labels)
+    duration = DB_POOL_CHECKOUT_SECONDS.labels(**labels)
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection, connection_record):
+        connections.inc()
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        checkouts.inc()
+        checked_out.inc()
+        connection_record.info["checkout_at"] = time.monotonic()
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(dbapi_connection, connection_record):
+        checkout_at = connection_record.info.pop("checkout_at", None)
+        if checkout_at is not None:
+            checked_out.dec()
+            duration.observe(time.monotonic() - checkout_at)
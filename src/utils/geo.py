@@ -0,0 +1,102 @@
+"""
+Mapeo de ubicaciones a códigos geo de Google Trends
+"""
+
+from src.utils.keyword_matcher import normalize_keyword
+
+# Países hispanohablantes (y otros frecuentes) por nombre normalizado
+_PAISES = {
+    "argentina": "AR",
+    "bolivia": "BO",
+    "chile": "CL",
+    "colombia": "CO",
+    "costa rica": "CR",
+    "cuba": "CU",
+    "ecuador": "EC",
+    "el salvador": "SV",
+    "espana": "ES",
+    "guatemala": "GT",
+    "honduras": "HN",
+    "mexico": "MX",
+    "nicaragua": "NI",
+    "panama": "PA",
+    "paraguay": "PY",
+    "peru": "PE",
+    "puerto rico": "PR",
+    "republica dominicana": "DO",
+    "uruguay": "UY",
+    "venezuela": "VE",
+    "estados unidos": "US",
+    "eeuu": "US",
+    "brasil": "BR",
+}
+
+# Ciudades frecuentes en el contenido (se omiten nombres ambiguos entre países)
+_CIUDADES = {
+    "ciudad de mexico": "MX",
+    "cdmx": "MX",
+    "guadalajara": "MX",
+    "monterrey": "MX",
+    "buenos aires": "AR",
+    "rosario": "AR",
+    "santiago": "CL",
+    "valparaiso": "CL",
+    "bogota": "CO",
+    "medellin": "CO",
+    "cali": "CO",
+    "lima": "PE",
+    "quito": "EC",
+    "guayaquil": "EC",
+    "caracas": "VE",
+    "montevideo": "UY",
+    "asuncion": "PY",
+    "la paz": "BO",
+    "madrid": "ES",
+    "barcelona": "ES",
+    "sevilla": "ES",
+    "la habana": "CU",
+    "santo domingo": "DO",
+}
+
+# Subreddits monitoreados (`reddit_subreddits`) que identifican un país
+_SUBREDDITS = {
+    "es": "ES",
+    "spain": "ES",
+    "mexico": "MX",
+    "argentina": "AR",
+    "chile": "CL",
+    "colombia": "CO",
+    "peru": "PE",
+    "uruguay": "UY",
+    "venezuela": "VE",
+    "ecuador": "EC",
+    "bolivia": "BO",
+    "paraguay": "PY",
+}
+
+_CODIGOS = set(_PAISES.values())
+
+
+def trends_geo(ubicacion: str | None, default: str = "") -> str:
+    """
+    Código geo de Google Trends (ISO 3166-1 alfa-2) de una ubicación.
+
+    Acepta nombres de país o de ciudades frecuentes (con o sin acentos),
+    subreddits de país y códigos ISO ya normalizados. Las ubicaciones
+    que no se reconocen usan `default` ('' = global).
+
+    Args:
+        ubicacion: `Tendencia.ubicacion` o `Demografia.ubicacion_pais`
+        default: Código para ubicaciones desconocidas
+
+    Returns:
+        Código de país o `default`
+    """
+    if not ubicacion:
+        return default
+
+    if ubicacion.strip().upper() in _CODIGOS:
+        return ubicacion.strip().upper()
+
+    nombre = normalize_keyword(ubicacion.removeprefix("r/"))
+    return _PAISES.get(nombre) or _CIUDADES.get(nombre) or _SUBREDDITS.get(nombre) or default
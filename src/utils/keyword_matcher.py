@@ -0,0 +1,146 @@
+"""
+Matcher multi-patrón de keywords basado en Aho-Corasick
+"""
+
+from typing import Dict, Hashable, Iterable, List, Set, Tuple
+from collections import deque
+import re
+import unicodedata
+
+_NON_ALNUM_RE = re.compile(r"[^0-9a-z]+")
+
+
+def normalize_keyword(texto: str) -> str:
+    """
+    Normaliza texto o keyword para matching.
+
+    Minúsculas, sin acentos, sin '#' de hashtags y con cualquier carácter
+    no alfanumérico convertido en un espacio simple.
+
+    Args:
+        texto: Texto a normalizar
+
+    Returns:
+        Texto normalizado (puede ser vacío)
+    """
+    texto = unicodedata.normalize("NFKD", texto or "").lower()
+    texto = "".join(c for c in texto if not unicodedata.combining(c))
+    return _NON_ALNUM_RE.sub(" ", texto).strip()
+
+
+class KeywordMatcher:
+    """
+    Autómata Aho-Corasick para buscar muchas keywords en una sola pasada.
+
+    Cada keyword se asocia a uno o más payloads (ej: IDs de lineamientos).
+    Las keywords y el texto se normalizan con `normalize_keyword` y se
+    rodean de espacios, de modo que solo hay coincidencias de palabra
+    completa ("ia" no coincide dentro de "gracias").
+
+    Ejemplo:
+        matcher = KeywordMatcher([("IA", lin_1), ("inteligencia artificial", lin_2)])
+        matcher.match("Nuevo modelo de IA")  # {lin_1: {"ia"}}
+    """
+
+    def __init__(self, patterns: Iterable[Tuple[str, Hashable]] = ()):
+        """
+        Construye el autómata.
+
+        Args:
+            patterns: Pares (keyword, payload)
+        """
+        # Transiciones, enlaces de fallo y salidas por estado
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[str]] = [[]]
+        self._payloads: Dict[str, Set[Hashable]] = {}
+
+        for keyword, payload in patterns:
+            self._add(keyword, payload)
+
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        """Número de keywords únicas (normalizadas) en el autómata"""
+        return len(self._payloads)
+
+    def _add(self, keyword: str, payload: Hashable) -> None:
+        """Agrega una keyword al trie"""
+        normalized = normalize_keyword(keyword)
+        if not normalized:
+            return
+
+        if normalized not in self._payloads:
+            self._payloads[normalized] = set()
+            state = 0
+            for char in f" {normalized} ":
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                state = next_state
+            self._output[state].append(normalized)
+
+        self._payloads[normalized].add(payload)
+
+    def _build_failure_links(self) -> None:
+        """Calcula enlaces de fallo (BFS) y propaga salidas"""
+        queue = deque(self._goto[0].values())
+
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[next_state] = target if target != next_state else 0
+
+                self._output[next_state] = (
+                    self._output[next_state] + self._output[self._fail[next_state]]
+                )
+
+    def find_keywords(self, texto: str) -> Set[str]:
+        """
+        Retorna las keywords (normalizadas) presentes en el texto.
+
+        Args:
+            texto: Texto a analizar
+
+        Returns:
+            Conjunto de keywords encontradas
+        """
+        found: Set[str] = set()
+        if not self._payloads:
+            return found
+
+        state = 0
+        for char in f" {normalize_keyword(texto)} ":
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            if self._output[state]:
+                found.update(self._output[state])
+
+        return found
+
+    def match(self, texto: str) -> Dict[Hashable, Set[str]]:
+        """
+        Retorna los payloads cuyas keywords aparecen en el texto.
+
+        Args:
+            texto: Texto a analizar
+
+        Returns:
+            Dict payload -> keywords que coincidieron
+        """
+        matches: Dict[Hashable, Set[str]] = {}
+        for keyword in self.find_keywords(texto):
+            for payload in self._payloads[keyword]:
+                matches.setdefault(payload, set()).add(keyword)
+        return matches
@@ -0,0 +1,396 @@
+"""
+Detección rápida de idioma basada en n-gramas de caracteres
+"""
+
+from typing import Dict, List, Tuple
+from collections import Counter
+import math
+import re
+import unicodedata
+import logging
+
+from src.utils.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+# Textos semilla por idioma para construir los perfiles de n-gramas.
+# Son el vocabulario más frecuente de cada idioma y frases cortas típicas
+# de redes sociales (saludos, deportes, política, quejas); suficiente
+# para distinguir idiomas en posts cortos sin cargar ningún modelo externo.
+_SEED_TEXTS: Dict[str, str] = {
+    "es": (
+        "el la los las de del que y en un una por con para no es lo se al "
+        "como más pero sus le ya o este sí porque esta entre cuando muy sin "
+        "sobre también me hasta hay donde quien desde todo nos durante todos "
+        "uno les ni contra otros ese eso ante ellos esto mí antes algunos qué "
+        "unos yo otro otras otra él tanto esa estos mucho quienes nada muchos "
+        "cual poco ella estar estas algunas algo nosotros hoy mañana ayer "
+        "gobierno presidente país ciudad años gente vida mundo trabajo año "
+        "está están estamos fue fueron había hacer puede pueden tiene tienen "
+        "creo gracias bueno también mejor ahora siempre nunca aquí allí "
+        "qué opinan ustedes alguien sabe cómo dónde cuándo señor niños días "
+        "la situación del país es muy complicada y nadie hace nada al respecto "
+        "me parece que el nuevo video está muy bueno, ¿qué opinan ustedes? "
+        "hoy en la mañana hubo una manifestación en el centro de la ciudad "
+        "la inteligencia artificial cambiará la forma en que trabajamos "
+        "gracias por todo, muchas gracias de verdad, mil gracias amigos "
+        "vamos con todo, vamos equipo, vamos a ganar este domingo "
+        "el partido de hoy, la selección jugó muy bien, qué golazo, qué jugada "
+        "ganamos el clásico, perdimos otra vez, el técnico tiene que irse "
+        "los jugadores del equipo celebraron el título con la afición "
+        "buenas noches, buenas tardes, buenos días, hasta luego, nos vemos "
+        "la gente está cansada de las mentiras de los políticos "
+        "el congreso aprobó la ley y la oposición pidió votar en contra "
+        "las elecciones presidenciales serán el próximo domingo, hay que votar "
+        "el precio del dólar y la inflación siguen subiendo cada semana "
+        "me encantó la película, la recomiendo muchísimo, ya la vieron "
+        "estoy muy feliz, qué alegría, no lo puedo creer, por fin llegó "
+        "hace frío, está lloviendo, ojalá mañana salga el sol "
+        "ayer estuvimos con mis amigos y mi familia en la casa de mi abuela "
+        "el nuevo celular salió hoy, alguien lo compró, vale la pena "
+        "los vecinos del barrio se quejan del ruido y de la basura en la calle "
+        "quiero agradecer a todos los que me escribieron, los quiero "
+        "la policía llegó rápido, hubo un accidente en la avenida principal "
+        "no hay luz ni agua desde anoche, qué vergüenza con la empresa "
+        "se viene la final, estamos listos, a ganar muchachos "
+        "cuál es su canción favorita, díganme en los comentarios "
+        "el servicio es pésimo, llevo una hora esperando y nadie me atiende "
+        "feliz año nuevo, feliz navidad, feliz cumpleaños, felicidades "
+        "este fin de semana vamos a la playa, a la montaña o nos quedamos"
+    ),
+    "en": (
+        "the of and to in is you that it he was for on are as with his they "
+        "at be this have from or one had by word but not what all were we "
+        "when your can said there use an each which she do how their if will "
+        "up other about out many then them these so some her would make like "
+        "him into time has look two more write go see number no way could "
+        "people my than first water been call who oil its now find long down "
+        "day did get come made may part over new sound take only little work "
+        "know place year live me back give most very after thing our just "
+        "name good sentence man think say great where help through much "
+        "what do you think about the new video, does anyone know how to "
+        "the government announced today that the city will change the rules "
+        "artificial intelligence will change the way we work and live "
+        "best cheap laptop for students, any recommendations? my friend "
+        "bought one last week and it broke, should I ask for a refund "
+        "thank you so much everyone, good morning, good night, see you soon "
+        "the game was great, what a goal, we won, let's go team "
+        "it is so hot today, the price of gas went up again, I can't believe it "
+        "we went to the beach with my family last weekend"
+    ),
+    "pt": (
+        "o a os as de do da dos das que e em um uma para com não por mais "
+        "se como mas foi ao ele das tem à seu sua ou ser quando muito há nos "
+        "já está eu também só pelo pela até isso ela entre era depois sem "
+        "mesmo aos ter seus quem nas me esse eles estão você tinha foram "
+        "essa num nem suas meu às minha têm numa pelos elas havia seja qual "
+        "será nós tenho lhe deles essas esses pelas este fosse dele tu te "
+        "vocês vos lhes meus minhas teu tua teus tuas nosso nossa nossos "
+        "governo presidente cidade pessoas vida mundo trabalho ano hoje "
+        "obrigado então agora sempre nunca aqui ali coisa não sei alguém "
+        "o que vocês acham do novo vídeo, alguém sabe como fazer isso "
+        "o governo anunciou hoje que a cidade vai mudar as regras "
+        "a inteligência artificial vai mudar a forma como trabalhamos "
+        "muito obrigado pelo carinho, valeu galera, obrigada a todos vocês "
+        "vamos votar, o jogo foi ontem, a seleção ganhou, que golaço "
+        "bom dia, boa tarde, boa noite, até logo, a gente se vê "
+        "não aguento mais, que saudade, estou muito feliz hoje "
+        "o preço da gasolina subiu de novo, o dólar fechou em alta "
+        "alguém sabe se vai ter aula amanhã, não tô sabendo de nada "
+        "eu não sei o que fazer, vocês viram o vídeo novo, ficou ótimo "
+        "o time perdeu em casa, o técnico precisa sair "
+        "a gente foi na praia com a família no fim de semana"
+    ),
+    "fr": (
+        "le la les de des du et en un une est que qui dans pour pas sur au "
+        "avec ce il elle ne se plus par son sa ses aux ou mais nous vous ils "
+        "elles comme été être avoir fait tout tous cette ces leur leurs "
+        "très aussi bien encore même où quand sans peu deux autre autres "
+        "faire dit peut sont était avait alors après avant donc chez entre "
+        "gouvernement président ville gens vie monde travail année jour "
+        "aujourd'hui merci maintenant toujours jamais ici quelque chose "
+        "qu'est-ce que vous pensez de la nouvelle vidéo, quelqu'un sait "
+        "le gouvernement a annoncé aujourd'hui que la ville va changer "
+        "l'intelligence artificielle va changer notre façon de travailler "
+        "merci beaucoup à tous, bonjour, bonsoir, bonne nuit, à bientôt "
+        "le match était génial, quel but, on a gagné, allez les bleus "
+        "il fait chaud, le prix de l'essence a encore augmenté, je n'y crois pas "
+        "on est allés à la plage avec la famille ce week-end"
+    ),
+    "it": (
+        "il lo la i gli le di del della dei degli delle e che è un una per "
+        "non in con su da al alla si come ma più anche sono ha hanno era "
+        "questo questa quello quella essere avere fare tutto tutti molto "
+        "perché quando dove chi cosa ancora sempre mai qui già poi dopo "
+        "prima senza tra fra noi voi loro io tu lui lei mio tuo suo nostro "
+        "governo presidente città gente vita mondo lavoro anno oggi grazie "
+        "adesso allora qualcuno sa come si fa cosa ne pensate del nuovo "
+        "video, il governo ha annunciato oggi che la città cambierà le "
+        "regole, l'intelligenza artificiale cambierà il modo di lavorare "
+        "grazie mille a tutti, buongiorno, buonasera, buonanotte, ciao "
+        "la squadra ha vinto la partita, che gol, forza ragazzi "
+        "il prezzo della benzina è aumentato ancora, non ci credo "
+        "qualcuno sa se domani i negozi sono aperti, fa troppo caldo "
+        "siamo andati al mare con la famiglia nel fine settimana "
+        "il governo italiano e le elezioni, bisogna andare a votare"
+    ),
+    "de": (
+        "der die das und in zu den von mit ist des sich auf für nicht ein "
+        "eine als auch es an werden aus er hat dass sie nach wird bei einer "
+        "um am sind noch wie einem über einen so zum war haben nur oder "
+        "aber vor zur bis mehr durch man sein wurde sei ich du wir ihr "
+        "heute danke jetzt immer nie hier etwas jemand weiß wie was denkt "
+        "ihr über das neue video, die regierung hat heute angekündigt dass "
+        "die stadt die regeln ändern wird, künstliche intelligenz wird die "
+        "art und weise verändern wie wir arbeiten und leben "
+        "vielen dank an alle, guten morgen, gute nacht, bis bald "
+        "das spiel war super, was für ein tor, wir haben gewonnen "
+        "es ist so heiß heute, der benzinpreis ist wieder gestiegen "
+        "wir waren am wochenende mit der familie am strand"
+    ),
+    "ca": (
+        "el la els les de del dels i que en un una per amb no és als al "
+        "com més però seu seva ha han era aquest aquesta això molt també "
+        "quan on qui què encara sempre mai aquí ja després abans sense "
+        "entre nosaltres vosaltres ells elles jo tu ell ella meu teu "
+        "govern president ciutat gent vida món feina any avui gràcies "
+        "ara doncs algú sap com es fa què en penseu del nou vídeo, el "
+        "govern ha anunciat avui que la ciutat canviarà les normes, la "
+        "intel·ligència artificial canviarà la manera de treballar "
+        "bon dia, bona nit, moltes gràcies a tothom, fins aviat "
+        "el partit d'avui, l'equip ha guanyat, quin gol, som-hi "
+        "fa molta calor, demà plourà, anem a la platja aquest cap de setmana "
+        "el preu de la gasolina ha pujat, no m'ho puc creure "
+        "els veïns del barri es queixen del soroll al carrer"
+    ),
+}
+
+# Eliminar URLs, menciones y caracteres que no aportan información de idioma
+_URL_RE = re.compile(r"https?://\S+|www\.\S+")
+_MENTION_RE = re.compile(r"[@#]\w+")
+_NON_LETTER_RE = re.compile(r"[^\w'·]+|[\d_]+")
+
+
+class LanguageDetector:
+    """
+    Detector de idioma ligero basado en n-gramas de caracteres.
+
+    Puntúa el texto con la log-verosimilitud promedio de sus bigramas y
+    trigramas bajo el perfil de cada idioma (Naive Bayes con suavizado
+    aditivo). Los trigramas pesan el doble: capturan terminaciones y
+    palabras cortas ("ción", " el ", "ão ") que separan idiomas cercanos
+    como español, portugués, italiano y catalán. Es varios órdenes de
+    magnitud más barato que ejecutar el pipeline completo de spaCy, por lo
+    que se usa en la ingesta para llenar `idioma` y decidir qué contenido
+    se envía a los modelos en español.
+    """
+
+    _instance = None
+    _profiles: Dict[str, Dict[str, float]] | None = None
+    _unseen: Dict[str, float] = {}
+
+    # Peso de cada tamaño de n-grama
+    NGRAM_WEIGHTS = {2: 1.0, 3: 2.0}
+    # Suavizado aditivo para n-gramas que no aparecen en el perfil
+    SMOOTHING = 0.5
+    # Temperatura del softmax que convierte puntuaciones en confianza
+    TEMPERATURE = 0.1
+
+    def __new__(cls):
+        """Singleton para construir los perfiles una sola vez"""
+        if cls._instance is None:
+            cls._instance = super(LanguageDetector, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self):
+        """Construye los perfiles de n-gramas si no existen"""
+        if self._profiles is None:
+            self._build_profiles()
+
+    @staticmethod
+    def _normalize(texto: str) -> str:
+        """
+        Normaliza texto para extracción de n-gramas.
+
+        Args:
+            texto: Texto crudo
+
+        Returns:
+            Texto en minúsculas sin URLs, menciones, dígitos ni puntuación
+        """
+        texto = unicodedata.normalize("NFC", texto.lower())
+        texto = _URL_RE.sub(" ", texto)
+        texto = _MENTION_RE.sub(" ", texto)
+        texto = _NON_LETTER_RE.sub(" ", texto)
+        return " ".join(texto.split())
+
+    @classmethod
+    def _ngram_counts(cls, texto: str) -> Counter:
+        """
+        Cuenta los n-gramas del texto, ponderados por `NGRAM_WEIGHTS`.
+
+        Args:
+            texto: Texto normalizado
+
+        Returns:
+            Counter n-grama -> peso acumulado
+        """
+        counts: Counter = Counter()
+        for word in texto.split():
+            padded = f" {word} "
+            for n, weight in cls.NGRAM_WEIGHTS.items():
+                for i in range(len(padded) - n + 1):
+                    counts[padded[i : i + n]] += weight
+        return counts
+
+    def _build_profiles(self) -> None:
+        """Construye los perfiles de log-probabilidad de n-gramas por idioma"""
+        counts = {
+            lang: self._ngram_counts(self._normalize(seed)) for lang, seed in _SEED_TEXTS.items()
+        }
+        vocabulary = len(set().union(*counts.values()))
+
+        profiles: Dict[str, Dict[str, float]] = {}
+        unseen: Dict[str, float] = {}
+        for lang, grams in counts.items():
+            denom = sum(grams.values()) + self.SMOOTHING * vocabulary
+            profiles[lang] = {
+                gram: math.log((c + self.SMOOTHING) / denom) for gram, c in grams.items()
+            }
+            unseen[lang] = math.log(self.SMOOTHING / denom)
+
+        self._profiles = profiles
+        self._unseen = unseen
+        logger.info(f"Perfiles de idioma construidos: {sorted(self._profiles)}")
+
+    @property
+    def languages(self) -> List[str]:
+        """Retorna los idiomas soportados por el detector"""
+        return sorted(self._profiles or {})
+
+    def rank(self, texto: str) -> List[Tuple[str, float]]:
+        """
+        Ordena los idiomas por probabilidad para un texto.
+
+        Args:
+            texto: Texto a analizar
+
+        Returns:
+            Lista de (código ISO 639-1, confianza 0-1) de mayor a menor
+            confianza. Vacía si el texto es demasiado corto para decidir.
+        """
+        normalized = self._normalize(texto or "")
+
+        if len(normalized.replace(" ", "")) < settings.language_min_chars:
+            return []
+
+        counts = self._ngram_counts(normalized)
+        total = sum(counts.values())
+
+        # Log-verosimilitud promedio por n-grama (independiente del largo)
+        scores: Dict[str, float] = {
+            lang: sum(
+                weight * profile.get(gram, self._unseen[lang]) for gram, weight in counts.items()
+            )
+            / total
+            for lang, profile in self._profiles.items()
+        }
+
+        # Softmax con temperatura para convertir puntuaciones en confianza
+        best = max(scores.values())
+        exp = {lang: math.exp((s - best) / self.TEMPERATURE) for lang, s in scores.items()}
+        denom = sum(exp.values())
+
+        return sorted(
+            ((lang, value / denom) for lang, value in exp.items()),
+            key=lambda item: item[1],
+            reverse=True,
+        )
+
+    def detect(self, texto: str) -> Tuple[str | None, float]:
+        """
+        Detecta el idioma de un texto.
+
+        Args:
+            texto: Texto a analizar
+
+        Returns:
+            Tupla (código ISO 639-1, confianza 0-1). El código es None si el
+            texto es demasiado corto para decidir.
+        """
+        ranking = self.rank(texto)
+        if not ranking:
+            return None, 0.0
+        return ranking[0]
+
+    def detect_language(self, texto: str, hint: str | None = None) -> str:
+        """
+        Determina el idioma a guardar en `ContenidoRecolectado.idioma`.
+
+        Prioridad:
+        1. Si los dos idiomas más probables están a menos de
+           `language_min_margin`, el idioma declarado por la plataforma
+           (ej: Mastodon `language`) si es uno de ellos
+        2. Detección propia si supera `language_min_confidence` y el margen
+        3. Idioma declarado por la plataforma
+        4. `language_default`
+
+        Un idioma no soportado por el pipeline NLP solo se guarda con
+        confianza `language_skip_confidence` o si la plataforma lo
+        confirma: guardar un idioma equivocado hace que el contenido se
+        marque como procesado sin pasar por NLP.
+
+        Args:
+            texto: Texto del contenido
+            hint: Idioma reportado por la plataforma (opcional)
+
+        Returns:
+            Código ISO 639-1 del idioma
+        """
+        hint = hint.split("-")[0].lower()[:10] if hint else None
+
+        if not settings.language_detection_enabled:
+            return hint or settings.language_default
+
+        ranking = self.rank(texto)
+        if not ranking:
+            return hint or settings.language_default
+
+        lang, confidence = ranking[0]
+        runner_up, runner_up_confidence = ranking[1] if len(ranking) > 1 else (None, 0.0)
+
+        if confidence - runner_up_confidence < settings.language_min_margin:
+            if hint in (lang, runner_up):
+                return hint
+            return hint or settings.language_default
+
+        if confidence < settings.language_min_confidence:
+            return hint or settings.language_default
+
+        if (
+            not self.is_supported(lang)
+            and confidence < settings.language_skip_confidence
+            and hint != lang
+        ):
+            return hint or settings.language_default
+
+        return lang
+
+    def is_supported(self, idioma: str | None) -> bool:
+        """
+        Verifica si un idioma es procesable por el pipeline NLP.
+
+        Args:
+            idioma: Código ISO 639-1 (None se considera soportado)
+
+        Returns:
+            True si el contenido debe enviarse a los modelos NLP
+        """
+        if idioma is None:
+            return True
+        return idioma in settings.nlp_supported_languages
+
+
+# Instancia global
+language_detector = LanguageDetector()
@@ -0,0 +1,46 @@
+"""
+Endpoint de métricas Prometheus para procesos fuera de la API
+"""
+
+import logging
+import os
+
+from prometheus_client import REGISTRY, CollectorRegistry, multiprocess, start_http_server
+
+logger = logging.getLogger(__name__)
+
+# Directorio compartido del modo multiproceso de prometheus_client
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_enabled() -> bool:
+    """True si las métricas se escriben en archivos compartidos entre procesos"""
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def start_metrics_server(port: int) -> None:
+    """
+    Expone `/metrics` en un puerto propio (hilo en segundo plano).
+
+    En un worker prefork cada hijo tiene sus propias métricas: con
+    PROMETHEUS_MULTIPROC_DIR definido (antes de importar prometheus_client
+    y vacío al arrancar) los hijos escriben sus valores en ese directorio y
+    el proceso padre los agrega en cada scrape. Sin el directorio se expone
+    el registro del proceso (worker gevent, un solo proceso).
+
+    Args:
+        port: Puerto HTTP
+    """
+    registry = REGISTRY
+    if multiprocess_enabled():
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+
+    start_http_server(port, registry=registry)
+    logger.info(f"Métricas Prometheus en el puerto {port}")
+
+
+def mark_process_dead(pid: int) -> None:
+    """Descarta los gauges de un proceso hijo que terminó (modo multiproceso)"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid)
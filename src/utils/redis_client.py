@@ -0,0 +1,51 @@
+"""
+Cliente Redis compartido
+"""
+
+from threading import Lock
+
+import redis
+import redis.asyncio
+
+from src.utils.config import settings
+
+_client: redis.Redis | None = None
+_async_client: redis.asyncio.Redis | None = None
+_lock = Lock()
+
+
+def get_redis() -> redis.Redis:
+    """
+    Obtiene el cliente Redis del proceso (se crea en el primer uso).
+
+    El cliente mantiene su propio pool de conexiones y es thread-safe.
+
+    Returns:
+        Cliente conectado a `settings.redis_url` con respuestas decodificadas
+    """
+    global _client
+
+    if _client is None:
+        with _lock:
+            if _client is None:
+                _client = redis.Redis.from_url(settings.redis_url, decode_responses=True)
+
+    return _client
+
+
+def get_async_redis() -> redis.asyncio.Redis:
+    """
+    Obtiene el cliente Redis asíncrono del proceso (para la API).
+
+    Returns:
+        Cliente asyncio conectado a `settings.redis_url` sin decodificar
+        respuestas (los valores se leen como bytes)
+    """
+    global _async_client
+
+    if _async_client is None:
+        with _lock:
+            if _async_client is None:
+                _async_client = redis.asyncio.Redis.from_url(settings.redis_url)
+
+    return _async_client
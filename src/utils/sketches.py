@@ -0,0 +1,37 @@
+"""
+Índices de Count-Min Sketch para conteo aproximado en memoria acotada
+"""
+
+from typing import List
+import hashlib
+
+
+class SketchIndexer:
+    """
+    Posiciones de un elemento en un Count-Min Sketch de `depth` × `width`.
+
+    Las posiciones se derivan de un hash estable (blake2b), de modo que
+    procesos distintos calculan los mismos índices y los contadores pueden
+    vivir fuera del proceso (ver `StreamingTrendCounter`, que los guarda en
+    Redis y solo necesita los índices).
+    """
+
+    def __init__(self, width: int = 2048, depth: int = 4):
+        """
+        Args:
+            width: Contadores por fila
+            depth: Número de filas (funciones hash)
+        """
+        self.width = width
+        self.depth = depth
+
+    def indexes(self, item: str) -> List[int]:
+        """
+        Posiciones del elemento en la tabla aplanada (fila × width + columna).
+
+        Usa doble hashing (h1 + i·h2) sobre un único digest.
+        """
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [row * self.width + (h1 + row * h2) % self.width for row in range(self.depth)]
@@ -4,26 +4,34 @@ Configuración de pytest y fixtures comunes
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
 
-from src.models.base import Base, get_db
+from src.models.base import Base, get_async_db
+from src.models.routing import get_read_db
 from src.api.main import app
 from src.utils.config import settings
 
 
-# URL de base de datos de test (usar SQLite en memoria)
-TEST_DATABASE_URL = "sqlite:///:memory:"
+@pytest.fixture(scope="function")
+def db_path(tmp_path):
+    """
+    Archivo SQLite del test.
+    Es un archivo (no :memory:) para que el engine síncrono de los fixtures
+    y el asíncrono de la API vean los mismos datos.
+    """
+    return tmp_path / "test.db"
 
 
 @pytest.fixture(scope="function")
-def db_engine():
+def db_engine(db_path):
     """
     Crea un engine de SQLAlchemy para tests.
-    Usa SQLite en memoria para velocidad y aislamiento.
+    Usa SQLite en un archivo temporal para velocidad y aislamiento.
     """
     engine = create_engine(
-        TEST_DATABASE_URL,
+        f"sqlite:///{db_path}",
         connect_args={"check_same_thread": False},  # Necesario para SQLite
     )
 
@@ -58,19 +66,25 @@ def db_session(db_engine):
 
 
 @pytest.fixture(scope="function")
-def client(db_session):
+def client(db_engine, db_path):
     """
     Crea un cliente de test de FastAPI.
-    Sobrescribe la dependencia get_db para usar la sesión de test.
+    Sobrescribe las dependencias de sesión para usar la base de test.
     """
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+    TestingAsyncSessionLocal = async_sessionmaker(
+        async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
 
-    def override_get_db():
-        try:
-            yield db_session
-        finally:
-            pass
+    async def override_get_async_db():
+        async with TestingAsyncSessionLocal() as session:
+            yield session
 
-    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
+    app.dependency_overrides[get_read_db] = override_get_async_db
 
     with TestClient(app) as test_client:
         yield test_client
@@ -0,0 +1,70 @@
+"""
+Tests para la programación adaptativa de recolección
+"""
+
+from uuid import uuid4
+
+from src.services.adaptive_scheduler import AdaptiveScheduler
+from src.utils.config import settings
+
+
+class TestAdaptiveScheduler:
+    """Tests para AdaptiveScheduler"""
+
+    def test_quiet_pair_backs_off_exponentially(self):
+        """Test ejecuciones sin contenido nuevo duplican el intervalo hasta el máximo"""
+        interval = settings.collection_base_interval_minutes
+        intervals = []
+        for _ in range(10):
+            interval = AdaptiveScheduler.next_interval(interval, 0, 0.0)
+            intervals.append(interval)
+
+        assert intervals[0] == settings.collection_base_interval_minutes * 2
+        assert intervals == sorted(intervals)
+        assert intervals[-1] == settings.collection_max_interval_minutes
+
+    def test_hot_pair_polls_faster(self):
+        """Test pares con mucho contenido nuevo bajan hasta el intervalo mínimo"""
+        interval = settings.collection_base_interval_minutes
+        for _ in range(10):
+            interval = AdaptiveScheduler.next_interval(
+                interval, 100, settings.collection_hot_yield * 2
+            )
+
+        assert interval == settings.collection_min_interval_minutes
+
+    def test_moderate_yield_resets_to_base(self):
+        """Test un par en backoff vuelve al intervalo base al traer contenido"""
+        interval = AdaptiveScheduler.next_interval(
+            settings.collection_max_interval_minutes, 3, 3.0
+        )
+
+        assert interval == settings.collection_base_interval_minutes
+
+    def test_update_ewma(self):
+        """Test promedio móvil exponencial de rendimiento"""
+        assert AdaptiveScheduler.update_ewma(0.0, 12, first_run=True) == 12.0
+
+        alpha = settings.collection_yield_alpha
+        assert AdaptiveScheduler.update_ewma(10.0, 0, first_run=False) == (1 - alpha) * 10.0
+
+    def test_merged_queries_aggregate_into_one_step(self):
+        """Test dos queries del ciclo que cubren el mismo lineamiento suman su rendimiento"""
+        compartido, otro = uuid4(), uuid4()
+        results = [
+            {"platform": "reddit", "yields": {str(compartido): 6, str(otro): 0}},
+            {"platform": "reddit", "yields": {str(compartido): 0}},
+            {"platform": "youtube", "yields": {str(compartido): 2}},
+            None,  # Query sin resultado
+        ]
+
+        aggregated = AdaptiveScheduler.aggregate_yields(results)
+
+        assert aggregated == {"reddit": {compartido: 6, otro: 0}, "youtube": {compartido: 2}}
+        # La query vacía no manda al lineamiento productivo a backoff
+        interval = AdaptiveScheduler.next_interval(
+            settings.collection_base_interval_minutes,
+            aggregated["reddit"][compartido],
+            AdaptiveScheduler.update_ewma(0.0, aggregated["reddit"][compartido], first_run=True),
+        )
+        assert interval <= settings.collection_base_interval_minutes
@@ -0,0 +1,91 @@
+"""
+Tests para los autores únicos por segmento (HyperLogLog)
+"""
+
+from collections import defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Any, List
+
+from src.services.author_sketches import AuthorSketches
+
+
+class _FakeRedis:
+    """Redis en memoria con conjuntos exactos en lugar de HyperLogLog"""
+
+    def __init__(self):
+        self.sets = defaultdict(set)
+        self.ttl = {}
+        self.pending: List[Any] = []
+
+    def pfadd(self, key: str, *values: str) -> int:
+        self.sets[key].update(values)
+        return 1
+
+    def pfcount(self, *keys: str) -> int:
+        return len(set().union(*(self.sets.get(key, set()) for key in keys)))
+
+    def expire(self, key: str, seconds: int) -> bool:
+        self.ttl[key] = seconds
+        return True
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, client: _FakeRedis):
+        self.client = client
+        self.calls: List[Any] = []
+
+    def __getattr__(self, name: str):
+        return lambda *args: self.calls.append((getattr(self.client, name), args))
+
+    def execute(self) -> List[Any]:
+        return [method(*args) for method, args in self.calls]
+
+
+SEGMENT = ("elecciones", "reddit", "mexico", "Desconocido", "Desconocido")
+
+
+class TestAuthorSketches:
+    """Tests para AuthorSketches"""
+
+    def test_keys_cover_touched_hours(self):
+        """Test un rango usa una clave por hora que toca, con fin exclusivo"""
+        sketches = AuthorSketches(client=_FakeRedis())
+        start = datetime(2024, 5, 1, 10, 30, tzinfo=timezone.utc)
+        hour = start.replace(minute=0)
+
+        assert len(sketches.keys(SEGMENT, start, start + timedelta(hours=1))) == 2
+        assert len(sketches.keys(SEGMENT, hour, hour + timedelta(hours=1))) == 1
+
+    def test_repeated_author_counts_once(self):
+        """Test un autor que publica muchas veces cuenta una sola vez"""
+        client = _FakeRedis()
+        sketches = AuthorSketches(client=client)
+        moment = datetime(2024, 5, 1, 10, 15, tzinfo=timezone.utc)
+
+        for _ in range(50):
+            sketches.record(SEGMENT, "spammer", moment)
+        sketches.record(SEGMENT, "otro", moment)
+
+        counts = sketches.count(
+            [SEGMENT], moment - timedelta(minutes=15), moment + timedelta(minutes=45)
+        )
+
+        assert counts.tolist() == [2.0]
+        assert all(ttl > 0 for ttl in client.ttl.values())
+
+    def test_union_merges_hours_and_platforms(self):
+        """Test la unión no duplica autores entre horas ni plataformas"""
+        sketches = AuthorSketches(client=_FakeRedis())
+        youtube = ("elecciones", "youtube", "Desconocido", "Desconocido", "Desconocido")
+        start = datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc)
+
+        sketches.record(SEGMENT, "ana", start)
+        sketches.record(SEGMENT, "ana", start + timedelta(hours=1))
+        sketches.record(youtube, "ana", start)
+        sketches.record(youtube, "luis", start + timedelta(hours=1))
+
+        assert sketches.count_union([SEGMENT, youtube], start, start + timedelta(hours=2)) == 2
+        assert sketches.count_union([], start, start + timedelta(hours=2)) == 0
@@ -0,0 +1,87 @@
+"""
+Tests para la detección de picos sobre líneas base móviles
+"""
+
+import math
+
+import numpy as np
+
+from src.services.burst_detector import BurstDetector, poisson_sf
+
+
+def _poisson_sf_exact(k: int, lam: float) -> float:
+    """P(X >= k) sumando la pmf de 0 a k-1"""
+    return 1.0 - sum(math.exp(-lam) * lam**i / math.factorial(i) for i in range(k))
+
+
+class TestPoissonTail:
+    """Tests para poisson_sf"""
+
+    def test_matches_exact_tail_for_small_means(self):
+        """Test coincide con la suma exacta de la pmf"""
+        k = np.array([5, 10, 3])
+        lam = np.array([2.0, 1.5, 2.5])
+
+        expected = [_poisson_sf_exact(5, 2.0), _poisson_sf_exact(10, 1.5), _poisson_sf_exact(3, 2.5)]
+
+        assert np.allclose(poisson_sf(k, lam), expected, rtol=1e-6)
+
+    def test_normal_approximation_for_large_means(self):
+        """Test aproxima la cola para medias grandes"""
+        p = poisson_sf(np.array([140]), np.array([100.0]))[0]
+
+        assert abs(p - _poisson_sf_exact(140, 100.0)) < 5e-4
+
+    def test_counts_below_mean_are_not_informative(self):
+        """Test la cola es 1.0 cuando no se supera la media"""
+        assert poisson_sf(np.array([3]), np.array([8.0]))[0] == 1.0
+
+
+class TestBurstDetector:
+    """Tests para BurstDetector"""
+
+    def test_tiny_counts_do_not_flap(self):
+        """Test pasar de casi 0 a 2 menciones no es un pico"""
+        result = BurstDetector.evaluate(
+            observed=np.array([2.0]),
+            mean=np.array([0.2]),
+            var=np.array([0.1]),
+            runs=np.array([100]),
+        )
+
+        assert not result.es_pico[0]
+
+    def test_flags_burst_over_stable_baseline(self):
+        """Test un salto grande sobre una línea base estable es pico"""
+        result = BurstDetector.evaluate(
+            observed=np.array([30.0, 6.0]),
+            mean=np.array([5.0, 5.0]),
+            var=np.array([4.0, 4.0]),
+            runs=np.array([100, 100]),
+        )
+
+        assert result.es_pico.tolist() == [True, False]
+        assert result.pvalue[0] < 1e-6
+
+    def test_requires_warmup(self):
+        """Test no se detectan picos sin historial suficiente"""
+        result = BurstDetector.evaluate(
+            observed=np.array([30.0]),
+            mean=np.array([5.0]),
+            var=np.array([4.0]),
+            runs=np.array([1]),
+        )
+
+        assert not result.warm[0]
+        assert not result.es_pico[0]
+
+    def test_ewma_converges_incrementally(self):
+        """Test la línea base converge a un nivel estable sin recalcular historial"""
+        mean, var, runs = np.zeros(1), np.zeros(1), np.zeros(1)
+
+        for _ in range(200):
+            mean, var = BurstDetector.update_ewma(mean, var, np.array([10.0]), runs)
+            runs = runs + 1
+
+        assert np.isclose(mean[0], 10.0)
+        assert np.isclose(var[0], 0.0)
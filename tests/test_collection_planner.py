@@ -0,0 +1,66 @@
+"""
+Tests para el planificador de queries de recolección
+"""
+
+from types import SimpleNamespace
+
+from src.services.collection_planner import CollectionPlanner
+from src.utils.config import settings
+
+
+def _lineamiento(id_: str, keywords, plataformas):
+    """Crea un lineamiento mínimo para el planificador"""
+    return SimpleNamespace(id=id_, keywords=keywords, plataformas=plataformas)
+
+
+class TestCollectionPlanner:
+    """Tests para CollectionPlanner"""
+
+    def test_shared_keywords_merged_in_one_query(self):
+        """Test keywords compartidas se buscan una sola vez en YouTube"""
+        plan = CollectionPlanner().plan(
+            [
+                _lineamiento("a", ["IA", "inteligencia artificial"], ["youtube"]),
+                _lineamiento("b", ["#ia", "Educación"], ["youtube"]),
+            ]
+        )
+
+        assert len(plan.queries) == 1
+        query = plan.queries[0]
+        assert query.keywords == ["IA", "inteligencia artificial", "Educación"]
+        assert query.lineamiento_ids == ["a", "b"]
+        assert plan.estimated_units["youtube"] < plan.naive_units["youtube"]
+
+    def test_query_length_limit_splits_queries(self):
+        """Test las queries combinadas respetan la longitud máxima"""
+        keywords = [f"keyword{i:03d}" for i in range(40)]
+        plan = CollectionPlanner().plan([_lineamiento("a", keywords, ["youtube"])])
+
+        assert len(plan.queries) > 1
+        for query in plan.queries:
+            assert len(query.query) <= settings.youtube_max_query_length
+            assert len(query.keywords) <= settings.collection_max_keywords_per_query
+        assert sum(len(q.keywords) for q in plan.queries) == len(keywords)
+
+    def test_mastodon_only_deduplicates_identical_sets(self):
+        """Test Mastodon no combina keywords (búsqueda AND)"""
+        plan = CollectionPlanner().plan(
+            [
+                _lineamiento("a", ["Reforma", "salud"], ["mastodon"]),
+                _lineamiento("b", ["salud", "reforma"], ["mastodon"]),
+                _lineamiento("c", ["salud"], ["mastodon"]),
+            ]
+        )
+
+        assert sorted(q.lineamiento_ids for q in plan.queries) == [["a", "b"], ["c"]]
+
+    def test_unknown_platform_and_empty_keywords_ignored(self):
+        """Test plataformas desconocidas y lineamientos sin keywords no generan queries"""
+        plan = CollectionPlanner().plan(
+            [
+                _lineamiento("a", ["clima"], ["tiktok"]),
+                _lineamiento("b", ["", "  "], ["reddit"]),
+            ]
+        )
+
+        assert plan.queries == []
@@ -0,0 +1,100 @@
+"""
+Tests para la búsqueda de texto completo en contenido
+"""
+
+import asyncio
+import uuid
+from typing import Any, Dict, List
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.services.content_search import MARK_END, MARK_START, ContentSearch
+
+
+class _FakeResult:
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+
+    def mappings(self):
+        return self
+
+    def all(self) -> List[Dict[str, Any]]:
+        return self.rows
+
+
+class _FakeAsyncSession:
+    """Sesión asíncrona falsa que registra la query y devuelve filas fijas"""
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self.queries: List[Any] = []
+
+    async def execute(self, query):
+        self.queries.append(query)
+        return _FakeResult(self.rows)
+
+
+def _sql(query) -> str:
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def _row(relevancia: float, fragmento: str) -> Dict[str, Any]:
+    return {"id": uuid.uuid4(), "relevancia": relevancia, "fragmento": fragmento}
+
+
+class TestContentSearchCursor:
+    """Tests para el cursor de paginación de ContentSearch"""
+
+    def test_cursor_round_trip(self):
+        """Test el cursor conserva la relevancia y el id de la última fila"""
+        contenido_id = uuid.uuid4()
+        cursor = ContentSearch.encode_cursor(0.0607927, contenido_id)
+
+        assert "=" not in cursor
+        assert ContentSearch.decode_cursor(cursor) == (0.0607927, contenido_id)
+
+    def test_invalid_cursor_raises_value_error(self):
+        """Test un cursor manipulado se rechaza con ValueError"""
+        with pytest.raises(ValueError):
+            ContentSearch.decode_cursor("no-es-un-cursor")
+
+        with pytest.raises(ValueError):
+            ContentSearch.decode_cursor(ContentSearch.encode_cursor(0.5, uuid.uuid4())[:-4])
+
+
+class TestContentSearchQuery:
+    """Tests para la query y los resultados de ContentSearch"""
+
+    def test_query_uses_index_expression_and_keyset(self):
+        """Test la query usa la expresión del índice GIN y pagina por (relevancia, id)"""
+        cursor = ContentSearch.encode_cursor(0.25, uuid.uuid4())
+
+        sql = _sql(ContentSearch().build_query("elecciones -fraude", limit=10, cursor=cursor))
+
+        assert (
+            "to_tsvector('spanish', contenido_recolectado.contenido_texto) "
+            "@@ websearch_to_tsquery('spanish'" in sql
+        )
+        assert "contenido_recolectado.id) < (CAST(" in sql
+        # ts_headline solo en la query externa, sobre las filas de la página
+        assert sql.count("ts_headline(") == 1
+        assert sql.index("ts_headline(") < sql.index("FROM (SELECT")
+
+    def test_search_pages_and_escapes_fragments(self):
+        """Test una fila extra genera el cursor y el HTML del post se escapa"""
+        rows = [
+            _row(0.9, f"<script>alert(1)</script> {MARK_START}elecciones{MARK_END} & más"),
+            _row(0.5, "segunda"),
+            _row(0.1, "fila extra"),
+        ]
+        db = _FakeAsyncSession(rows)
+
+        items, next_cursor = asyncio.run(ContentSearch().search(db, "elecciones", limit=2))
+
+        assert [item["relevancia"] for item in items] == [0.9, 0.5]
+        assert items[0]["fragmento"] == (
+            "&lt;script&gt;alert(1)&lt;/script&gt; <mark>elecciones</mark> &amp; más"
+        )
+        assert ContentSearch.decode_cursor(next_cursor) == (0.5, rows[1]["id"])
+        assert db.queries[0].compile().params["param_1"] == 3
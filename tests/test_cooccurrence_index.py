@@ -0,0 +1,53 @@
+"""
+Tests para el índice de co-ocurrencias de términos
+"""
+
+from datetime import datetime, timezone
+
+from src.services.cooccurrence_index import CooccurrenceIndex
+from src.utils.config import settings
+
+
+class TestCooccurrenceIndex:
+    """Tests para CooccurrenceIndex"""
+
+    def test_terms_merge_keywords_and_entities(self):
+        """Test keywords y entidades se normalizan y deduplican"""
+        terms = CooccurrenceIndex.terms(
+            ["IA", "Educación"],
+            {"PER": ["Ana Pérez"], "LOC": ["México", "#educacion"]},
+        )
+
+        assert terms == ["ia", "educacion", "ana perez", "mexico"]
+        assert CooccurrenceIndex.terms(None, None) == []
+
+    def test_terms_are_capped(self):
+        """Test el número de términos por tema está acotado"""
+        terms = CooccurrenceIndex.terms([f"termino{i}" for i in range(100)], {})
+
+        assert len(terms) == settings.cooccurrence_max_terms_per_tema
+
+    def test_count_pairs_by_bucket(self):
+        """Test un lote se reduce a pares ordenados por bucket"""
+        index = CooccurrenceIndex()
+        moment = datetime(2024, 5, 1, 10, 20, tzinfo=timezone.utc)
+        bucket = index.bucket(moment)
+
+        counts = index.count_pairs(
+            [
+                (moment, ["salud", "ia"]),
+                (moment, ["ia", "salud", "hospitales"]),
+            ]
+        )
+
+        assert bucket <= moment
+        assert counts[(bucket, "ia", "salud")] == 2
+        assert counts[(bucket, "hospitales", "ia")] == 1
+        assert (bucket, "salud", "ia") not in counts
+        assert len(counts) == 3
+
+    def test_expansion(self):
+        """Test expansión relativa y convención sin vecindario previo"""
+        assert CooccurrenceIndex.expansion(4, 2) == 2.0
+        assert CooccurrenceIndex.expansion(3, 0) == 1.0
+        assert CooccurrenceIndex.expansion(0, 0) == 0.0
@@ -0,0 +1,150 @@
+"""
+Tests para la consulta masiva de engagement de los collectors
+"""
+
+from types import SimpleNamespace
+from typing import Any, List
+
+from mastodon.errors import MastodonNotFoundError
+from prawcore.exceptions import ServerError
+
+from src.collectors.mastodon_collector import MastodonCollector
+from src.collectors.reddit_collector import RedditCollector
+from src.collectors.youtube_collector import YouTubeCollector
+from src.utils.config import settings
+
+
+class _NoLimit:
+    def acquire(self):
+        pass
+
+
+class _FakeReddit:
+    """Cliente PRAW falso que registra los fullnames de cada request"""
+
+    def __init__(self, deleted: set, failing_batches: set = frozenset()):
+        self.deleted = deleted
+        self.failing_batches = failing_batches
+        self.calls: List[List[str]] = []
+
+    def info(self, fullnames):
+        self.calls.append(list(fullnames))
+        if len(self.calls) - 1 in self.failing_batches:
+            raise ServerError(SimpleNamespace(status_code=503))
+        for fullname in fullnames:
+            post_id = fullname[3:]
+            if post_id not in self.deleted:
+                yield SimpleNamespace(id=post_id, score=int(post_id[1:]), num_comments=2)
+
+
+class _FakeYouTube:
+    """Cliente de YouTube falso con requests batch"""
+
+    def __init__(self):
+        self.batches: List[int] = []
+        self.ids_per_call: List[int] = []
+
+    def videos(self):
+        return self
+
+    def list(self, part: str, id: str):
+        ids = id.split(",")
+        self.ids_per_call.append(len(ids))
+        items = [
+            {"id": video_id, "statistics": {"viewCount": "10", "likeCount": "3"}}
+            for video_id in ids
+        ]
+        return SimpleNamespace(execute=lambda: {"items": items})
+
+    def new_batch_http_request(self, callback=None):
+        client = self
+        requests: List[Any] = []
+
+        class _Batch:
+            def add(self, request, request_id):
+                requests.append((request_id, request))
+
+            def execute(self):
+                client.batches.append(len(requests))
+                for request_id, request in requests:
+                    callback(request_id, request.execute(), None)
+
+        return _Batch()
+
+
+class _FakeMastodonSinStatuses:
+    """Cliente Mastodon.py 1.8 falso: solo tiene `status(id)`"""
+
+    def __init__(self, deleted: set):
+        self.deleted = deleted
+        self.calls: List[str] = []
+
+    def status(self, toot_id: str) -> dict:
+        self.calls.append(toot_id)
+        if toot_id in self.deleted:
+            raise MastodonNotFoundError("Record not found")
+        return {"id": int(toot_id), "favourites_count": 4, "replies_count": 1, "reblogs_count": 2}
+
+
+class TestCollectorEngagement:
+    """Tests para get_engagement de cada collector"""
+
+    def test_reddit_uses_info_with_100_fullnames(self):
+        """Test consulta hasta 100 fullnames por request y omite eliminados"""
+        collector = RedditCollector(client_id="", client_secret="")
+        collector.reddit = _FakeReddit(deleted={"p7"})
+        collector.rate_limiter = _NoLimit()
+
+        engagement = collector.get_engagement([f"p{n}" for n in range(250)])
+
+        assert [len(call) for call in collector.reddit.calls] == [100, 100, 50]
+        assert collector.reddit.calls[0][0] == "t3_p0"
+        assert len(engagement) == 249
+        assert engagement["p42"] == {"views": None, "likes": 42, "comments": 2, "shares": None}
+
+    def test_youtube_batches_50_ids_per_call(self):
+        """Test pide estadísticas de 50 videos por request en una request batch"""
+        collector = YouTubeCollector(api_key="")
+        collector.youtube = _FakeYouTube()
+        collector.rate_limiter = _NoLimit()
+
+        engagement = collector.get_engagement([f"v{n}" for n in range(120)])
+
+        assert collector.youtube.ids_per_call == [50, 50, 20]
+        assert collector.youtube.batches == [3]
+        assert engagement["v119"] == {"views": 10, "likes": 3, "comments": 0, "shares": None}
+
+    def test_mastodon_falls_back_to_status_per_id(self):
+        """Test sin `statuses()` consulta cada toot y omite los eliminados"""
+        collector = MastodonCollector(access_token="")
+        collector.mastodon = _FakeMastodonSinStatuses(deleted={"3"})
+        collector.rate_limiter = _NoLimit()
+
+        engagement = collector.get_engagement([str(n) for n in range(25)])
+
+        assert len(collector.mastodon.calls) == 25
+        assert len(engagement) == 24
+        assert engagement["7"] == {"views": None, "likes": 4, "comments": 1, "shares": 2}
+
+    def test_mastodon_fallback_only_refreshes_most_recent(self, monkeypatch):
+        """Test sin `statuses()` consulta solo los toots más recientes del límite"""
+        monkeypatch.setattr(settings, "mastodon_engagement_fallback_max_items", 10)
+        collector = MastodonCollector(access_token="")
+        collector.mastodon = _FakeMastodonSinStatuses(deleted=set())
+        collector.rate_limiter = _NoLimit()
+
+        engagement = collector.get_engagement([str(n) for n in range(5000)])
+
+        assert collector.mastodon.calls == [str(n) for n in range(10)]
+        assert len(engagement) == 10
+
+    def test_reddit_skips_batch_on_prawcore_error(self):
+        """Test un error HTTP de prawcore omite el batch sin abortar el refresco"""
+        collector = RedditCollector(client_id="", client_secret="")
+        collector.reddit = _FakeReddit(deleted=set(), failing_batches={1})
+        collector.rate_limiter = _NoLimit()
+
+        engagement = collector.get_engagement([f"p{n}" for n in range(250)])
+
+        assert len(collector.reddit.calls) == 3
+        assert len(engagement) == 150
@@ -0,0 +1,102 @@
+"""
+Tests para los escritores de exportación de tendencias
+"""
+
+import csv
+import io
+import json
+from datetime import datetime, timezone
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import literal_column, select
+
+from src.services.export_writers import EXPORT_COLUMNS, ExportWriter, export_writer
+
+
+def _row(volumen: int):
+    return (
+        uuid4(),
+        datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc),
+        uuid4(),
+        "elecciones",
+        "reddit",
+        "México",
+        "25-34",
+        "Desconocido",
+        volumen,
+        0.5,
+        -0.1,
+        True,
+        None,
+        12,
+        3.2,
+        1.1,
+        ["voto", "ine"],
+    )
+
+
+def _export(formato: str, batches) -> bytes:
+    writer = export_writer(formato)
+    parts = [writer.open()]
+    parts.extend(writer.write(batch) for batch in batches)
+    parts.extend(writer.close())
+    return b"".join(parts)
+
+
+class TestExportWriters:
+    """Tests para los escritores incrementales"""
+
+    def test_csv_streams_header_and_batches(self):
+        """Test el CSV tiene una cabecera y una línea por fila de todos los lotes"""
+        data = _export("csv", [[_row(1), _row(2)], [], [_row(3)]])
+
+        lines = list(csv.reader(io.StringIO(data.decode("utf-8"))))
+
+        assert lines[0] == EXPORT_COLUMNS
+        assert [line[EXPORT_COLUMNS.index("volumen_menciones")] for line in lines[1:]] == [
+            "1",
+            "2",
+            "3",
+        ]
+        assert lines[1][EXPORT_COLUMNS.index("keywords")] == "voto|ine"
+
+    def test_ndjson_one_object_per_line(self):
+        """Test JSON Lines escribe un objeto por fila con las columnas exportadas"""
+        data = _export("ndjson", [[_row(7)], [_row(8)]])
+
+        objects = [json.loads(line) for line in data.splitlines()]
+
+        assert [obj["volumen_menciones"] for obj in objects] == [7, 8]
+        assert objects[0]["fecha_hora"] == "2024-05-01T10:00:00Z"
+        assert list(objects[0]) == EXPORT_COLUMNS
+
+    def test_unknown_format(self):
+        """Test un formato desconocido es un error de validación"""
+        with pytest.raises(ValueError):
+            export_writer("pdf")
+
+    def test_writer_without_write_fails_on_instantiation(self):
+        """Test un escritor sin `write` falla al crearlo, no a mitad de la exportación"""
+
+        class _SinWrite(ExportWriter):
+            extension = "txt"
+
+        with pytest.raises(TypeError):
+            _SinWrite()
+
+    def test_limit_rows_reads_one_extra_row_for_capped_formats(self):
+        """Test solo los formatos con límite acotan la query, con una fila extra para el recorte"""
+        query = select(literal_column("1"))
+
+        class _Acotado(ExportWriter):
+            max_rows = 2
+
+            def write(self, rows):
+                return b""
+
+        def sql(stmt) -> str:
+            return str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+        assert export_writer("csv").limit_rows(query) is query
+        assert "LIMIT 3" in sql(_Acotado().limit_rows(query))
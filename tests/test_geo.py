@@ -0,0 +1,28 @@
+"""
+Tests para el mapeo de ubicaciones a geo de Google Trends
+"""
+
+from src.utils.geo import trends_geo
+
+
+class TestTrendsGeo:
+    """Tests para trends_geo"""
+
+    def test_country_names_and_cities(self):
+        """Test nombres de país y ciudades con o sin acentos"""
+        assert trends_geo("México") == "MX"
+        assert trends_geo("republica dominicana") == "DO"
+        assert trends_geo("Bogotá") == "CO"
+        assert trends_geo("Ciudad de México") == "MX"
+
+    def test_subreddits_and_codes(self):
+        """Test subreddits de país y códigos ISO"""
+        assert trends_geo("argentina") == "AR"
+        assert trends_geo("r/es") == "ES"
+        assert trends_geo("cl") == "CL"
+
+    def test_unknown_uses_default(self):
+        """Test ubicaciones no reconocidas usan el geo por defecto"""
+        assert trends_geo("Desconocido") == ""
+        assert trends_geo(None) == ""
+        assert trends_geo("AskReddit", default="MX") == "MX"
@@ -0,0 +1,58 @@
+"""
+Tests para el matcher de keywords Aho-Corasick
+"""
+
+from src.utils.keyword_matcher import KeywordMatcher, normalize_keyword
+
+
+class TestKeywordMatcher:
+    """Tests para KeywordMatcher"""
+
+    def test_normalize_keyword(self):
+        """Test normalización de acentos, mayúsculas y hashtags"""
+        assert normalize_keyword("  #Inteligencia-Artificial ") == "inteligencia artificial"
+        assert normalize_keyword("Educación") == "educacion"
+
+    def test_match_whole_words_only(self):
+        """Test keywords cortas no coinciden dentro de otras palabras"""
+        matcher = KeywordMatcher([("IA", 1)])
+
+        assert matcher.match("Muchas gracias a todos") == {}
+        assert matcher.match("Nuevo modelo de IA lanzado") == {1: {"ia"}}
+
+    def test_match_multiple_payloads(self):
+        """Test un texto puede coincidir con varios lineamientos"""
+        matcher = KeywordMatcher(
+            [
+                ("inteligencia artificial", "tecnologia"),
+                ("educación", "educacion"),
+                ("IA", "tecnologia"),
+                ("IA", "educacion"),
+            ]
+        )
+
+        matches = matcher.match("La #InteligenciaArtificial y la IA en la educacion pública")
+
+        assert matches == {
+            "tecnologia": {"ia"},
+            "educacion": {"ia", "educacion"},
+        }
+
+    def test_overlapping_keywords(self):
+        """Test keywords que se solapan se detectan todas"""
+        matcher = KeywordMatcher(
+            [("machine learning", "a"), ("learning", "b"), ("deep learning", "c")]
+        )
+
+        assert matcher.find_keywords("deep learning vs machine learning") == {
+            "machine learning",
+            "learning",
+            "deep learning",
+        }
+
+    def test_empty_matcher(self):
+        """Test matcher sin keywords no encuentra nada"""
+        matcher = KeywordMatcher([("", 1), ("!!!", 2)])
+
+        assert len(matcher) == 0
+        assert matcher.match("cualquier texto") == {}
@@ -0,0 +1,95 @@
+"""
+Tests para el detector de idioma por n-gramas
+"""
+
+import pytest
+
+from src.utils.config import settings
+from src.utils.language_detector import language_detector
+
+
+class TestLanguageDetector:
+    """Tests para LanguageDetector"""
+
+    @pytest.mark.parametrize(
+        "texto,esperado",
+        [
+            ("La verdad no entiendo por qué el gobierno sigue subiendo los impuestos", "es"),
+            ("¿Cuál es la mejor serie que han visto este año?", "es"),
+            ("What is the best way to learn programming when you have no time at all?", "en"),
+            ("My landlord is refusing to return my deposit, what should I do", "en"),
+            ("Eu acho que o novo governo não vai conseguir resolver os problemas", "pt"),
+            ("Je pense que le gouvernement doit changer sa politique économique", "fr"),
+            ("Merci à tous pour le soutien", "fr"),
+            ("Grazie a tutti per il sostegno", "it"),
+            ("Thanks everyone for the support", "en"),
+        ],
+    )
+    def test_detect_language(self, texto: str, esperado: str):
+        """Test detección de idiomas frecuentes en redes sociales"""
+        idioma, confianza = language_detector.detect(texto)
+
+        assert idioma == esperado
+        assert 0.0 < confianza <= 1.0
+
+    @pytest.mark.parametrize(
+        "texto",
+        [
+            "La selección ganó anoche contra Brasil",
+            "Gracias a todos por el apoyo",
+            "Vamos a votar el domingo",
+            "Buenos días a todos",
+            "Llegó la hora de cambiar",
+            "El dólar cerró al alza",
+            "Tengo examen mañana y no he estudiado nada",
+            "Otra vez perdió mi equipo",
+        ],
+    )
+    def test_short_spanish_posts_stored_as_spanish(self, texto: str):
+        """Test posts cortos en español no se guardan como otro idioma (ni se omiten en NLP)"""
+        idioma = language_detector.detect_language(texto)
+
+        assert idioma == "es"
+        assert language_detector.is_supported(idioma)
+
+    def test_close_ranking_prefers_platform_hint(self):
+        """Test el idioma de la plataforma decide entre dos idiomas cercanos"""
+        texto = "Que delícia estava o almoço"
+        (_, confianza), (segundo, confianza_segundo) = language_detector.rank(texto)[:2]
+
+        assert segundo == "pt"
+        assert confianza - confianza_segundo < settings.language_min_margin
+        assert language_detector.detect_language(texto, hint="pt") == "pt"
+
+    def test_unsupported_language_needs_high_confidence(self):
+        """Test un idioma no soportado con confianza media no omite NLP"""
+        idioma, confianza = language_detector.detect("Preciso de férias urgente")
+
+        assert idioma == "pt"
+        assert settings.language_min_confidence <= confianza < settings.language_skip_confidence
+        assert language_detector.detect_language("Preciso de férias urgente") == "es"
+        assert language_detector.detect_language("Preciso de férias urgente", hint="pt-BR") == "pt"
+
+    def test_detect_short_text_undetermined(self):
+        """Test texto demasiado corto no se clasifica"""
+        assert language_detector.detect("lol") == (None, 0.0)
+
+    def test_detect_ignores_urls_and_mentions(self):
+        """Test URLs, menciones y hashtags no cuentan como texto"""
+        idioma, _ = language_detector.detect("https://youtu.be/abc123 @usuario #hashtag")
+
+        assert idioma is None
+
+    def test_detect_language_falls_back_to_hint(self):
+        """Test usa el idioma de la plataforma si no se puede detectar"""
+        assert language_detector.detect_language("ok", hint="en-US") == "en"
+
+    def test_detect_language_falls_back_to_default(self):
+        """Test usa el idioma por defecto sin detección ni hint"""
+        assert language_detector.detect_language("ok") == settings.language_default
+
+    def test_is_supported(self):
+        """Test solo idiomas configurados llegan al pipeline NLP"""
+        assert language_detector.is_supported("es") is True
+        assert language_detector.is_supported("en") is False
+        assert language_detector.is_supported(None) is True
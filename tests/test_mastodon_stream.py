@@ -0,0 +1,155 @@
+"""
+Tests para el consumidor de streaming de Mastodon contra un servidor local
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List
+from urllib.parse import urlparse, parse_qs
+import json
+import threading
+
+import pytest
+
+from src.collectors.mastodon_collector import MastodonCollector
+from src.collectors.mastodon_stream import MastodonStreamConsumer
+
+
+def _status(status_id: int, texto: str) -> Dict[str, Any]:
+    """Crea un status mínimo de Mastodon API"""
+    return {
+        "id": str(status_id),
+        "created_at": "2026-10-19T12:00:00.000Z",
+        "content": f"<p>{texto}</p>",
+        "url": f"https://mastodon.test/@autor/{status_id}",
+        "language": "es",
+        "account": {"id": "7", "username": "autor", "display_name": "Autor"},
+        "tags": [],
+        "mentions": [],
+    }
+
+
+class _FakeMastodonHandler(BaseHTTPRequestHandler):
+    """Simula los endpoints REST y de streaming usados por el consumidor"""
+
+    # Cierra la conexión al terminar cada respuesta (fin del stream)
+    protocol_version = "HTTP/1.0"
+
+    backfill: List[Dict[str, Any]] = []
+    events: List[Dict[str, Any]] = []
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, payload: Any, status: int = 200):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        base = f"http://{self.server.server_address[0]}:{self.server.server_address[1]}"
+
+        if url.path == "/api/v1/instance":
+            self._json(
+                {
+                    "uri": "mastodon.test",
+                    "title": "Fake",
+                    "version": "4.2.0",
+                    "urls": {"streaming_api": base},
+                }
+            )
+        elif url.path == "/api/v1/accounts/verify_credentials":
+            self._json({"id": "1", "username": "trendsgpx", "acct": "trendsgpx"})
+        elif url.path == "/api/v1/timelines/public":
+            min_id = int(parse_qs(url.query).get("min_id", ["0"])[0])
+            self._json([s for s in self.backfill if int(s["id"]) > min_id])
+        elif url.path == "/api/v1/streaming/public":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.end_headers()
+            self.wfile.write(b":thump\n\n")
+            for status in self.events:
+                self.wfile.write(
+                    f"event: update\ndata: {json.dumps(status)}\n\n".encode()
+                )
+            self.wfile.flush()
+        else:
+            self._json({"error": "not found"}, status=404)
+
+
+class _MemoryStore:
+    """Persistencia en memoria para inspeccionar los batches"""
+
+    def __init__(self, checkpoint: str | None = None):
+        self.checkpoints: Dict[str, str] = {}
+        if checkpoint:
+            self.checkpoints["mastodon:public"] = checkpoint
+        self.batches: List[List[Dict[str, Any]]] = []
+
+    def load_checkpoint(self, stream_key: str) -> str | None:
+        return self.checkpoints.get(stream_key)
+
+    def save_batch(self, plataforma, stream_key, items, last_id):
+        self.batches.append(items)
+        self.checkpoints[stream_key] = last_id
+        return {"received": len(items)}
+
+
+@pytest.fixture
+def fake_mastodon():
+    """Levanta un servidor Mastodon falso en un puerto local libre"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeMastodonHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+
+    server.shutdown()
+    server.server_close()
+
+
+class TestMastodonStreamConsumer:
+    """Tests para MastodonStreamConsumer"""
+
+    def test_backfill_and_stream_in_micro_batches(self, fake_mastodon):
+        """Test completa desde el checkpoint, consume el stream y avanza el checkpoint"""
+        _FakeMastodonHandler.backfill = [_status(101, "perdido durante la desconexión")]
+        _FakeMastodonHandler.events = [
+            _status(102, "reforma a la salud"),
+            _status(103, "debate sobre la reforma"),
+            _status(104, "marcha en el centro"),
+        ]
+        store = _MemoryStore(checkpoint="100")
+        consumer = MastodonStreamConsumer(
+            collector=MastodonCollector(access_token="token", instance_url=fake_mastodon),
+            hashtags=[],
+            store=store,
+            batch_size=2,
+        )
+
+        consumer.run_once("public")
+
+        saved = [item["plataforma_id"] for batch in store.batches for item in batch]
+        assert saved == ["101", "102", "103", "104"]
+        assert all(len(batch) <= 2 for batch in store.batches)
+        assert store.checkpoints["mastodon:public"] == "104"
+        assert store.batches[0][0]["descripcion"] == "perdido durante la desconexión"
+
+    def test_without_checkpoint_skips_backfill(self, fake_mastodon):
+        """Test sin historial no se recupera contenido antiguo"""
+        _FakeMastodonHandler.backfill = [_status(50, "contenido antiguo")]
+        _FakeMastodonHandler.events = [_status(60, "contenido en vivo")]
+        store = _MemoryStore()
+        consumer = MastodonStreamConsumer(
+            collector=MastodonCollector(access_token="token", instance_url=fake_mastodon),
+            hashtags=[],
+            store=store,
+        )
+
+        consumer.run_once("public")
+
+        saved = [item["plataforma_id"] for batch in store.batches for item in batch]
+        assert saved == ["60"]
@@ -0,0 +1,31 @@
+"""
+Tests para las descargas parciales (HTTP Range)
+"""
+
+import pytest
+
+from src.api.ranges import RangeNotSatisfiable, parse_range
+
+
+class TestParseRange:
+    """Tests para parse_range"""
+
+    def test_supported_forms(self):
+        """Test inicio-fin, inicio abierto y sufijo"""
+        assert parse_range("bytes=0-99", 1000) == (0, 99)
+        assert parse_range("bytes=500-", 1000) == (500, 999)
+        assert parse_range("bytes=-100", 1000) == (900, 999)
+        assert parse_range("bytes=900-5000", 1000) == (900, 999)
+
+    def test_full_file_when_absent_or_unsupported(self):
+        """Test sin Range, rangos múltiples u otra unidad se responde completo"""
+        assert parse_range(None, 1000) is None
+        assert parse_range("bytes=0-1,5-9", 1000) is None
+        assert parse_range("items=0-1", 1000) is None
+
+    def test_unsatisfiable(self):
+        """Test un rango fuera del archivo es un error"""
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=1000-", 1000)
+        with pytest.raises(RangeNotSatisfiable):
+            parse_range("bytes=20-10", 1000)
@@ -0,0 +1,94 @@
+"""
+Tests para el consumidor de submissions de Reddit
+"""
+
+from types import SimpleNamespace
+
+from src.collectors.reddit_stream import RedditStreamConsumer, fullname_order
+
+
+class _FakeSubreddit:
+    """Subreddit con un stream finito de submissions"""
+
+    def __init__(self, items):
+        self.items = items
+        self.stream_options = None
+        self.stream = SimpleNamespace(submissions=self._submissions)
+
+    def _submissions(self, **options):
+        self.stream_options = options
+        yield from self.items
+
+
+class _MemoryStore:
+    """Persistencia en memoria para inspeccionar los batches"""
+
+    def __init__(self, checkpoint=None):
+        self.checkpoint = checkpoint
+        self.batches = []
+
+    def load_checkpoint(self, stream_key):
+        return self.checkpoint
+
+    def save_batch(self, plataforma, stream_key, items, last_id):
+        self.batches.append(items)
+        self.checkpoint = last_id
+        return {"received": len(items)}
+
+
+def _submission(base36_id: str):
+    return SimpleNamespace(id=base36_id, fullname=f"t3_{base36_id}")
+
+
+def _consumer(items, store, **kwargs):
+    subreddit = _FakeSubreddit(items)
+    collector = SimpleNamespace(
+        reddit=SimpleNamespace(subreddit=lambda name: subreddit),
+        rate_limiter=SimpleNamespace(acquire=lambda: None),
+        _parse_post=lambda s: {"plataforma_id": s.id},
+    )
+    consumer = RedditStreamConsumer(
+        collector=collector, subreddits=["mexico", "colombia"], store=store, **kwargs
+    )
+    return consumer, subreddit
+
+
+class TestRedditStreamConsumer:
+    """Tests para RedditStreamConsumer"""
+
+    def test_fullname_order(self):
+        """Test los fullnames se ordenan por su ID en base 36"""
+        assert fullname_order("t3_1a") < fullname_order("t3_1b") < fullname_order("t3_10a")
+
+    def test_resumes_after_checkpoint_in_micro_batches(self):
+        """Test descarta posts ya guardados, agrupa en batches y avanza el checkpoint"""
+        items = [
+            _submission("1x"),
+            _submission("1y"),
+            None,
+            _submission("1z"),
+            _submission("20"),
+            _submission("21"),
+        ]
+        store = _MemoryStore(checkpoint="t3_1y")
+        consumer, subreddit = _consumer(items, store, batch_size=2)
+
+        received = consumer.run_once()
+
+        assert subreddit.stream_options["continue_after_id"] == "t3_1y"
+        assert received == 3
+        assert [[i["plataforma_id"] for i in b] for b in store.batches] == [
+            ["1z", "20"],
+            ["21"],
+        ]
+        assert store.checkpoint == "t3_21"
+
+    def test_without_checkpoint_keeps_initial_posts(self):
+        """Test sin historial se guardan los posts del primer ciclo"""
+        store = _MemoryStore()
+        consumer, subreddit = _consumer([_submission("a1"), _submission("a2")], store)
+
+        consumer.run_once()
+
+        assert "continue_after_id" not in subreddit.stream_options
+        assert store.checkpoint == "t3_a2"
@@ -0,0 +1,55 @@
+"""
+Tests para el ruteo de lecturas a réplicas
+"""
+
+import asyncio
+from typing import Dict
+
+from src.models.routing import ReplicaRouter
+
+
+class _FakeRouter(ReplicaRouter):
+    """Router con retrasos fijos por réplica en lugar de consultas"""
+
+    def __init__(self, lags: Dict[str, float | None], **kwargs):
+        super().__init__(list(lags), **kwargs)
+        self.lags = lags
+        self.checks = 0
+
+    async def lag_seconds(self, engine: str) -> float:
+        self.checks += 1
+        if self.lags[engine] is None:
+            raise ConnectionError("réplica caída")
+        return self.lags[engine]
+
+
+class TestReplicaRouter:
+    """Tests para ReplicaRouter"""
+
+    def test_round_robin_skips_lagging_and_down_replicas(self):
+        """Test solo se eligen réplicas al día, alternando entre ellas"""
+        router = _FakeRouter(
+            {"r1": 0.5, "r2": 120.0, "r3": None, "r4": 2.0},
+            max_lag_seconds=30,
+            check_seconds=60,
+        )
+
+        picks = [asyncio.run(router.pick()) for _ in range(4)]
+
+        assert picks == ["r1", "r4", "r1", "r4"]
+
+    def test_falls_back_to_primary(self):
+        """Test sin réplicas disponibles (o sin configurar) se usa el primario"""
+        router = _FakeRouter({"r1": 300.0}, max_lag_seconds=30, check_seconds=60)
+
+        assert asyncio.run(router.pick()) is None
+        assert asyncio.run(_FakeRouter({}, max_lag_seconds=30, check_seconds=60).pick()) is None
+
+    def test_lag_is_checked_once_per_interval(self):
+        """Test el retraso se cachea durante check_seconds"""
+        router = _FakeRouter({"r1": 0.0}, max_lag_seconds=30, check_seconds=60)
+
+        for _ in range(5):
+            asyncio.run(router.pick())
+
+        assert router.checks == 1
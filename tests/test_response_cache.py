@@ -0,0 +1,131 @@
+"""
+Tests para la caché de respuestas de la API
+"""
+
+import asyncio
+from typing import Annotated, Any, Dict, List
+
+import pytest
+from fastapi import Depends
+
+from src.api.cache import cached_response, etag_matches
+from src.models.base import get_async_db
+from src.models.routing import get_read_db
+from src.services.response_cache import ResponseCache
+
+
+class _FakeRedis:
+    """Redis en memoria (sin TTL) con la API síncrona y asíncrona necesaria"""
+
+    def __init__(self):
+        self.data: Dict[str, Any] = {}
+
+    def incr(self, key: str) -> int:
+        self.data[key] = int(self.data.get(key, 0)) + 1
+        return self.data[key]
+
+
+class _FakeAsyncRedis:
+    def __init__(self, store: _FakeRedis):
+        self.data = store.data
+
+    async def get(self, key: str) -> Any:
+        return self.data.get(key)
+
+    async def mget(self, keys: List[str]) -> List[Any]:
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key: str, value: Any, nx: bool = False, ex: int | None = None) -> bool:
+        if nx and key in self.data:
+            return False
+        self.data[key] = value
+        return True
+
+    async def eval(self, script: str, numkeys: int, key: str, token: str) -> int:
+        if self.data.get(key) == token:
+            del self.data[key]
+            return 1
+        return 0
+
+
+def _cache() -> ResponseCache:
+    store = _FakeRedis()
+    return ResponseCache(client=store, async_client=_FakeAsyncRedis(store))
+
+
+class TestResponseCache:
+    """Tests para ResponseCache"""
+
+    def test_key_ignores_param_order_case_and_none(self):
+        """Test parámetros equivalentes comparten clave"""
+        cache = _cache()
+
+        a = cache.key("tendencias", {"plataforma": "Reddit", "limit": 50, "ubicacion": None}, 3)
+        b = cache.key("tendencias", {"limit": 50, "plataforma": "reddit "}, 3)
+
+        assert a == b
+        assert a != cache.key("tendencias", {"limit": 50, "plataforma": "reddit"}, 4)
+
+    def test_concurrent_misses_compute_once(self):
+        """Test requests simultáneas a una clave vacía calculan una sola vez"""
+        cache = _cache()
+        calls = []
+
+        async def compute() -> bytes:
+            calls.append(1)
+            await asyncio.sleep(0.1)
+            return b'{"total": 1}'
+
+        async def run() -> List[bytes]:
+            return await asyncio.gather(
+                *(cache.get_or_compute("tendencias", {"limit": 50}, compute) for _ in range(5))
+            )
+
+        assert asyncio.run(run()) == [b'{"total": 1}'] * 5
+        assert len(calls) == 1
+        assert not any(key.endswith(":lock") for key in cache.client.data)
+
+    def test_bump_invalidates_previous_generation(self):
+        """Test un análisis nuevo invalida las respuestas guardadas"""
+        cache = _cache()
+        bodies = iter([b"antes", b"despues"])
+
+        async def compute() -> bytes:
+            return next(bodies)
+
+        def get() -> bytes:
+            return asyncio.run(cache.get_or_compute("tendencias", {}, compute))
+
+        assert get() == b"antes"
+        assert get() == b"antes"
+        cache.bump()
+        assert get() == b"despues"
+
+    def test_etag_depends_on_endpoint_params_and_generation(self):
+        """Test el ETag cambia con el endpoint, los parámetros o la generación"""
+        cache = _cache()
+        etag = cache.etag("tendencias", {"limit": 50, "plataforma": "reddit"}, 2)
+
+        assert etag == cache.etag("tendencias", {"plataforma": "Reddit", "limit": 50}, 2)
+        assert etag != cache.etag("tendencias:agregadas", {"limit": 50, "plataforma": "reddit"}, 2)
+        assert etag != cache.etag("tendencias", {"limit": 50, "plataforma": "reddit"}, 3)
+        # Débil: la misma respuesta puede enviarse con distintas codificaciones
+        assert etag.startswith('W/"')
+        assert etag_matches(f'{etag}, "otro"', etag)
+        assert etag_matches(etag.removeprefix("W/"), etag)
+        assert etag_matches("*", etag)
+        assert not etag_matches(None, etag)
+
+    def test_cached_endpoints_must_read_primary(self):
+        """Test un fallo no puede guardar filas de una réplica atrasada bajo una generación nueva"""
+
+        async def desde_replica(db: Annotated[Any, Depends(get_read_db)]) -> bytes:
+            return b"[]"
+
+        async def desde_primario(db: Annotated[Any, Depends(get_async_db)]) -> bytes:
+            return b"[]"
+
+        with pytest.raises(ValueError, match="primario"):
+            cached_response("tendencias")(desde_replica)
+
+        assert cached_response("tendencias")(desde_primario).__wrapped__ is desde_primario
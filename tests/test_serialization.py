@@ -0,0 +1,111 @@
+"""
+Tests para la serialización rápida de respuestas
+"""
+
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+from src.api.serialization import dump_json, tendencia_item
+from src.schemas.tendencia import (
+    TendenciaEdad,
+    TendenciaJerarquicaResponse,
+    TendenciaListResponse,
+    TendenciaResponse,
+)
+
+
+class TestDumpJson:
+    """Tests para dump_json"""
+
+    def test_list_payload_matches_pydantic(self):
+        """Test el JSON de las filas del listado es idéntico al del modelo de respuesta"""
+        tendencia = SimpleNamespace(
+            id=uuid4(),
+            tema_id=uuid4(),
+            plataforma="reddit",
+            ubicacion="México",
+            edad_rango="25-34",
+            genero="Desconocido",
+            volumen_menciones=120,
+            tasa_crecimiento=0.8,
+            sentimiento_promedio=-0.2,
+            es_tendencia=True,
+            fecha_hora=datetime(2024, 5, 1, 10, 0, tzinfo=timezone.utc),
+            engagement_total=3400,
+            autores_unicos=85,
+            puntuacion=12.5,
+            puntuacion_z=2.1,
+        )
+        tema = SimpleNamespace(id=tendencia.tema_id, tema_nombre="elecciones", keywords=["ine"])
+        items = [tendencia_item(tendencia, tema, True), tendencia_item(tendencia, None, None)]
+        payload = {"total": 2, "items": items}
+
+        assert list(items[0]) == list(TendenciaResponse.model_fields)
+        assert dump_json(payload) == TendenciaListResponse(**payload).model_dump_json().encode()
+
+    def test_hierarchy_payload_validates_against_schema(self):
+        """Test la jerarquía armada con dicts respeta los modelos tipados"""
+        payload = {
+            "total_tendencias": 1,
+            "plataformas": [
+                {
+                    "plataforma": "youtube",
+                    "ubicaciones": [
+                        {
+                            "ubicacion": "Chile",
+                            "edades": [
+                                {
+                                    "edad_rango": "18-24",
+                                    "generos": [
+                                        {
+                                            "genero": "F",
+                                            "temas": [
+                                                {
+                                                    "tema_nombre": "música",
+                                                    "volumen": 40,
+                                                    "crecimiento": Decimal("1.5"),
+                                                    "sentimiento": 0.3,
+                                                    "keywords": [],
+                                                }
+                                            ],
+                                        }
+                                    ],
+                                }
+                            ],
+                        }
+                    ],
+                }
+            ],
+        }
+
+        response = TendenciaJerarquicaResponse.model_validate_json(dump_json(payload))
+
+        tema = response.plataformas[0].ubicaciones[0].edades[0].generos[0].temas[0]
+        assert tema.crecimiento == 1.5
+
+    def test_hierarchy_accepts_null_segments_and_metrics(self):
+        """Test segmentos y métricas nulos (columnas nullable) validan contra el schema"""
+        segmento = {
+            "edad_rango": None,
+            "generos": [
+                {
+                    "genero": None,
+                    "temas": [
+                        {
+                            "tema_nombre": "música",
+                            "volumen": 3,
+                            "crecimiento": None,
+                            "sentimiento": None,
+                        }
+                    ],
+                }
+            ],
+        }
+
+        edad = TendenciaEdad.model_validate_json(dump_json(segmento))
+
+        tema = edad.generos[0].temas[0]
+        assert (edad.edad_rango, edad.generos[0].genero) == (None, None)
+        assert (tema.crecimiento, tema.sentimiento) == (None, None)
@@ -0,0 +1,21 @@
+"""
+Tests para los índices de Count-Min Sketch
+"""
+
+from src.utils.sketches import SketchIndexer
+
+
+class TestSketchIndexer:
+    """Tests para SketchIndexer"""
+
+    def test_indexes_are_stable(self):
+        """Test los índices no dependen del proceso ni de la instancia"""
+        sketch = SketchIndexer(width=64, depth=3)
+
+        indexes = sketch.indexes("elecciones")
+
+        # blake2b no usa la semilla aleatoria de hash() de cada proceso
+        assert indexes == [56, 127, 134]
+        assert indexes == SketchIndexer(width=64, depth=3).indexes("elecciones")
+        # Un índice por fila dentro de la tabla aplanada
+        assert [index // 64 for index in indexes] == [0, 1, 2]
@@ -0,0 +1,75 @@
+"""
+Tests del buffer de micro-batches de streaming
+"""
+
+from typing import List
+import threading
+
+from src.collectors.stream_store import MicroBatchBuffer
+
+
+class _FakeStore:
+    """Persistencia que puede fallar o bloquearse en el primer guardado"""
+
+    def __init__(self, fail: bool = False, block_first: bool = False):
+        self.fail = fail
+        self.block_first = block_first
+        self.started = threading.Event()
+        self.release = threading.Event()
+        self.checkpoints: List[str] = []
+        self.calls = 0
+
+    def save_batch(self, plataforma, stream_key, items, last_id):
+        self.calls += 1
+        if self.block_first and self.calls == 1:
+            self.started.set()
+            self.release.wait(timeout=5)
+        if self.fail:
+            raise RuntimeError("base de datos no disponible")
+        self.checkpoints.append(last_id)
+        return {"received": len(items)}
+
+
+def _buffer(store, **kwargs) -> MicroBatchBuffer:
+    return MicroBatchBuffer("mastodon", store, flush_seconds=60, **kwargs)
+
+
+class TestMicroBatchBuffer:
+    """Tests de límite del buffer y orden de checkpoints"""
+
+    def test_failed_flushes_keep_buffer_bounded(self):
+        """Si el guardado falla, se conservan solo los elementos más recientes"""
+        store = _FakeStore(fail=True)
+        buffer = _buffer(store, batch_size=2, max_items=3)
+
+        for i in range(1, 8):
+            buffer.add("mastodon:public", {"plataforma_id": str(i)}, str(i))
+
+        items = buffer._items["mastodon:public"]
+        assert [item["plataforma_id"] for item in items] == ["5", "6", "7"]
+        assert buffer.last_id("mastodon:public") == "7"
+
+    def test_concurrent_flushes_commit_checkpoints_in_order(self):
+        """Un flush posterior espera a que termine el anterior"""
+        store = _FakeStore(block_first=True)
+        buffer = _buffer(store, batch_size=100, max_items=100)
+
+        buffer.add("mastodon:public", {"plataforma_id": "1"}, "1")
+        first = threading.Thread(target=buffer.flush, args=("mastodon:public",))
+        first.start()
+        assert store.started.wait(timeout=5)
+
+        buffer.add("mastodon:public", {"plataforma_id": "2"}, "2")
+        second = threading.Thread(target=buffer.flush, args=("mastodon:public",))
+        second.start()
+        second.join(timeout=0.2)
+
+        # El segundo flush no guarda mientras el primero sigue en curso
+        assert second.is_alive()
+        assert store.calls == 1
+
+        store.release.set()
+        first.join(timeout=5)
+        second.join(timeout=5)
+
+        assert store.checkpoints == ["1", "2"]
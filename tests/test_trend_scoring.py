@@ -0,0 +1,68 @@
+"""
+Tests para la puntuación vectorizada de tendencias
+"""
+
+import time
+
+import numpy as np
+
+from src.services.trend_scoring import SegmentFeatures, TrendScorer
+
+
+def _features(mentions, previous, engagement, sentiment=None, authors=None) -> SegmentFeatures:
+    """Crea features para segmentos sintéticos"""
+    n = len(mentions)
+    return SegmentFeatures(
+        keys=[(f"tema{i}", "youtube", "MX", "18-24", "unknown") for i in range(n)],
+        tema_ids=list(range(n)),
+        mentions=np.asarray(mentions, dtype=np.float64),
+        previous_mentions=np.asarray(previous, dtype=np.float64),
+        engagement=np.asarray(engagement, dtype=np.float64),
+        sentiment=np.asarray(sentiment if sentiment is not None else [0.0] * n),
+        authors=np.asarray(authors if authors is not None else mentions, dtype=np.float64),
+    )
+
+
+class TestTrendScorer:
+    """Tests para TrendScorer"""
+
+    def test_growth_matches_count_based_convention(self):
+        """Test crecimiento relativo y 1.0 para segmentos sin historial"""
+        growth = TrendScorer.growth(np.array([15.0, 5.0, 0.0]), np.array([10.0, 0.0, 0.0]))
+
+        assert np.allclose(growth, [0.5, 1.0, 0.0])
+
+    def test_engagement_breaks_ties_between_equal_mentions(self):
+        """Test diez posts con un millón de vistas superan a diez sin vistas"""
+        scores = TrendScorer().score(_features([10, 10], [10, 10], [1_000_000, 0]))
+
+        assert scores.score[0] > scores.score[1]
+        assert scores.zscore[0] > 0 > scores.zscore[1]
+
+    def test_high_zscore_marks_trend_without_growth(self):
+        """Test un segmento destacado es tendencia aunque su volumen no crezca"""
+        mentions = [20] + [20] * 30
+        engagement = [5_000_000] + [10] * 30
+        scores = TrendScorer().score(_features(mentions, mentions, engagement))
+
+        assert scores.es_tendencia[0]
+        assert not scores.es_tendencia[1:].any()
+
+    def test_scores_tens_of_thousands_of_segments_quickly(self):
+        """Test puntúa 50.000 segmentos en menos de un segundo"""
+        rng = np.random.default_rng(0)
+        n = 50_000
+        features = _features(
+            rng.integers(0, 500, n),
+            rng.integers(0, 500, n),
+            rng.integers(0, 10_000_000, n),
+            rng.uniform(-1, 1, n),
+            rng.integers(0, 200, n),
+        )
+
+        started = time.perf_counter()
+        scores = TrendScorer().score(features)
+        elapsed = time.perf_counter() - started
+
+        assert scores.score.shape == (n,)
+        assert elapsed < 1.0
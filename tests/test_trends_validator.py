@@ -0,0 +1,119 @@
+"""
+Tests para la validación con Google Trends por lotes
+"""
+
+from typing import Any, Dict, List
+
+from src.services.trends_validator import TrendsValidator
+
+
+class _Series:
+    def __init__(self, values: List[int]):
+        self.values = values
+
+    def tolist(self) -> List[int]:
+        return list(self.values)
+
+
+class _Frame:
+    """Subconjunto del DataFrame de `interest_over_time`"""
+
+    def __init__(self, data: Dict[str, List[int]]):
+        self.data = data
+        self.empty = not data
+        self.columns = list(data) + (["isPartial"] if data else [])
+
+    def __getitem__(self, term: str) -> _Series:
+        return _Series(self.data[term])
+
+
+class _FakeTrendReq:
+    """TrendReq que registra los payloads y retorna series fijas"""
+
+    def __init__(self, series: Dict[str, List[int]]):
+        self.series = series
+        self.payloads: List[List[str]] = []
+
+    def build_payload(self, kw_list: List[str], **kwargs: Any) -> None:
+        assert len(kw_list) <= 5
+        self.payloads.append(list(kw_list))
+
+    def interest_over_time(self) -> _Frame:
+        terms = self.payloads[-1]
+        return _Frame({term: self.series[term] for term in terms if term in self.series})
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values: Dict[str, str] = {}
+
+    def mget(self, keys: List[str]) -> List[str | None]:
+        return [self.values.get(key) for key in keys]
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self.values[key] = value
+
+    def pipeline(self, transaction: bool = True) -> "_FakeRedis":
+        return self
+
+    def execute(self) -> List[Any]:
+        return []
+
+
+class _NoLimit:
+    def __init__(self):
+        self.calls = 0
+
+    def acquire(self) -> bool:
+        self.calls += 1
+        return True
+
+
+def _validator(fake: _FakeTrendReq, cache: _FakeRedis, limiter: _NoLimit) -> TrendsValidator:
+    return TrendsValidator(client_factory=lambda: fake, client=cache, rate_limiter=limiter)
+
+
+class TestTrendsValidator:
+    """Tests para TrendsValidator"""
+
+    def test_deduplicates_and_packs_terms(self):
+        """Test keywords repetidas entre segmentos se consultan una vez, 5 por request"""
+        terms = [f"kw{i}" for i in range(12)]
+        fake = _FakeTrendReq({term: [10, 10, 10, 10, 10, 10, 40] for term in terms})
+        limiter = _NoLimit()
+
+        result = _validator(fake, _FakeRedis(), limiter).fetch(terms + terms[:6])
+
+        assert sorted(result) == sorted(terms)
+        assert [len(payload) for payload in fake.payloads] == [5, 5, 2]
+        assert limiter.calls == 3
+
+    def test_cached_terms_are_not_requested(self):
+        """Test la caché evita volver a consultar un término"""
+        fake = _FakeTrendReq({"salud": [50] * 7, "ia": [1, 1, 1, 1, 1, 1, 30]})
+        cache = _FakeRedis()
+
+        _validator(fake, cache, _NoLimit()).fetch(["salud"])
+        result = _validator(fake, cache, _NoLimit()).fetch(["salud", "ia"])
+
+        assert fake.payloads == [["salud"], ["ia"]]
+        assert set(result) == {"salud", "ia"}
+
+    def test_failed_request_skips_terms(self):
+        """Test un error de la API deja los términos para la próxima ejecución"""
+
+        class _Failing(_FakeTrendReq):
+            def interest_over_time(self) -> _Frame:
+                raise RuntimeError("429")
+
+        result = _validator(_Failing({}), _FakeRedis(), _NoLimit()).fetch(["salud"])
+
+        assert result == {}
+
+    def test_rise_is_scale_invariant(self):
+        """Test la subida no depende de la normalización de la request"""
+        low = TrendsValidator.summarize([1, 1, 1, 1, 1, 1, 4])
+        high = TrendsValidator.summarize([25, 25, 25, 25, 25, 25, 100])
+
+        assert TrendsValidator.rise(low) == TrendsValidator.rise(high) > 1.5
+        assert TrendsValidator.rise(TrendsValidator.summarize([])) == 0.0
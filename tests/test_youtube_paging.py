@@ -0,0 +1,188 @@
+"""
+Tests para la paginación y las requests batch de YouTube
+"""
+
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+
+from src.collectors.youtube_collector import YouTubeCollector
+
+
+class _Request:
+    """Request diferida de googleapiclient"""
+
+    def __init__(self, response: Dict[str, Any], params: Dict[str, Any] | None = None):
+        self.response = response
+        self.params = params or {}
+
+    def execute(self) -> Dict[str, Any]:
+        return self.response
+
+
+class _Batch:
+    """Request batch que registra cuántas sub-requests viajan juntas"""
+
+    def __init__(self, client: "_FakeYouTube", callback):
+        self.client = client
+        self.callback = callback
+        self.requests: List[tuple] = []
+
+    def add(self, request: _Request, request_id: str):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        self.client.batches.append(len(self.requests))
+        for request_id, request in self.requests:
+            self.callback(request_id, request.execute(), None)
+
+
+class _FakeYouTube:
+    """Cliente falso con búsquedas paginadas y registro de requests"""
+
+    def __init__(self, total: int, page_size: int = 50):
+        # Videos ordenados del más reciente al más antiguo
+        newest = datetime(2026, 10, 19, 12, 0, 0)
+        self.items = [
+            {
+                "id": {"kind": "youtube#video", "videoId": f"v{n}"},
+                "snippet": {
+                    "publishedAt": (newest - timedelta(minutes=n)).strftime(
+                        "%Y-%m-%dT%H:%M:%SZ"
+                    )
+                },
+            }
+            for n in range(total)
+        ]
+        self.page_size = page_size
+        self.search_calls: List[Dict[str, Any]] = []
+        self.videos_calls: List[List[str]] = []
+        self.batches: List[int] = []
+
+    def search(self):
+        return self
+
+    def videos(self):
+        return self
+
+    def commentThreads(self):
+        return self
+
+    def new_batch_http_request(self, callback=None):
+        return _Batch(self, callback)
+
+    def _comments_page(self, video_id: str, page: int) -> Dict[str, Any]:
+        items = [
+            {
+                "snippet": {
+                    "topLevelComment": {
+                        "id": f"{video_id}-c{page}-{n}",
+                        "snippet": {"textDisplay": f"comentario {n}"},
+                    }
+                }
+            }
+            for n in range(2)
+        ]
+        # El video v0 tiene 2 páginas de comentarios, el resto solo una
+        next_token = {"nextPageToken": str(page + 1)} if video_id == "v0" and page == 0 else {}
+        return {"items": items, **next_token}
+
+    def list_next(self, request: _Request, response: Dict[str, Any]):
+        if "nextPageToken" not in response:
+            return None
+        video_id = request.params["videoId"]
+        page = int(response["nextPageToken"])
+        return _Request(self._comments_page(video_id, page), request.params)
+
+    def list(self, **params):
+        if "videoId" in params:
+            return _Request(self._comments_page(params["videoId"], 0), params)
+
+        if "q" in params:
+            self.search_calls.append(params)
+            start = int(params.get("pageToken", 0))
+            end = start + params["maxResults"]
+            response = {"items": self.items[start:end]}
+            if end < len(self.items):
+                response["nextPageToken"] = str(end)
+            return _Request(response)
+
+        ids = params["id"].split(",")
+        self.videos_calls.append(ids)
+        return _Request(
+            {"items": [{"id": video_id, "snippet": {}, "statistics": {}} for video_id in ids]}
+        )
+
+
+class _NoLimit:
+    def acquire(self):
+        pass
+
+
+def _collector(fake: _FakeYouTube) -> YouTubeCollector:
+    collector = YouTubeCollector(api_key="")
+    collector.youtube = fake
+    collector.rate_limiter = _NoLimit()
+    return collector
+
+
+class TestYouTubePaging:
+    """Tests para YouTubeCollector.search_videos"""
+
+    def test_follows_page_tokens_with_batched_details(self):
+        """Test recorre páginas y pide los detalles en una sola request batch"""
+        fake = _FakeYouTube(total=180)
+        collector = _collector(fake)
+
+        videos = collector.search_videos(["reforma"], max_results=120, max_units=1000)
+
+        assert len(videos) == 120
+        assert [len(ids) for ids in fake.videos_calls] == [50, 50, 20]
+        assert fake.batches == [3]
+        assert [video["plataforma_id"] for video in videos] == [f"v{n}" for n in range(120)]
+        assert [call.get("pageToken") for call in fake.search_calls] == [None, "50", "100"]
+        assert fake.search_calls[-1]["maxResults"] == 20
+        assert collector.last_units_used == 3 * 100 + 3
+
+    def test_stops_at_units_budget(self):
+        """Test no pide una página que excedería el presupuesto"""
+        fake = _FakeYouTube(total=500)
+        collector = _collector(fake)
+
+        videos = collector.search_videos(["reforma"], max_results=500, max_units=250)
+
+        assert len(fake.search_calls) == 2
+        assert len(videos) == 100
+        assert collector.last_units_used <= 250
+
+    def test_stops_at_incremental_cursor(self):
+        """Test detiene la paginación al alcanzar contenido ya guardado"""
+        fake = _FakeYouTube(total=300)
+        cursor = fake.items[70]["snippet"]["publishedAt"]
+        collector = _collector(fake)
+
+        videos = collector.search_videos(
+            ["reforma"],
+            max_results=300,
+            published_after=datetime.strptime(cursor, "%Y-%m-%dT%H:%M:%SZ"),
+            max_units=1000,
+        )
+
+        assert len(fake.search_calls) == 2
+        assert all(call["publishedAfter"] == cursor for call in fake.search_calls)
+        assert len(videos) == 71
+
+
+class TestYouTubeBatchRequests:
+    """Tests para requests batch de comentarios"""
+
+    def test_comments_for_several_videos_share_batches(self):
+        """Test pide la misma página de todos los videos en una request batch"""
+        fake = _FakeYouTube(total=0)
+        collector = _collector(fake)
+
+        comments = collector.get_comments_for_videos(["v0", "v1", "v2"], max_results=10)
+
+        assert fake.batches == [3, 1]
+        assert len(comments["v0"]) == 4
+        assert len(comments["v1"]) == len(comments["v2"]) == 2
+        assert comments["v0"][2]["comment_id"] == "v0-c1-0"